@@ -1,107 +1,58 @@
 # Dashboard Analisis Saham dengan Streamlit
 # Aplikasi untuk menganalisis data saham secara real-time
+#
+# Jalankan dengan: streamlit run App/app.py
 
+import time
+
+import numpy as np
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
-import yfinance as yf
-from datetime import datetime, timedelta
-import pytz
-import ta
-
-##########################################################################################
-## BAGIAN 1: Fungsi-fungsi untuk Mengambil dan Memproses Data Saham ##
-##########################################################################################
-
-# Mengambil data saham dari Yahoo Finance
-def ambil_data_saham(simbol, periode, interval):
-    """
-    Fungsi untuk mengunduh data historis saham
-    Parameter:
-        simbol: kode ticker saham
-        periode: rentang waktu data
-        interval: interval waktu per data point
-    """
-    tanggal_akhir = datetime.now()
-    
-    if periode == '1minggu':
-        tanggal_awal = tanggal_akhir - timedelta(days=7)
-        data_saham = yf.download(simbol, start=tanggal_awal, end=tanggal_akhir, interval=interval)
-    else:
-        data_saham = yf.download(simbol, period=periode, interval=interval)
-    
-    return data_saham
-
-# Memproses dan membersihkan data
-def olah_data(df):
-    """
-    Mengkonversi data ke timezone yang sesuai dan format yang benar
-    """
-    # Flatten multi-level columns if they exist
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
-    
-    # Ensure we have the right columns
-    df = df[['Open', 'High', 'Low', 'Close', 'Volume']].copy()
-    
-    if df.index.tzinfo is None:
-        df.index = df.index.tz_localize('UTC')
-    
-    df.index = df.index.tz_convert('US/Eastern')
-    df.reset_index(inplace=True)
-    
-    # Rename kolom ke Bahasa Indonesia
-    df.rename(columns={
-        'Date': 'Tanggal',
-        'Datetime': 'Tanggal',
-        'Open': 'Pembukaan',
-        'High': 'Tertinggi',
-        'Low': 'Terendah',
-        'Close': 'Penutupan',
-        'Volume': 'Volume'
-    }, inplace=True)
-    
-    return df
-
-# Menghitung metrik penting
-def hitung_metrik(df):
-    """
-    Menghitung statistik dasar dari data saham
-    """
-    harga_terakhir = df['Penutupan'].iloc[-1]
-    harga_awal = df['Penutupan'].iloc[0]
-    perubahan = harga_terakhir - harga_awal
-    perubahan_persen = (perubahan / harga_awal) * 100
-    harga_tertinggi = df['Tertinggi'].max()
-    harga_terendah = df['Terendah'].min()
-    total_volume = df['Volume'].sum()
-    
-    return harga_terakhir, perubahan, perubahan_persen, harga_tertinggi, harga_terendah, total_volume
-
-# Menambahkan indikator teknikal
-def tambah_indikator(df):
-    """
-    Menambahkan indikator teknikal seperti SMA dan EMA
-    """
-    # Make sure we're working with a clean copy
-    df = df.copy()
-    
-    # Ensure Penutupan column is a Series, not DataFrame
-    harga_penutupan = df['Penutupan'].squeeze()
-    
-    # Simple Moving Average
-    df['SMA_20'] = ta.trend.sma_indicator(harga_penutupan, window=20)
-    df['SMA_50'] = ta.trend.sma_indicator(harga_penutupan, window=50)
-    
-    # Exponential Moving Average
-    df['EMA_20'] = ta.trend.ema_indicator(harga_penutupan, window=20)
-    df['EMA_50'] = ta.trend.ema_indicator(harga_penutupan, window=50)
-    
-    # RSI
-    df['RSI'] = ta.momentum.rsi(harga_penutupan, window=14)
-    
-    return df
+
+from saham import kurs, pengambilan
+from saham.grafik import (
+    buat_grafik_ekuitas,
+    buat_grafik_harga,
+    buat_grafik_perbandingan,
+    buat_grafik_ringan,
+    buat_grafik_rsi,
+    buat_grafik_sapuan
+)
+from saham.indikator import PARAMETER_INDIKATOR
+from saham.kalender import batas_berlaku
+from saham.konfigurasi import (
+    DAFTAR_PANTAUAN_AWAL,
+    GRAFIK_RINGAN,
+    KURS_USD_IDR,
+    LEBAR_GRAFIK_PIKSEL,
+    PEMANASAN_AKTIF,
+    PORT_METRIK,
+    UKUR_PAYLOAD
+)
+from saham.layanan import ambil_data_olahan, lengkapi_data_olahan
+from saham.metrik import (
+    catat_cache,
+    catat_payload,
+    catat_tahap,
+    ekspor_prometheus,
+    jalankan_server_metrik,
+    ringkasan_metrik,
+    ukur_tahap
+)
+from saham.pemanasan import catat_permintaan, jalankan_pemanasan, status_pemanasan
+from saham.pemrosesan import frame_tampilan, hitung_metrik, olah_data, waktu_epoch_ns, waktu_tampilan
+from saham.pengambilan import ambil_bersamaan, ambil_data_saham
+from saham.penyaring import KONDISI_PENYARING, PERIODE_PENYARING, daftar_semesta, muat_semesta, saring_semesta
+from saham.perbandingan import TAMPILAN_PERBANDINGAN, bangun_matriks_harga, hitung_perbandingan
+from saham.rentang import bangun_indeks_rentang, cari_rentang, metrik_rentang, rentang_dari_grafik
+from saham.sapuan import GARIS_SAPUAN, METRIK_SAPUAN, sapu_parameter
+from saham.ujibalik import STRATEGI_UJI, format_statistik, uji_balik
+
+# Kurs dan daftar pantauan di-cache Streamlit, dipakai bersama oleh semua sesi
+# Argumen batas_berlaku (kalender.batas_berlaku) ikut menjadi kunci cache, jadi entri
+# berganti tepat di batas bar berikutnya selama bursa buka dan tetap dipakai saat
+# bursa tutup; ttl hanya membersihkan entri lama.
+ambil_kurs_usd_idr = st.cache_data(ttl=24 * 3600, max_entries=64)(kurs.ambil_kurs_usd_idr)
+ambil_data_watchlist = st.cache_data(ttl=24 * 3600, max_entries=64)(pengambilan.ambil_data_watchlist)
 
 ###############################################
 ## BAGIAN 2: Membuat Tampilan Dashboard ##
@@ -146,12 +97,93 @@ tipe_grafik = st.sidebar.selectbox(
     help='Pilih jenis visualisasi grafik'
 )
 
+mata_uang = st.sidebar.radio(
+    'Mata Uang Grafik & Tabel',
+    ['USD', 'IDR'],
+    horizontal=True,
+    help='IDR memakai kurs USD/IDR pada waktu setiap bar'
+)
+
 indikator_teknikal = st.sidebar.multiselect(
     'Indikator Teknikal', 
     ['SMA 20', 'SMA 50', 'EMA 20', 'EMA 50', 'RSI'],
     help='Pilih indikator yang ingin ditampilkan'
 )
 
+grafik_ringan = st.sidebar.checkbox(
+    '🪶 Grafik Ringan (WebGL)',
+    value=GRAFIK_RINGAN,
+    help='Harga, RSI dan volume dalam satu grafik WebGL dengan payload lebih kecil, cocok untuk riwayat panjang'
+)
+
+strategi_uji = st.sidebar.selectbox(
+    'Strategi Uji Balik',
+    ['Tidak Ada', *STRATEGI_UJI],
+    help='Uji strategi dari sinyal SMA/EMA/RSI pada data yang sedang ditampilkan'
+)
+if strategi_uji != 'Tidak Ada':
+    if STRATEGI_UJI[strategi_uji][0] == 'rsi':
+        batas_rsi = st.sidebar.slider('Batas RSI (beli / jual)', 5, 95, (30, 70))
+    else:
+        batas_rsi = (30, 70)
+    biaya_bps = st.sidebar.slider('Biaya Transaksi (bps)', 0, 50, 10, help='Biaya setiap kali posisi berubah')
+
+mode_tampilan = st.sidebar.radio(
+    'Mode',
+    ['📈 Satu Saham', '📊 Perbandingan', '🔎 Penyaring'],
+    help='Perbandingan: banyak saham dalam satu grafik. Penyaring: cari saham yang memenuhi kondisi teknikal'
+)
+mode_perbandingan = mode_tampilan == '📊 Perbandingan'
+mode_penyaring = mode_tampilan == '🔎 Penyaring'
+if mode_perbandingan:
+    teks_perbandingan = st.sidebar.text_area(
+        'Saham Dibandingkan',
+        'AAPL, MSFT, GOOGL, AMZN, META, NVDA, TSLA',
+        help='Pisahkan kode saham dengan koma'
+    )
+    daftar_perbandingan = list(dict.fromkeys(
+        s.strip().upper() for s in teks_perbandingan.split(',') if s.strip()
+    ))
+if mode_penyaring:
+    pilihan_semesta = {
+        **daftar_semesta(),
+        'Daftar Pantauan': tuple(st.session_state.get('daftar_pantauan', DAFTAR_PANTAUAN_AWAL).split(','))
+    }
+    nama_semesta = st.sidebar.selectbox('Semesta Saham', [*pilihan_semesta, 'Kustom'])
+    if nama_semesta == 'Kustom':
+        teks_semesta = st.sidebar.text_area('Daftar Saham', DAFTAR_PANTAUAN_AWAL, help='Pisahkan kode saham dengan koma')
+        semesta_dipilih = teks_semesta.split(',')
+    else:
+        semesta_dipilih = pilihan_semesta[nama_semesta]
+    daftar_penyaring = tuple(dict.fromkeys(s.strip().upper() for s in semesta_dipilih if s.strip()))
+    periode_penyaring = st.sidebar.selectbox(
+        'Periode Penyaring',
+        PERIODE_PENYARING,
+        index=PERIODE_PENYARING.index('1y'),
+        help='Data harian dari database lokal'
+    )
+    kondisi_penyaring = st.sidebar.multiselect(
+        'Kondisi',
+        list(KONDISI_PENYARING),
+        default=['RSI < 30 (jenuh jual)']
+    )
+
+mode_live = st.sidebar.checkbox(
+    '⚡ Mode Live',
+    help=(
+        'Data diperiksa berkala. Jika ada bar baru, seluruh halaman digambar ulang dari frame '
+        'bersama yang hanya dilanjutkan dengan bar baru. Daftar pantauan diperbarui tersendiri.'
+    )
+)
+detik_live = None
+if mode_live:
+    detik_live = st.sidebar.select_slider('Interval Pembaruan (detik)', [5, 15, 30, 60], value=30)
+
+panel_debug = st.sidebar.checkbox(
+    '🛠️ Panel Debug',
+    help='Tampilkan waktu setiap tahap, ukuran payload grafik dan statistik cache'
+)
+
 # Mapping periode ke interval
 pemetaan_interval = {
     '1d': '5m',
@@ -166,164 +198,449 @@ st.sidebar.markdown('---')
 
 # 2B: AREA KONTEN UTAMA ############
 
+# Endpoint /metrics untuk Prometheus (aktif jika SAHAM_PORT_METRIK diisi)
+if PORT_METRIK:
+    jalankan_server_metrik(PORT_METRIK)
+
 # Tombol untuk memperbarui data
-if st.sidebar.button('🔄 Perbarui Data', type='primary', use_container_width=True):
+tombol_perbarui = st.sidebar.button('🔄 Perbarui Data', type='primary', use_container_width=True)
+
+# Data yang sudah dimuat disimpan di session state, sehingga perubahan tampilan
+# (tipe grafik, indikator) tidak perlu mengunduh ulang
+kunci_data = (kode_saham.strip().upper(), periode_waktu)
+hasil_tersimpan = st.session_state.get('hasil_data')
+
+# Ambil ulang hanya jika tombol ditekan atau ticker/periode berubah
+perlu_ambil_data = not mode_perbandingan and not mode_penyaring and (
+    tombol_perbarui or (hasil_tersimpan is not None and hasil_tersimpan['kunci'] != kunci_data)
+)
+
+# Mode perbandingan memakai aturan yang sama untuk daftar saham yang dibandingkan
+perbandingan_tersimpan = st.session_state.get('hasil_perbandingan')
+perlu_ambil_perbandingan = False
+if mode_perbandingan:
+    kunci_perbandingan = (tuple(daftar_perbandingan), periode_waktu)
+    perlu_ambil_perbandingan = bool(daftar_perbandingan) and (
+        tombol_perbarui
+        or (perbandingan_tersimpan is not None and perbandingan_tersimpan['kunci'] != kunci_perbandingan)
+    )
+
+# Penyaring memuat ulang semesta dengan aturan yang sama; kondisi dihitung ulang dari memori
+penyaring_tersimpan = st.session_state.get('hasil_penyaring')
+perlu_ambil_penyaring = False
+if mode_penyaring:
+    kunci_penyaring = (daftar_penyaring, periode_penyaring)
+    perlu_ambil_penyaring = bool(daftar_penyaring) and (
+        tombol_perbarui
+        or (penyaring_tersimpan is not None and penyaring_tersimpan['kunci'] != kunci_penyaring)
+    )
+
+# Daftar pantauan dibaca dari session state agar bisa diunduh bersamaan dengan data utama
+daftar_saham = [
+    s.strip().upper()
+    for s in st.session_state.get('daftar_pantauan', DAFTAR_PANTAUAN_AWAL).split(',')
+    if s.strip()
+]
+
+# Pemanasan latar belakang: daftar pantauan dan ticker populer disiapkan untuk
+# semua periode sebelum diminta (thread dibuat sekali per proses server)
+if PEMANASAN_AKTIF:
+    jalankan_pemanasan(daftar_saham, pemetaan_interval)
+if perlu_ambil_data:
+    catat_permintaan(kode_saham)
+
+# Semua unduhan yang saling lepas dijalankan bersamaan
+tugas_unduh = {
+    'kurs': (ambil_kurs_usd_idr, batas_berlaku([kurs.SIMBOL_KURS], '5m', detik_live)),
+    'watchlist': (ambil_data_watchlist, tuple(daftar_saham), '1d', '5m', batas_berlaku(daftar_saham, '5m', detik_live))
+}
+catat_cache('kurs', 'permintaan')
+catat_cache('watchlist', 'permintaan')
+if perlu_ambil_perbandingan:
+    # Data mentah per ticker (database lokal + pembaruan), disejajarkan setelah semua selesai
+    for simbol in daftar_perbandingan:
+        tugas_unduh[f'banding:{simbol}'] = (ambil_data_saham, simbol, periode_waktu, pemetaan_interval[periode_waktu])
+    with st.spinner(f'Mengambil data {len(daftar_perbandingan)} saham...'), ukur_tahap('ambil_bersamaan'):
+        hasil_unduh = ambil_bersamaan(tugas_unduh)
+elif perlu_ambil_penyaring:
+    # Seluruh semesta dilengkapi dengan unduhan berkelompok lalu dibaca dari database lokal
+    tugas_unduh['penyaring'] = (muat_semesta, daftar_penyaring, periode_penyaring)
+    with st.spinner(f'Menyiapkan data {len(daftar_penyaring)} saham...'), ukur_tahap('ambil_bersamaan'):
+        hasil_unduh = ambil_bersamaan(tugas_unduh)
+elif perlu_ambil_data:
+    tugas_unduh['data'] = (
+        ambil_data_olahan, kode_saham, periode_waktu, pemetaan_interval[periode_waktu], None, indikator_teknikal
+    )
+    with st.spinner(f'Mengambil data untuk {kode_saham}...'), ukur_tahap('ambil_bersamaan'):
+        hasil_unduh = ambil_bersamaan(tugas_unduh)
+else:
+    with ukur_tahap('ambil_bersamaan'):
+        hasil_unduh = ambil_bersamaan(tugas_unduh)
+
+kurs_terkini = hasil_unduh['kurs'] if hasil_unduh['kurs'] is not None else KURS_USD_IDR
+
+if perlu_ambil_data:
     
-    with st.spinner(f'Mengambil data untuk {kode_saham}...'):
-        # Ambil dan proses data
-        data = ambil_data_saham(kode_saham, periode_waktu, pemetaan_interval[periode_waktu])
+    with st.spinner(f'Memproses data {kode_saham}...'):
+        kurs_idr = kurs_terkini
+        data = hasil_unduh['data']
         
-        if data.empty:
-            st.error('❌ Data tidak ditemukan. Pastikan kode saham benar.')
+        if data is None:
+            hasil_tersimpan = {'kunci': kunci_data, 'data': None}
         else:
-            data = olah_data(data)
-            data = tambah_indikator(data)
+            # Data sudah diolah (beserta indikator) oleh layanan data bersama
+            with ukur_tahap('hitung_metrik', len(data)):
+                metrik = hitung_metrik(data, kurs_idr)
+            
+            hasil_tersimpan = {
+                'kunci': kunci_data,
+                'data': data,
+                'kurs': kurs_idr,
+                'metrik': metrik
+            }
+    
+    st.session_state['hasil_data'] = hasil_tersimpan
+
+if perlu_ambil_perbandingan:
+    data_perbandingan = {simbol: hasil_unduh[f'banding:{simbol}'] for simbol in daftar_perbandingan}
+    with ukur_tahap('matriks_perbandingan'):
+        matriks_perbandingan = bangun_matriks_harga(data_perbandingan)
+    perbandingan_tersimpan = {
+        'kunci': kunci_perbandingan,
+        'matriks': matriks_perbandingan,
+        'gagal': [s for s in daftar_perbandingan if s not in matriks_perbandingan['simbol']]
+    }
+    st.session_state['hasil_perbandingan'] = perbandingan_tersimpan
+
+if perlu_ambil_penyaring:
+    matriks_semesta, gagal_semesta = hasil_unduh['penyaring'] or (None, list(daftar_penyaring))
+    penyaring_tersimpan = {
+        'kunci': kunci_penyaring,
+        'matriks': matriks_semesta,
+        'gagal': gagal_semesta
+    }
+    st.session_state['hasil_penyaring'] = penyaring_tersimpan
+
+if mode_perbandingan:
+    
+    if perbandingan_tersimpan is None:
+        st.info('👈 Masukkan daftar saham di panel samping dan klik "Perbarui Data" untuk membandingkan')
+    elif not perbandingan_tersimpan['matriks']['simbol']:
+        st.error('❌ Data tidak ditemukan. Pastikan kode saham benar.')
+    else:
+        matriks_perbandingan = perbandingan_tersimpan['matriks']
+        if perbandingan_tersimpan['gagal']:
+            st.warning(f"⚠️ Data tidak tersedia: {', '.join(perbandingan_tersimpan['gagal'])}")
+        
+        # Return, drawdown dan indikator dihitung ulang dari matriks di memori
+        with ukur_tahap('hitung_perbandingan', matriks_perbandingan['harga'].size):
+            perbandingan = hitung_perbandingan(matriks_perbandingan, indikator_teknikal)
+        
+        st.subheader(f"📊 Perbandingan {len(perbandingan['simbol'])} Saham")
+        tampilan_perbandingan = st.radio('Tampilan', list(TAMPILAN_PERBANDINGAN), horizontal=True)
+        
+        with ukur_tahap('buat_grafik_perbandingan', matriks_perbandingan['harga'].size):
+            grafik_perbandingan = buat_grafik_perbandingan(
+                perbandingan, TAMPILAN_PERBANDINGAN[tampilan_perbandingan], indikator_teknikal
+            )
+        with ukur_tahap('tampil_grafik_perbandingan'):
+            st.plotly_chart(grafik_perbandingan, use_container_width=True)
+        if panel_debug or UKUR_PAYLOAD:
+            catat_payload('tampil_grafik_perbandingan', len(grafik_perbandingan.to_json()))
+        
+        st.dataframe(
+            perbandingan['ringkasan'].round(2),
+            use_container_width=True,
+            hide_index=True
+        )
+
+elif mode_penyaring:
+    
+    if penyaring_tersimpan is None:
+        st.info('👈 Pilih semesta saham dan kondisi di panel samping lalu klik "Perbarui Data" untuk menyaring')
+    elif penyaring_tersimpan['matriks'] is None or not penyaring_tersimpan['matriks']['simbol']:
+        st.error('❌ Data tidak ditemukan. Pastikan kode saham benar.')
+    else:
+        matriks_semesta = penyaring_tersimpan['matriks']
+        if penyaring_tersimpan['gagal']:
+            st.warning(f"⚠️ Data tidak tersedia ({len(penyaring_tersimpan['gagal'])}): {', '.join(penyaring_tersimpan['gagal'][:20])}")
+        
+        with ukur_tahap('saring_semesta', matriks_semesta['penutupan'].size):
+            tabel_penyaring = saring_semesta(matriks_semesta, kondisi_penyaring)
+        
+        jumlah_lolos = int(tabel_penyaring['Lolos'].sum())
+        st.subheader(f"🔎 {jumlah_lolos} dari {len(tabel_penyaring)} Saham Memenuhi Kondisi")
+        if not st.checkbox('Tampilkan semua saham (urut skor)'):
+            tabel_penyaring = tabel_penyaring[tabel_penyaring['Lolos']]
+        st.dataframe(
+            tabel_penyaring.drop(columns='Lolos').round(2),
+            use_container_width=True,
+            hide_index=True
+        )
+
+elif hasil_tersimpan is not None:
+    
+    if hasil_tersimpan['data'] is None:
+        st.error('❌ Data tidak ditemukan. Pastikan kode saham benar.')
+    else:
+        data = hasil_tersimpan['data']
+        kurs_idr = hasil_tersimpan['kurs']
+        metrik = hasil_tersimpan['metrik']
+        
+        # Indikator yang baru dipilih dihitung sekali per frame lewat layanan bersama
+        indikator_belum_ada = [
+            nama for nama in indikator_teknikal
+            if nama in PARAMETER_INDIKATOR and PARAMETER_INDIKATOR[nama][0] not in data.columns
+        ]
+        if indikator_belum_ada:
+            data = lengkapi_data_olahan(
+                kode_saham, periode_waktu, pemetaan_interval[periode_waktu], data, indikator_belum_ada
+            )
+            hasil_tersimpan['data'] = data
+        
+        # Fragmen harga terkini: pada mode live timer hanya menjalankan fragmen ini
+        # (dan daftar pantauan). Jika frame bersama berubah, seluruh halaman
+        # dijalankan ulang agar grafik utama, uji balik dan metrik ikut diperbarui.
+        @st.fragment(run_every=detik_live)
+        def tampil_harga_terkini():
+            hasil = st.session_state['hasil_data']
+            if detik_live and not st.session_state.pop('harga_dari_skrip', False):
+                # Dijalankan ulang oleh timer: frame yang masih berlaku dikembalikan
+                # apa adanya, frame kedaluwarsa dilanjutkan dengan bar baru saja
+                with ukur_tahap('live_perbarui'):
+                    data_baru = ambil_data_olahan(
+                        kode_saham, periode_waktu, pemetaan_interval[periode_waktu], detik_live, indikator_teknikal
+                    )
+                if data_baru is not None and data_baru is not hasil['data']:
+                    with ukur_tahap('hitung_metrik', len(data_baru)):
+                        metrik_baru = hitung_metrik(data_baru, hasil['kurs'])
+                    st.session_state['hasil_data'] = {
+                        'kunci': hasil['kunci'], 'data': data_baru, 'kurs': hasil['kurs'], 'metrik': metrik_baru
+                    }
+                    st.rerun()
+            data = hasil['data']
+            kurs_idr = hasil['kurs']
+            metrik = hasil['metrik']
+            
+            # Indeks rentang dibangun sekali per frame, saat rentang pertama dipilih di grafik
+            rentang = None
+            seleksi = st.session_state.get('grafik_harga')
+            kotak = seleksi['selection']['box'] if seleksi else []
+            if kotak and len(kotak[0].get('x', [])) == 2:
+                if 'indeks' not in hasil:
+                    with ukur_tahap('indeks_rentang', len(data)):
+                        hasil['indeks'] = bangun_indeks_rentang(data, kurs_idr)
+                batas = rentang_dari_grafik(*kotak[0]['x'])
+                rentang = batas and cari_rentang(hasil['indeks'], *batas)
             
-            # Hitung metrik
-            harga_terakhir, perubahan, perubahan_persen, tinggi, rendah, volume = hitung_metrik(data)
+            # Tampilkan kurs
+            st.info(f'💱 Kurs: 1 USD = Rp {kurs_idr:,.2f}')
             
             # Tampilkan metrik utama
             st.subheader(f'📈 {kode_saham.upper()}')
+            if rentang is not None:
+                with ukur_tahap('metrik_rentang'):
+                    metrik = metrik_rentang(hasil['indeks'], *rentang)
+                waktu_rentang = waktu_tampilan(hasil['indeks']['waktu'][[rentang[0], rentang[1] - 1]])
+                st.caption(
+                    f"📐 Rentang terpilih: {waktu_rentang[0]:%d %b %Y %H:%M} – {waktu_rentang[1]:%d %b %Y %H:%M} "
+                    f"({rentang[1] - rentang[0]:,} bar). Klik dua kali pada grafik untuk kembali ke seluruh periode."
+                )
             
-            col_metrik1, col_metrik2, col_metrik3, col_metrik4 = st.columns(4)
+            # Buat dua baris metrik: USD dan IDR
+            st.markdown("**💵 Harga dalam USD:**")
+            col_usd1, col_usd2, col_usd3, col_usd4 = st.columns(4)
             
-            with col_metrik1:
+            with col_usd1:
+                # Format delta text manually with color indicator
+                delta_text = f"{metrik['perubahan_usd']:.2f} ({metrik['perubahan_persen']:.2f}%)"
                 st.metric(
                     label="Harga Terakhir", 
-                    value=f"${harga_terakhir:.2f}",
-                    delta=f"${perubahan:.2f} ({perubahan_persen:.2f}%)"
+                    value=f"${metrik['harga_terakhir_usd']:.2f}",
+                    delta=delta_text,
+                    delta_color="normal"
                 )
             
-            with col_metrik2:
-                st.metric("Tertinggi", f"${tinggi:.2f}")
-            
-            with col_metrik3:
-                st.metric("Terendah", f"${rendah:.2f}")
-            
-            with col_metrik4:
-                st.metric("Volume", f"{volume:,.0f}")
+            with col_usd2:
+                st.metric("Tertinggi", f"${metrik['harga_tertinggi_usd']:.2f}")
             
-            st.markdown('---')
+            with col_usd3:
+                st.metric("Terendah", f"${metrik['harga_terendah_usd']:.2f}")
             
-            # Buat grafik harga saham
-            st.subheader(f'Grafik Harga {kode_saham.upper()}')
+            with col_usd4:
+                st.metric("Volume", f"{metrik['total_volume']:,.0f}")
             
-            grafik = go.Figure()
+            st.markdown("**🇮🇩 Harga dalam IDR:**")
+            col_idr1, col_idr2, col_idr3, col_idr4 = st.columns(4)
             
-            # Pilih tipe grafik
-            if tipe_grafik == 'Candlestick':
-                grafik.add_trace(go.Candlestick(
-                    x=data['Tanggal'],
-                    open=data['Pembukaan'],
-                    high=data['Tertinggi'],
-                    low=data['Terendah'],
-                    close=data['Penutupan'],
-                    name='Harga'
-                ))
-            elif tipe_grafik == 'Garis':
-                grafik.add_trace(go.Scatter(
-                    x=data['Tanggal'], 
-                    y=data['Penutupan'],
-                    mode='lines',
-                    name='Harga Penutupan',
-                    line=dict(color='#1f77b4', width=2)
-                ))
-            else:  # Area
-                grafik.add_trace(go.Scatter(
-                    x=data['Tanggal'], 
-                    y=data['Penutupan'],
-                    fill='tozeroy',
-                    name='Harga Penutupan',
-                    line=dict(color='#1f77b4')
-                ))
+            with col_idr1:
+                # Format delta text manually with color indicator
+                delta_text_idr = f"{metrik['perubahan_idr']:.0f} ({metrik['perubahan_persen_idr']:.2f}%)"
+                st.metric(
+                    label="Harga Terakhir", 
+                    value=f"Rp {metrik['harga_terakhir_idr']:,.0f}",
+                    delta=delta_text_idr,
+                    delta_color="normal"
+                )
             
-            # Tambahkan indikator teknikal yang dipilih
-            warna_indikator = {
-                'SMA 20': '#ff7f0e',
-                'SMA 50': '#2ca02c',
-                'EMA 20': '#d62728',
-                'EMA 50': '#9467bd'
-            }
+            with col_idr2:
+                st.metric("Tertinggi", f"Rp {metrik['harga_tertinggi_idr']:,.0f}")
             
-            for indikator in indikator_teknikal:
-                if indikator == 'SMA 20':
-                    grafik.add_trace(go.Scatter(
-                        x=data['Tanggal'], 
-                        y=data['SMA_20'], 
-                        name='SMA 20',
-                        line=dict(color=warna_indikator['SMA 20'], dash='dash')
-                    ))
-                elif indikator == 'SMA 50':
-                    grafik.add_trace(go.Scatter(
-                        x=data['Tanggal'], 
-                        y=data['SMA_50'], 
-                        name='SMA 50',
-                        line=dict(color=warna_indikator['SMA 50'], dash='dash')
-                    ))
-                elif indikator == 'EMA 20':
-                    grafik.add_trace(go.Scatter(
-                        x=data['Tanggal'], 
-                        y=data['EMA_20'], 
-                        name='EMA 20',
-                        line=dict(color=warna_indikator['EMA 20'], dash='dot')
-                    ))
-                elif indikator == 'EMA 50':
-                    grafik.add_trace(go.Scatter(
-                        x=data['Tanggal'], 
-                        y=data['EMA_50'], 
-                        name='EMA 50',
-                        line=dict(color=warna_indikator['EMA 50'], dash='dot')
-                    ))
+            with col_idr3:
+                st.metric("Terendah", f"Rp {metrik['harga_terendah_idr']:,.0f}")
             
-            # Format grafik
-            grafik.update_layout(
-                xaxis_title='Waktu',
-                yaxis_title='Harga (USD)',
-                height=600,
-                hovermode='x unified',
-                template='plotly_white'
-            )
+            with col_idr4:
+                st.metric("Volume", f"{metrik['total_volume']:,.0f}")
             
-            st.plotly_chart(grafik, use_container_width=True)
+            if detik_live:
+                st.caption(f'⚡ Live: diperiksa setiap {detik_live} detik, halaman digambar ulang saat ada bar baru')
             
-            # Grafik RSI jika dipilih
-            if 'RSI' in indikator_teknikal:
-                st.subheader('RSI (Relative Strength Index)')
-                grafik_rsi = go.Figure()
-                grafik_rsi.add_trace(go.Scatter(
-                    x=data['Tanggal'], 
-                    y=data['RSI'],
-                    name='RSI',
-                    line=dict(color='purple')
-                ))
-                grafik_rsi.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
-                grafik_rsi.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
-                grafik_rsi.update_layout(
-                    xaxis_title='Waktu',
-                    yaxis_title='RSI',
-                    height=300,
-                    template='plotly_white'
+        st.session_state['harga_dari_skrip'] = True
+        tampil_harga_terkini()
+        
+        st.markdown('---')
+        
+        # Harga dan SMA/EMA dalam IDR dihitung dari kolom Kurs (kurs per bar)
+        if mata_uang == 'IDR':
+            with ukur_tahap('konversi_idr', len(data)):
+                data_tampil = kurs.frame_idr(data, kurs_idr)
+        else:
+            data_tampil = data
+        
+        # Buat grafik harga saham
+        st.subheader(f'Grafik Harga {kode_saham.upper()}')
+        st.caption(
+            'Pilih rentang dengan Box Select untuk menghitung metrik di atas hanya pada rentang tersebut '
+            'dan menggambarnya ulang dengan detail penuh'
+        )
+        
+        # Streamlit tidak mengirim event zoom, hanya seleksi: rentang yang dipilih
+        # digambar ulang sehingga downsampling hanya berlaku untuk bar di dalamnya
+        data_grafik = data_tampil
+        seleksi = st.session_state.get('grafik_harga')
+        kotak = seleksi['selection']['box'] if seleksi else []
+        if kotak and len(kotak[0].get('x', [])) == 2:
+            batas = rentang_dari_grafik(*kotak[0]['x'])
+            rentang_grafik = batas and cari_rentang({'waktu': waktu_epoch_ns(data_tampil)}, *batas)
+            if rentang_grafik:
+                data_grafik = data_tampil.iloc[rentang_grafik[0]:rentang_grafik[1]]
+        
+        # Grafik di samping panel uji balik hanya selebar 3/4 halaman
+        lebar_grafik = LEBAR_GRAFIK_PIKSEL if strategi_uji == 'Tidak Ada' else LEBAR_GRAFIK_PIKSEL * 3 // 4
+        with ukur_tahap('buat_grafik', len(data_grafik)):
+            if grafik_ringan:
+                grafik = buat_grafik_ringan(data_grafik, tipe_grafik, indikator_teknikal, mata_uang, lebar_grafik)
+            else:
+                grafik = buat_grafik_harga(data_grafik, tipe_grafik, indikator_teknikal, mata_uang, lebar_grafik)
+        
+        if strategi_uji == 'Tidak Ada':
+            with ukur_tahap('tampil_grafik'):
+                st.plotly_chart(grafik, use_container_width=True, key='grafik_harga', on_select='rerun', selection_mode='box')
+        else:
+            # Uji balik dihitung ulang dari data di memori setiap parameter berubah
+            with ukur_tahap('uji_balik', len(data)):
+                uji = uji_balik(data, strategi_uji, batas_rsi[0], batas_rsi[1], biaya_bps)
+            col_grafik, col_uji = st.columns([3, 1])
+            with col_grafik, ukur_tahap('tampil_grafik'):
+                st.plotly_chart(grafik, use_container_width=True, key='grafik_harga', on_select='rerun', selection_mode='box')
+            with col_uji:
+                ringkasan_uji = uji['ringkasan']
+                st.markdown(f'**🧪 {strategi_uji}**')
+                st.metric(
+                    'Total Return',
+                    f"{ringkasan_uji['Total Return (%)']:,.2f}%",
+                    delta=f"{ringkasan_uji['Total Return (%)'] - ringkasan_uji['Beli & Tahan (%)']:,.2f}% vs beli & tahan"
                 )
-                st.plotly_chart(grafik_rsi, use_container_width=True)
-            
-            st.markdown('---')
-            
-            # Tampilkan data dalam tabel
-            tab1, tab2 = st.tabs(['📋 Data Historis', '📊 Indikator Teknikal'])
-            
-            with tab1:
-                st.dataframe(
-                    data[['Tanggal', 'Pembukaan', 'Tertinggi', 'Terendah', 'Penutupan', 'Volume']].tail(50),
-                    use_container_width=True
+                st.metric('Drawdown Maks', f"{ringkasan_uji['Drawdown Maks (%)']:.2f}%")
+                st.metric('Sharpe', format_statistik(ringkasan_uji['Sharpe']))
+                st.metric(
+                    'Transaksi',
+                    f"{ringkasan_uji['Jumlah Transaksi']}",
+                    delta=f"win rate {format_statistik(ringkasan_uji['Win Rate (%)'], '%')}",
+                    delta_color='off'
                 )
-            
-            with tab2:
-                kolom_indikator = ['Tanggal', 'SMA_20', 'SMA_50', 'EMA_20', 'EMA_50', 'RSI']
-                kolom_tersedia = [k for k in kolom_indikator if k in data.columns]
+            with st.expander('📈 Kurva Ekuitas & Statistik Uji Balik'):
+                st.plotly_chart(buat_grafik_ekuitas(uji), use_container_width=True)
                 st.dataframe(
-                    data[kolom_tersedia].tail(50),
-                    use_container_width=True
+                    {'Statistik': list(ringkasan_uji), 'Nilai': [round(float(v), 2) for v in ringkasan_uji.values()]},
+                    use_container_width=True,
+                    hide_index=True
                 )
+        if panel_debug or UKUR_PAYLOAD:
+            catat_payload('tampil_grafik', len(grafik.to_json()))
+        
+        # Grafik RSI jika dipilih (grafik ringan sudah memuat RSI sebagai subplot)
+        if 'RSI' in indikator_teknikal and not grafik_ringan:
+            st.subheader('RSI (Relative Strength Index)')
+            with ukur_tahap('buat_grafik_rsi', len(data_grafik)):
+                grafik_rsi = buat_grafik_rsi(data_grafik)
+            with ukur_tahap('tampil_grafik_rsi'):
+                st.plotly_chart(grafik_rsi, use_container_width=True)
+            if panel_debug or UKUR_PAYLOAD:
+                catat_payload('tampil_grafik_rsi', len(grafik_rsi.to_json()))
+        
+        # Sapuan parameter: uji balik persilangan untuk seluruh grid window sekaligus
+        with st.expander('🔥 Sapuan Parameter Persilangan'):
+            with st.form('form_sapuan'):
+                col_cepat, col_lambat = st.columns(2)
+                with col_cepat:
+                    jenis_cepat = st.selectbox('Garis Cepat', list(GARIS_SAPUAN))
+                    rentang_cepat = st.slider('Window Cepat', 2, 200, (5, 100))
+                with col_lambat:
+                    jenis_lambat = st.selectbox('Garis Lambat', list(GARIS_SAPUAN), index=1)
+                    rentang_lambat = st.slider('Window Lambat', 5, 400, (20, 200))
+                col_langkah, col_biaya = st.columns(2)
+                with col_langkah:
+                    langkah_sapuan = st.select_slider('Langkah Window', [1, 2, 5, 10], value=5)
+                with col_biaya:
+                    biaya_sapuan = st.number_input('Biaya Transaksi (bps)', 0, 50, 10)
+                tombol_sapuan = st.form_submit_button('Jalankan Sapuan')
+            
+            sapuan_tersimpan = st.session_state.get('hasil_sapuan')
+            if tombol_sapuan:
+                window_cepat = range(rentang_cepat[0], rentang_cepat[1] + 1, langkah_sapuan)
+                window_lambat = range(rentang_lambat[0], rentang_lambat[1] + 1, langkah_sapuan)
+                with st.spinner(f'Menguji {len(window_cepat) * len(window_lambat):,} kombinasi...'), \
+                        ukur_tahap('sapu_parameter', len(data) * len(window_cepat) * len(window_lambat)):
+                    sapuan_tersimpan = {
+                        'kunci': kunci_data,
+                        'sapuan': sapu_parameter(
+                            data, jenis_cepat, window_cepat, jenis_lambat, window_lambat, biaya_sapuan
+                        )
+                    }
+                st.session_state['hasil_sapuan'] = sapuan_tersimpan
+            
+            if sapuan_tersimpan is not None and sapuan_tersimpan['kunci'] == kunci_data:
+                hasil_sapuan = sapuan_tersimpan['sapuan']
+                metrik_sapuan = st.radio('Metrik', METRIK_SAPUAN, horizontal=True)
+                nilai_sapuan = hasil_sapuan['metrik'][metrik_sapuan]
+                if metrik_sapuan != 'Jumlah Transaksi' and nilai_sapuan.size and not np.isnan(nilai_sapuan).all():
+                    i, j = np.unravel_index(np.nanargmax(nilai_sapuan), nilai_sapuan.shape)
+                    st.markdown(
+                        f"**Terbaik:** {hasil_sapuan['jenis_cepat']} {hasil_sapuan['window_cepat'][i]} / "
+                        f"{hasil_sapuan['jenis_lambat']} {hasil_sapuan['window_lambat'][j]} "
+                        f"→ {metrik_sapuan} {nilai_sapuan[i, j]:,.2f}"
+                    )
+                st.plotly_chart(buat_grafik_sapuan(hasil_sapuan, metrik_sapuan), use_container_width=True)
+        
+        st.markdown('---')
+        
+        # Tampilkan data dalam tabel
+        tab1, tab2 = st.tabs(['📋 Data Historis', '📊 Indikator Teknikal'])
+        
+        with tab1:
+            st.dataframe(
+                frame_tampilan(data_tampil[['Tanggal', 'Pembukaan', 'Tertinggi', 'Terendah', 'Penutupan', 'Volume']].tail(50)),
+                use_container_width=True
+            )
+        
+        with tab2:
+            kolom_indikator = ['Tanggal', 'SMA_20', 'SMA_50', 'EMA_20', 'EMA_50', 'RSI']
+            kolom_tersedia = [k for k in kolom_indikator if k in data_tampil.columns]
+            st.dataframe(
+                frame_tampilan(data_tampil[kolom_tersedia].tail(50)),
+                use_container_width=True
+            )
 
 else:
     # Tampilan awal sebelum data dimuat
@@ -335,6 +652,8 @@ else:
     - **Indikator Teknikal**: SMA, EMA, RSI
     - **Data Real-Time**: Update data saham terkini
     - **Analisis Multi-Periode**: Dari 1 hari hingga data maksimal
+    - **Dual Currency**: Tampilan harga dalam USD dan IDR
+    - **Penyaring Saham**: Cari saham dalam LQ45 atau daftar sendiri berdasarkan RSI, persilangan SMA dan harga tertinggi
     
     ### 📖 Cara Menggunakan:
     1. Masukkan kode saham (ticker) di panel samping
@@ -348,25 +667,63 @@ else:
 st.sidebar.markdown('---')
 st.sidebar.subheader('💹 Harga Saham Real-Time')
 
-daftar_saham = ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA']
-
-for simbol in daftar_saham:
-    try:
-        data_realtime = ambil_data_saham(simbol, '1d', '5m')
-        if not data_realtime.empty:
-            data_realtime = olah_data(data_realtime)
-            harga_sekarang = data_realtime['Penutupan'].iloc[-1]
-            harga_buka = data_realtime['Pembukaan'].iloc[0]
-            selisih = harga_sekarang - harga_buka
-            persen_selisih = (selisih / harga_buka) * 100
-            
-            st.sidebar.metric(
-                f"{simbol}", 
-                f"${harga_sekarang:.2f}",
-                f"{selisih:.2f} ({persen_selisih:.2f}%)"
+st.sidebar.text_input(
+    'Daftar Pantauan',
+    DAFTAR_PANTAUAN_AWAL,
+    key='daftar_pantauan',
+    help='Pisahkan kode saham dengan koma'
+)
+
+# Fragmen daftar pantauan: pada mode live dijalankan ulang sendiri oleh timer
+@st.fragment(run_every=detik_live)
+def tampil_daftar_pantauan():
+    # Saat skrip penuh berjalan, kurs dan data daftar pantauan sudah diunduh bersamaan dengan data utama
+    hasil_skrip = st.session_state.pop('pantauan_dari_skrip', None)
+    if hasil_skrip is not None:
+        data_watchlist, kurs_sidebar = hasil_skrip
+    else:
+        # Dijalankan ulang oleh timer: ambil lewat cache bersama
+        catat_cache('kurs', 'permintaan')
+        catat_cache('watchlist', 'permintaan')
+        kurs_sidebar = ambil_kurs_usd_idr(batas_berlaku([kurs.SIMBOL_KURS], '5m', detik_live))
+        try:
+            data_watchlist = ambil_data_watchlist(
+                tuple(daftar_saham), '1d', '5m', batas_berlaku(daftar_saham, '5m', detik_live)
             )
-    except:
-        st.sidebar.text(f"{simbol}: Data tidak tersedia")
+        except Exception:
+            data_watchlist = {}
+    mulai_watchlist = time.perf_counter()
+    
+    for simbol in daftar_saham:
+        try:
+            data_realtime = data_watchlist.get(simbol)
+            if data_realtime is not None and not data_realtime.empty:
+                data_realtime = olah_data(data_realtime)
+                harga_sekarang = data_realtime['Penutupan'].iloc[-1]
+                harga_buka = data_realtime['Pembukaan'].iloc[0]
+                selisih = harga_sekarang - harga_buka
+                persen_selisih = (selisih / harga_buka) * 100
+                
+                # Konversi ke IDR
+                harga_sekarang_idr = harga_sekarang * kurs_sidebar
+                
+                # Format delta without dollar sign so Streamlit can detect sign
+                delta_text = f"{selisih:.2f} ({persen_selisih:.2f}%)"
+                
+                st.metric(
+                    f"{simbol}", 
+                    f"${harga_sekarang:.2f} / Rp {harga_sekarang_idr:,.0f}",
+                    delta_text,
+                    delta_color="normal"
+                )
+        except:
+            st.text(f"{simbol}: Data tidak tersedia")
+    
+    catat_tahap('watchlist', time.perf_counter() - mulai_watchlist, sum(len(d) for d in data_watchlist.values()))
+
+st.session_state['pantauan_dari_skrip'] = (hasil_unduh['watchlist'] or {}, kurs_terkini)
+with st.sidebar:
+    tampil_daftar_pantauan()
 
 # Informasi tambahan
 st.sidebar.markdown('---')
@@ -378,3 +735,32 @@ st.sidebar.info(
 
 st.sidebar.markdown('---')
 st.sidebar.caption('💡 Tips: Gunakan indikator teknikal untuk analisis yang lebih mendalam')
+
+# 2D: PANEL DEBUG ############
+
+if panel_debug:
+    with st.expander('🛠️ Panel Debug', expanded=True):
+        tabel_tahap, tabel_cache = ringkasan_metrik()
+        st.markdown('**Waktu per tahap (sejak server berjalan)**')
+        st.dataframe(tabel_tahap, use_container_width=True, hide_index=True)
+        st.markdown('**Cache**')
+        st.dataframe(tabel_cache, use_container_width=True, hide_index=True)
+        
+        if PEMANASAN_AKTIF:
+            status = status_pemanasan()
+            st.markdown('**Pemanasan Latar Belakang**')
+            col_pem1, col_pem2, col_pem3, col_pem4 = st.columns(4)
+            col_pem1.metric('Ticker', status['ticker'])
+            col_pem2.metric('Antrean', status['antrean'], help='Tugas yang sudah jatuh tempo tetapi belum selesai')
+            col_pem3.metric('Terjadwal', status['terjadwal'])
+            col_pem4.metric('Selesai', status['selesai'], delta=f"{status['gagal']} gagal" if status['gagal'] else None, delta_color='inverse')
+        
+        teks_prometheus = ekspor_prometheus()
+        st.download_button(
+            '⬇️ Unduh Metrik (Prometheus)',
+            teks_prometheus,
+            file_name='metrics.txt',
+            mime='text/plain'
+        )
+        if PORT_METRIK:
+            st.caption(f'Endpoint Prometheus aktif di port {PORT_METRIK}: /metrics')
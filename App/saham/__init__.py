@@ -0,0 +1,26 @@
+# Paket inti dashboard saham: pengambilan, pemrosesan, indikator dan grafik
+# Bisa diimpor tanpa Streamlit (misalnya oleh benchmark atau skrip lain).
+#
+# Modul:
+#   konfigurasi  - konstanta dan pengaturan dari environment variable
+#   metrik       - instrumentasi tahap, cache dan ekspor Prometheus
+#   penyimpanan  - database OHLCV lokal (SQLite)
+#   penyedia     - penyedia data pasar (yfinance, replay)
+#   pengambilan  - pengambilan data saham dan daftar pantauan
+#   kurs         - riwayat kurs USD/IDR dan konversi IDR per bar
+#   kalender     - jam bursa dan masa berlaku cache per interval
+#   pemrosesan   - olah_data dan hitung_metrik
+#   rentang      - indeks rentang untuk metrik potongan waktu
+#   indikator    - SMA, EMA, RSI (penuh dan inkremental)
+#   grafik       - downsampling dan grafik Plotly
+#   layanan      - frame olahan yang dipakai bersama antar sesi
+#   pemanasan    - pemanasan latar belakang ticker populer
+#   resampel     - bar interval kasar dari bar interval halus
+#   perbandingan - perbandingan banyak saham dalam matriks 2D
+#   penyaring    - penyaring kondisi teknikal untuk banyak ticker
+#   ujibalik     - uji balik strategi SMA/EMA/RSI (vektor NumPy)
+#   sapuan       - sapuan window persilangan SMA/EMA (heatmap)
+#
+# Dependensi berat (yfinance, plotly, scipy, ta) baru diimpor saat jalur yang
+# membutuhkannya benar-benar berjalan, jadi modul ini sengaja tidak mengimpor
+# submodul apa pun.
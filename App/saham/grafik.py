@@ -0,0 +1,419 @@
+# Grafik Plotly dan downsampling titik grafik
+# plotly baru diimpor saat grafik dibuat
+
+import numpy as np
+import pandas as pd
+
+from .indikator import PARAMETER_INDIKATOR
+from .konfigurasi import LEBAR_GRAFIK_PIKSEL
+from .pemrosesan import waktu_epoch_ns, waktu_tampilan
+
+# Batas titik per grafik, diturunkan dari lebar grafik (piksel)
+def batas_titik(lebar_piksel=LEBAR_GRAFIK_PIKSEL):
+    """
+    Return: dict {'garis': 2 titik per piksel (sudah tak terbedakan),
+                  'candle': 1 candle per 3 piksel (agar masih terbaca),
+                  'ringan': 1 titik per piksel (grafik ringan, target asli LTTB)}
+    """
+    lebar_piksel = max(int(lebar_piksel), 100)
+    return {'garis': 2 * lebar_piksel, 'candle': lebar_piksel // 3, 'ringan': lebar_piksel}
+
+# Batas bawaan untuk grafik selebar LEBAR_GRAFIK_PIKSEL
+BATAS_TITIK_GARIS = batas_titik()['garis']
+BATAS_CANDLE = batas_titik()['candle']
+
+# Memilih titik yang mewakili bentuk garis (Largest-Triangle-Three-Buckets)
+def pilih_indeks_lttb(x, y, jumlah_titik):
+    """
+    Mengembalikan indeks titik hasil downsampling LTTB
+    Titik pertama dan terakhir selalu dipertahankan; nilai NaN dilewati.
+    Parameter:
+        x: array waktu (int64/float), urut naik
+        y: array nilai
+        jumlah_titik: jumlah titik maksimal
+    """
+    valid = np.flatnonzero(~np.isnan(y))
+    n = len(valid)
+    if n <= jumlah_titik or jumlah_titik < 3:
+        return valid
+
+    x = (x[valid] - x[valid[0]]).astype(np.float64)
+    y = y[valid]
+
+    # Batas bucket untuk titik tengah (tanpa titik pertama dan terakhir)
+    batas = np.linspace(1, n - 1, jumlah_titik - 1).astype(np.int64)
+    # Rata-rata setiap bucket, dipakai sebagai titik C untuk bucket sebelumnya
+    panjang = np.diff(batas)
+    rata_x = np.add.reduceat(x[:-1], batas[:-1]) / panjang
+    rata_y = np.add.reduceat(y[:-1], batas[:-1]) / panjang
+    rata_x = np.append(rata_x, x[-1])
+    rata_y = np.append(rata_y, y[-1])
+
+    terpilih = np.empty(jumlah_titik, dtype=np.int64)
+    terpilih[0] = 0
+    terpilih[-1] = n - 1
+    a = 0
+    for i in range(jumlah_titik - 2):
+        awal, akhir = batas[i], batas[i + 1]
+        ax, ay = x[a], y[a]
+        cx, cy = rata_x[i + 1], rata_y[i + 1]
+        luas = np.abs((ax - cx) * (y[awal:akhir] - ay) - (ax - x[awal:akhir]) * (cy - ay))
+        a = awal + int(np.argmax(luas))
+        terpilih[i + 1] = a
+
+    return valid[terpilih]
+
+# Mengambil titik (x, y) untuk satu trace garis
+def titik_grafik(df, kolom, jumlah_titik=BATAS_TITIK_GARIS):
+    """
+    Data waktu dan nilai kolom yang sudah di-downsample untuk grafik garis/area
+    Waktu tampilan hanya dibuat untuk titik yang terpilih; nilai dikembalikan
+    dengan tipe aslinya (float32 pada frame ringkas).
+    """
+    waktu_ns = waktu_epoch_ns(df)
+    nilai = df[kolom].to_numpy()
+    indeks = pilih_indeks_lttb(waktu_ns, nilai.astype(np.float64, copy=False), jumlah_titik)
+    return waktu_tampilan(waktu_ns[indeks]), nilai[indeks]
+
+# Menggabungkan candle berurutan agar jumlahnya tidak melebihi batas
+def kecilkan_ohlc(df, jumlah_bar=BATAS_CANDLE):
+    """
+    Agregasi OHLC per kelompok bar berurutan (open pertama, high maksimum,
+    low minimum, close terakhir, volume dijumlah)
+    """
+    n = len(df)
+    if n <= jumlah_bar:
+        return df
+
+    ukuran = -(-n // jumlah_bar)
+    awal = np.arange(0, n, ukuran)
+    akhir = np.append(awal[1:], n) - 1
+
+    return pd.DataFrame({
+        'Tanggal': df['Tanggal'].iloc[awal].reset_index(drop=True),
+        'Pembukaan': df['Pembukaan'].to_numpy()[awal],
+        'Tertinggi': np.maximum.reduceat(df['Tertinggi'].to_numpy(), awal),
+        'Terendah': np.minimum.reduceat(df['Terendah'].to_numpy(), awal),
+        'Penutupan': df['Penutupan'].to_numpy()[akhir],
+        'Volume': np.add.reduceat(df['Volume'].to_numpy(), awal, dtype=np.int64)
+    })
+
+# Warna garis indikator SMA/EMA
+WARNA_INDIKATOR = {
+    'SMA 20': '#ff7f0e',
+    'SMA 50': '#2ca02c',
+    'EMA 20': '#d62728',
+    'EMA 50': '#9467bd'
+}
+
+# Waktu bar sebagai angka milidetik jam dinding ZONA_WAKTU
+def waktu_milidetik(waktu_ns):
+    """
+    Untuk sumbu bertipe date: Plotly mengirim array angka sebagai typed array
+    base64 (8 byte per titik), bukan teks tanggal per titik
+    """
+    return waktu_tampilan(waktu_ns).tz_localize(None).as_unit('ms').asi8.astype(np.float64)
+
+# Membuat grafik harga beserta indikator yang dipilih
+def buat_grafik_harga(data, tipe_grafik, indikator_teknikal, mata_uang='USD', lebar_piksel=LEBAR_GRAFIK_PIKSEL):
+    """
+    Membuat figure Plotly untuk harga saham
+    Parameter:
+        data: DataFrame hasil olah_data dan tambah_indikator
+              (untuk IDR: hasil kurs.frame_idr), atau potongan rentang yang
+              dipilih sehingga downsampling hanya berlaku untuk rentang itu
+        tipe_grafik: 'Candlestick', 'Garis' atau 'Area'
+        indikator_teknikal: daftar indikator yang dipilih
+        mata_uang: mata uang nilai di data, untuk judul sumbu
+        lebar_piksel: lebar grafik saat dirender, dasar batas titik (batas_titik)
+    """
+    import plotly.graph_objects as go
+
+    grafik = go.Figure()
+    batas = batas_titik(lebar_piksel)
+
+    # Pilih tipe grafik (data di-downsample agar ukuran grafik tidak ikut membesar)
+    if tipe_grafik == 'Candlestick':
+        data_candle = kecilkan_ohlc(data, batas['candle'])
+        grafik.add_trace(go.Candlestick(
+            x=waktu_tampilan(waktu_epoch_ns(data_candle)),
+            open=data_candle['Pembukaan'],
+            high=data_candle['Tertinggi'],
+            low=data_candle['Terendah'],
+            close=data_candle['Penutupan'],
+            name='Harga'
+        ))
+    elif tipe_grafik == 'Garis':
+        x_harga, y_harga = titik_grafik(data, 'Penutupan', batas['garis'])
+        grafik.add_trace(go.Scatter(
+            x=x_harga, 
+            y=y_harga,
+            mode='lines',
+            name='Harga Penutupan',
+            line=dict(color='#1f77b4', width=2)
+        ))
+    else:  # Area
+        x_harga, y_harga = titik_grafik(data, 'Penutupan', batas['garis'])
+        grafik.add_trace(go.Scatter(
+            x=x_harga, 
+            y=y_harga,
+            fill='tozeroy',
+            name='Harga Penutupan',
+            line=dict(color='#1f77b4')
+        ))
+
+    # Tambahkan indikator teknikal yang dipilih
+    for indikator in indikator_teknikal:
+        if indikator in WARNA_INDIKATOR:
+            kolom = PARAMETER_INDIKATOR[indikator][0]
+            x_indikator, y_indikator = titik_grafik(data, kolom, batas['garis'])
+            grafik.add_trace(go.Scatter(
+                x=x_indikator, 
+                y=y_indikator, 
+                name=indikator,
+                line=dict(color=WARNA_INDIKATOR[indikator], dash='dash' if kolom.startswith('SMA') else 'dot')
+            ))
+
+    # Format grafik
+    grafik.update_layout(
+        xaxis_title='Waktu',
+        yaxis_title=f'Harga ({mata_uang})',
+        height=600,
+        hovermode='x unified',
+        template='plotly_white'
+    )
+    
+    return grafik
+
+# Membuat grafik ringan: harga, RSI dan volume dalam satu figure WebGL
+def buat_grafik_ringan(data, tipe_grafik, indikator_teknikal, mata_uang='USD', lebar_piksel=LEBAR_GRAFIK_PIKSEL):
+    """
+    Pengganti buat_grafik_harga + buat_grafik_rsi untuk riwayat panjang
+    - harga + SMA/EMA, RSI (jika dipilih) dan volume dalam satu make_subplots
+      dengan sumbu x bersama (satu layout dan template, bukan dua figure)
+    - garis memakai Scattergl (WebGL) sehingga browser tidak membuat elemen SVG per titik
+    - sumbu x dikirim sebagai milidetik (waktu_milidetik) dan nilai sebagai
+      float32, keduanya diserialkan Plotly sebagai typed array base64
+    - garis di-downsample ke 1 titik per piksel lebar_piksel
+    Parameter sama dengan buat_grafik_harga.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    pakai_rsi = 'RSI' in indikator_teknikal and 'RSI' in data.columns
+    baris = ['harga', 'rsi', 'volume'] if pakai_rsi else ['harga', 'volume']
+    tinggi_baris = {'harga': 0.6, 'rsi': 0.2, 'volume': 0.2}
+    grafik = make_subplots(
+        rows=len(baris),
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.03,
+        row_heights=[tinggi_baris[b] for b in baris]
+    )
+    nomor = {b: i + 1 for i, b in enumerate(baris)}
+    waktu_ns = waktu_epoch_ns(data)
+    batas = batas_titik(lebar_piksel)
+
+    def garis(kolom, nama_baris, **pengaturan):
+        nilai = data[kolom].to_numpy()
+        indeks = pilih_indeks_lttb(waktu_ns, nilai.astype(np.float64, copy=False), batas['ringan'])
+        grafik.add_trace(go.Scattergl(
+            x=waktu_milidetik(waktu_ns[indeks]),
+            y=nilai[indeks].astype(np.float32),
+            mode='lines',
+            **pengaturan
+        ), row=nomor[nama_baris], col=1)
+
+    # Candle dan batang volume memakai kelompok bar yang sama (paling banyak batas['candle'])
+    data_candle = kecilkan_ohlc(data, batas['candle'])
+    x_candle = waktu_milidetik(waktu_epoch_ns(data_candle))
+    if tipe_grafik == 'Candlestick':
+        grafik.add_trace(go.Candlestick(
+            x=x_candle,
+            open=data_candle['Pembukaan'].to_numpy().astype(np.float32),
+            high=data_candle['Tertinggi'].to_numpy().astype(np.float32),
+            low=data_candle['Terendah'].to_numpy().astype(np.float32),
+            close=data_candle['Penutupan'].to_numpy().astype(np.float32),
+            name='Harga'
+        ), row=1, col=1)
+    elif tipe_grafik == 'Garis':
+        garis('Penutupan', 'harga', name='Harga Penutupan', line=dict(color='#1f77b4', width=2))
+    else:  # Area
+        garis('Penutupan', 'harga', name='Harga Penutupan', fill='tozeroy', line=dict(color='#1f77b4'))
+
+    for indikator in indikator_teknikal:
+        if indikator in WARNA_INDIKATOR:
+            kolom = PARAMETER_INDIKATOR[indikator][0]
+            garis(kolom, 'harga', name=indikator, line=dict(
+                color=WARNA_INDIKATOR[indikator], dash='dash' if kolom.startswith('SMA') else 'dot'
+            ))
+
+    if pakai_rsi:
+        garis('RSI', 'rsi', name='RSI', line=dict(color='purple'))
+        grafik.add_hline(y=70, line_dash="dash", line_color="red", row=nomor['rsi'], col=1)
+        grafik.add_hline(y=30, line_dash="dash", line_color="green", row=nomor['rsi'], col=1)
+        grafik.update_yaxes(title_text='RSI', range=[0, 100], row=nomor['rsi'], col=1)
+
+    grafik.add_trace(go.Bar(
+        x=x_candle,
+        y=data_candle['Volume'].to_numpy().astype(np.float32),
+        name='Volume',
+        marker_color='#7f7f7f',
+        showlegend=False
+    ), row=nomor['volume'], col=1)
+
+    grafik.update_yaxes(title_text=f'Harga ({mata_uang})', row=1, col=1)
+    grafik.update_yaxes(title_text='Volume', row=nomor['volume'], col=1)
+    grafik.update_xaxes(type='date', rangeslider_visible=False)
+    grafik.update_layout(
+        height=800 if pakai_rsi else 700,
+        hovermode='x unified',
+        template='plotly_white'
+    )
+
+    return grafik
+
+# Membuat grafik RSI
+def buat_grafik_rsi(data, lebar_piksel=LEBAR_GRAFIK_PIKSEL):
+    """
+    Membuat figure Plotly untuk RSI dengan garis batas 70/30
+    """
+    import plotly.graph_objects as go
+
+    grafik_rsi = go.Figure()
+    x_rsi, y_rsi = titik_grafik(data, 'RSI', batas_titik(lebar_piksel)['garis'])
+    grafik_rsi.add_trace(go.Scatter(
+        x=x_rsi, 
+        y=y_rsi,
+        name='RSI',
+        line=dict(color='purple')
+    ))
+    grafik_rsi.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought (70)")
+    grafik_rsi.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold (30)")
+    grafik_rsi.update_layout(
+        xaxis_title='Waktu',
+        yaxis_title='RSI',
+        height=300,
+        template='plotly_white'
+    )
+    
+    return grafik_rsi
+
+# Membuat satu grafik gabungan untuk banyak saham
+def buat_grafik_perbandingan(perbandingan, tampilan, indikator_teknikal):
+    """
+    Semua ticker digambar sebagai garis di grafik yang sama (dalam persen)
+    Parameter:
+        perbandingan: hasil hitung_perbandingan
+        tampilan: kunci TAMPILAN_PERBANDINGAN ('normal', 'relatif', 'drawdown')
+        indikator_teknikal: SMA/EMA ikut digambar (putus-putus) pada tampilan 'normal'
+    Dengan puluhan ticker, sumbu x dikirim sebagai angka milidetik (jam dinding
+    ZONA_WAKTU) pada sumbu bertipe date, bukan teks tanggal per titik, dan semua
+    trace dibuat dalam satu Figure sekaligus.
+    """
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+
+    palet = qualitative.Dark24 + qualitative.Light24
+    waktu_ns = perbandingan['waktu']
+    waktu_ms = waktu_milidetik(waktu_ns)
+    nilai = perbandingan[tampilan] * 100
+    simbol = perbandingan['simbol']
+
+    def garis(y, **pengaturan):
+        indeks = pilih_indeks_lttb(waktu_ns, y, BATAS_TITIK_GARIS)
+        return go.Scatter(x=waktu_ms[indeks], y=y[indeks], mode='lines', **pengaturan)
+
+    trace = []
+    for j, kode in enumerate(simbol):
+        warna = palet[j % len(palet)]
+        trace.append(garis(nilai[:, j], name=kode, legendgroup=kode, line=dict(color=warna, width=1.5)))
+
+        if tampilan != 'normal':
+            continue
+        for indikator, nilai_indikator in perbandingan['indikator'].items():
+            if PARAMETER_INDIKATOR[indikator][1] == 'RSI':
+                continue
+            trace.append(garis(
+                (nilai_indikator[:, j] / perbandingan['harga_awal'][j] - 1) * 100,
+                name=f'{kode} {indikator}',
+                legendgroup=kode,
+                showlegend=False,
+                line=dict(color=warna, width=1, dash='dash' if indikator.startswith('SMA') else 'dot')
+            ))
+
+    judul_sumbu = {
+        'normal': 'Return sejak awal (%)',
+        'relatif': 'Relatif terhadap rata-rata (%)',
+        'drawdown': 'Drawdown (%)'
+    }
+    grafik = go.Figure(data=trace)
+    grafik.update_layout(
+        xaxis=dict(title='Waktu', type='date'),
+        yaxis_title=judul_sumbu.get(tampilan, tampilan),
+        height=600,
+        hovermode='x unified' if len(simbol) <= 10 else 'closest',
+        template='plotly_white'
+    )
+
+    return grafik
+
+# Membuat grafik kurva ekuitas hasil uji balik
+def buat_grafik_ekuitas(uji):
+    """
+    Return strategi dan beli-dan-tahan (persen) serta drawdown strategi
+    Parameter:
+        uji: hasil ujibalik.uji_balik
+    """
+    import plotly.graph_objects as go
+
+    waktu_ns = uji['waktu']
+    grafik = go.Figure()
+    for nama, y, pengaturan in [
+        ('Strategi', (uji['ekuitas'] - 1) * 100, dict(line=dict(color='#1f77b4'))),
+        ('Beli & Tahan', (uji['ekuitas_tahan'] - 1) * 100, dict(line=dict(color='gray', dash='dot'))),
+        ('Drawdown', uji['drawdown'] * 100, dict(line=dict(color='red', width=1), fill='tozeroy', yaxis='y2'))
+    ]:
+        indeks = pilih_indeks_lttb(waktu_ns, y, BATAS_TITIK_GARIS)
+        grafik.add_trace(go.Scatter(x=waktu_tampilan(waktu_ns[indeks]), y=y[indeks], name=nama, **pengaturan))
+
+    grafik.update_layout(
+        xaxis_title='Waktu',
+        yaxis=dict(title='Return (%)', domain=[0.3, 1]),
+        yaxis2=dict(title='Drawdown (%)', domain=[0, 0.25]),
+        height=400,
+        hovermode='x unified',
+        template='plotly_white'
+    )
+
+    return grafik
+
+# Membuat heatmap hasil sapuan parameter
+def buat_grafik_sapuan(sapuan, metrik):
+    """
+    Parameter:
+        sapuan: hasil sapuan.sapu_parameter
+        metrik: salah satu METRIK_SAPUAN
+    """
+    import plotly.graph_objects as go
+
+    nilai = sapuan['metrik'][metrik]
+    grafik = go.Figure(go.Heatmap(
+        z=nilai,
+        x=sapuan['window_lambat'],
+        y=sapuan['window_cepat'],
+        colorscale='RdYlGn',
+        colorbar=dict(title=metrik),
+        hovertemplate=(
+            f"{sapuan['jenis_cepat']} %{{y}} / {sapuan['jenis_lambat']} %{{x}}"
+            f"<br>{metrik}: %{{z:,.2f}}<extra></extra>"
+        )
+    ))
+    grafik.update_layout(
+        xaxis_title=f"Window {sapuan['jenis_lambat']} (lambat)",
+        yaxis_title=f"Window {sapuan['jenis_cepat']} (cepat)",
+        height=500,
+        template='plotly_white'
+    )
+
+    return grafik
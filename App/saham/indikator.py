@@ -0,0 +1,320 @@
+# Indikator teknikal (SMA, EMA, RSI) dengan kernel NumPy
+# scipy dan ta baru diimpor saat dibutuhkan
+
+import copy
+
+import numpy as np
+import pandas as pd
+
+# Parameter setiap indikator yang bisa dipilih di sidebar: (kolom, jenis, window)
+PARAMETER_INDIKATOR = {
+    'SMA 20': ('SMA_20', 'SMA', 20),
+    'SMA 50': ('SMA_50', 'SMA', 50),
+    'EMA 20': ('EMA_20', 'EMA', 20),
+    'EMA 50': ('EMA_50', 'EMA', 50),
+    'RSI': ('RSI', 'RSI', 14)
+}
+
+# Kernel SMA berbasis cumulative sum
+def hitung_sma(harga, window, hasil):
+    """
+    Simple Moving Average, sama dengan ta.trend.sma_indicator
+    Hasil ditulis ke array hasil (bentuk sama dengan harga). harga boleh 2D
+    (baris = waktu, kolom = ticker); perhitungan berjalan di sepanjang sumbu 0.
+    """
+    hasil[:window - 1] = np.nan
+    if len(harga) < window:
+        hasil[:] = np.nan
+        return hasil
+    # Dikurangi harga pertama agar cumsum tetap presisi pada data panjang
+    jumlah = np.empty((len(harga) + 1,) + harga.shape[1:])
+    jumlah[0] = 0.0
+    np.cumsum(harga - harga[0], axis=0, out=jumlah[1:])
+    np.subtract(jumlah[window:], jumlah[:-window], out=hasil[window - 1:])
+    hasil[window - 1:] /= window
+    hasil[window - 1:] += harga[0]
+    return hasil
+
+# Kernel EMA rekursif
+def hitung_ema(harga, alpha, min_periode, hasil):
+    """
+    EMA rekursif (ewm adjust=False) lewat filter IIR scipy
+    ema[0] = harga[0], ema[t] = alpha * harga[t] + (1 - alpha) * ema[t-1]
+    Untuk harga 2D setiap kolom difilter terpisah di sepanjang sumbu 0.
+    """
+    if len(harga) == 0:
+        return hasil
+    from scipy.signal import lfilter
+
+    hasil[:], _ = lfilter([alpha], [1.0, alpha - 1.0], harga, axis=0, zi=(1.0 - alpha) * harga[:1])
+    hasil[:min_periode - 1] = np.nan
+    return hasil
+
+# Kernel RSI dengan smoothing Wilder
+def hitung_rsi(harga, window, hasil):
+    """
+    Relative Strength Index, sama dengan ta.momentum.rsi
+    """
+    if len(harga) == 0:
+        return hasil
+    selisih = np.empty_like(harga)
+    selisih[0] = 0.0
+    np.subtract(harga[1:], harga[:-1], out=selisih[1:])
+    naik = hitung_ema(np.maximum(selisih, 0.0), 1.0 / window, window, np.empty_like(harga))
+    turun = hitung_ema(np.maximum(-selisih, 0.0), 1.0 / window, window, np.empty_like(harga))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(naik, turun, out=hasil)
+        hasil += 1.0
+        np.divide(100.0, hasil, out=hasil)
+        np.subtract(100.0, hasil, out=hasil)
+    hasil[turun == 0] = 100.0
+    return hasil
+
+# SMA untuk banyak window sekaligus dari satu cumulative sum
+def hitung_sma_banyak(harga, daftar_window):
+    """
+    Return: array (waktu, window); kolom j sama dengan hitung_sma(harga, daftar_window[j])
+    """
+    n = len(harga)
+    window = np.asarray(daftar_window, dtype=np.int64)
+    if n == 0:
+        return np.empty((0, len(window)))
+    jumlah = np.empty(n + 1)
+    jumlah[0] = 0.0
+    np.cumsum(harga - harga[0], out=jumlah[1:])
+    akhir = np.arange(1, n + 1)[:, None]
+    awal = akhir - window
+    hasil = jumlah[akhir] - jumlah[np.maximum(awal, 0)]
+    hasil /= window
+    hasil += harga[0]
+    hasil[awal < 0] = np.nan
+    return hasil
+
+# EMA untuk banyak window sekaligus
+def hitung_ema_banyak(harga, daftar_window):
+    """
+    Return: array (waktu, window); kolom j sama dengan hitung_ema untuk daftar_window[j]
+    Setiap window punya koefisien filter sendiri, jadi difilter satu per satu
+    (filter IIR scipy) ke kolom array yang sama.
+    """
+    hasil = np.empty((len(harga), len(daftar_window)), order='F')
+    for j, window in enumerate(daftar_window):
+        hitung_ema(harga, 2.0 / (window + 1), window, hasil[:, j])
+    return hasil
+
+# Menghitung indikator untuk banyak ticker sekaligus
+def hitung_indikator_matriks(harga, indikator):
+    """
+    Parameter:
+        harga: array (waktu, ticker); NaN hanya boleh ada sebelum bar pertama
+               setiap ticker
+        indikator: daftar pilihan dari PARAMETER_INDIKATOR
+    Return:
+        dict {nama: array (waktu, ticker)}, NaN sebelum indikator tersedia
+    Sebelum bar pertama diisi harga awal sehingga hasilnya sama dengan dihitung
+    per ticker mulai dari bar pertamanya, lalu bagian itu dikosongkan lagi.
+    """
+    n, k = harga.shape
+    ada = ~np.isnan(harga)
+    awal = np.argmax(ada, axis=0)  # bar pertama setiap ticker
+    terisi = np.where(ada, harga, harga[awal, np.arange(k)])
+    nomor_bar = np.arange(n)[:, None] - awal
+
+    nilai_indikator = {}
+    for nama in indikator:
+        if nama not in PARAMETER_INDIKATOR:
+            continue
+        _, jenis, window = PARAMETER_INDIKATOR[nama]
+        hasil = np.empty_like(terisi)
+        if jenis == 'SMA':
+            hitung_sma(terisi, window, hasil)
+        elif jenis == 'EMA':
+            hitung_ema(terisi, 2.0 / (window + 1), window, hasil)
+        else:
+            hitung_rsi(terisi, window, hasil)
+        hasil[nomor_bar < window - 1] = np.nan
+        nilai_indikator[nama] = hasil
+    return nilai_indikator
+
+# Menambahkan indikator teknikal
+def tambah_indikator(df, indikator=None):
+    """
+    Menambahkan indikator teknikal seperti SMA dan EMA
+    Hanya indikator yang dipilih yang dihitung; kolom ditambahkan langsung
+    ke df (tanpa menyalin seluruh frame).
+    Parameter:
+        df: DataFrame hasil olah_data
+        indikator: daftar pilihan dari PARAMETER_INDIKATOR, None = semua
+    """
+    if indikator is None:
+        indikator = list(PARAMETER_INDIKATOR)
+    dipilih = [PARAMETER_INDIKATOR[nama] for nama in indikator if nama in PARAMETER_INDIKATOR]
+    if not dipilih:
+        return df
+
+    harga_penutupan = df['Penutupan'].to_numpy(dtype=np.float64)
+
+    # Data dengan nilai kosong dihitung lewat library ta agar perilakunya tetap sama
+    if np.isnan(harga_penutupan).any():
+        import ta
+
+        seri_penutupan = df['Penutupan']
+        for kolom, jenis, window in dipilih:
+            if jenis == 'SMA':
+                df[kolom] = ta.trend.sma_indicator(seri_penutupan, window=window)
+            elif jenis == 'EMA':
+                df[kolom] = ta.trend.ema_indicator(seri_penutupan, window=window)
+            else:
+                df[kolom] = ta.momentum.rsi(seri_penutupan, window=window)
+        return df
+
+    # Satu array untuk semua hasil indikator, tiap indikator mengisi satu baris
+    hasil = np.empty((len(dipilih), len(harga_penutupan)))
+    for baris, (kolom, jenis, window) in zip(hasil, dipilih):
+        if jenis == 'SMA':
+            hitung_sma(harga_penutupan, window, baris)
+        elif jenis == 'EMA':
+            hitung_ema(harga_penutupan, 2.0 / (window + 1), window, baris)
+        else:
+            hitung_rsi(harga_penutupan, window, baris)
+        df[kolom] = baris
+
+    return df
+
+# Membuat status awal satu indikator dari seluruh riwayat harga
+def buat_status_kolom(harga, jenis, window, nilai):
+    """
+    Status indikator setelah memproses seluruh array harga
+    Parameter:
+        harga: array harga penutupan yang sudah diproses
+        jenis, window: parameter indikator
+        nilai: hasil indikator untuk array harga tersebut
+    """
+    n = len(harga)
+    if jenis == 'SMA':
+        # Jendela berupa ring buffer float64; posisi = tempat harga berikutnya
+        terakhir = harga[max(n - window, 0):]
+        jendela = np.zeros(window)
+        jendela[:len(terakhir)] = terakhir
+        return {
+            'jenis': jenis,
+            'window': window,
+            'jendela': jendela,
+            'posisi': len(terakhir) % window,
+            'terisi': len(terakhir),
+            'jumlah': float(sum(terakhir.tolist()))
+        }
+
+    if jenis == 'EMA':
+        alpha = 2.0 / (window + 1)
+        if n == 0:
+            terakhir = np.nan
+        elif n >= window:
+            terakhir = float(nilai[-1])
+        else:
+            terakhir = float(hitung_ema(harga, alpha, 1, np.empty(n))[-1])
+        return {'jenis': jenis, 'window': window, 'alpha': alpha, 'nilai': terakhir, 'jumlah_data': n}
+
+    # RSI: simpan rata-rata kenaikan dan penurunan (Wilder)
+    alpha = 1.0 / window
+    naik = turun = 0.0
+    if n > 1:
+        selisih = np.diff(harga, prepend=harga[0])
+        naik = float(hitung_ema(np.maximum(selisih, 0.0), alpha, 1, np.empty(n))[-1])
+        turun = float(hitung_ema(np.maximum(-selisih, 0.0), alpha, 1, np.empty(n))[-1])
+    return {
+        'jenis': jenis,
+        'window': window,
+        'alpha': alpha,
+        'naik': naik,
+        'turun': turun,
+        'harga_sebelumnya': float(harga[-1]) if n else np.nan,
+        'jumlah_data': n
+    }
+
+# Memproses satu bar baru pada status indikator (O(1))
+def langkah_indikator(status, harga):
+    """
+    Memperbarui status dengan satu harga baru dan mengembalikan nilai indikator
+    """
+    if status['jenis'] == 'SMA':
+        jendela, posisi, window = status['jendela'], status['posisi'], status['window']
+        if status['terisi'] == window:
+            status['jumlah'] -= float(jendela[posisi])
+        jendela[posisi] = harga
+        status['posisi'] = (posisi + 1) % window
+        status['terisi'] = min(status['terisi'] + 1, window)
+        status['jumlah'] += harga
+        return status['jumlah'] / window if status['terisi'] == window else np.nan
+
+    alpha = status['alpha']
+    if status['jenis'] == 'EMA':
+        if status['jumlah_data'] == 0:
+            status['nilai'] = harga
+        else:
+            status['nilai'] = alpha * harga + (1 - alpha) * status['nilai']
+        status['jumlah_data'] += 1
+        return status['nilai'] if status['jumlah_data'] >= status['window'] else np.nan
+
+    if status['jumlah_data'] > 0:
+        selisih = harga - status['harga_sebelumnya']
+        status['naik'] = alpha * max(selisih, 0.0) + (1 - alpha) * status['naik']
+        status['turun'] = alpha * max(-selisih, 0.0) + (1 - alpha) * status['turun']
+    status['harga_sebelumnya'] = harga
+    status['jumlah_data'] += 1
+    if status['jumlah_data'] < status['window']:
+        return np.nan
+    if status['turun'] == 0:
+        return 100.0
+    return 100 - 100 / (1 + status['naik'] / status['turun'])
+
+# Menambahkan indikator secara inkremental untuk pembaruan data live
+def tambah_indikator_inkremental(df, indikator, status=None):
+    """
+    Seperti tambah_indikator, tetapi juga mengembalikan status setiap indikator
+    sampai bar final terakhir (bar sebelum bar terakhir; bar terakhir bisa
+    masih berubah) sehingga pembaruan berikutnya hanya memproses bar baru.
+    Tanpa status, indikator yang dipilih dihitung penuh pada df. Dengan status,
+    df hanya berisi bar setelah bar final status (status['waktu']) dan semua
+    indikator di status dilanjutkan; indikator lain butuh riwayat penuh dan
+    tidak dihitung.
+    Parameter:
+        df: DataFrame hasil olah_data
+        indikator: daftar pilihan dari PARAMETER_INDIKATOR
+        status: status dari pemanggilan sebelumnya untuk seri yang sama (opsional)
+    Return:
+        (df dengan kolom indikator, status baru atau None jika tidak bisa
+        dilanjutkan), status = {'waktu': ns epoch UTC bar final,
+        'penutupan': harga penutupan bar final, 'langkah': {kolom: status kolom}}
+    """
+    harga = df['Penutupan'].to_numpy(dtype=np.float64)
+    waktu = pd.DatetimeIndex(df['Tanggal']).as_unit('ns').asi8
+    n = len(harga)
+
+    if status is None:
+        dipilih = [nama for nama in indikator if nama in PARAMETER_INDIKATOR]
+        df = tambah_indikator(df, dipilih)
+        if n < 2 or np.isnan(harga).any():
+            return df, None
+        langkah = {}
+        for nama in dipilih:
+            kolom, jenis, window = PARAMETER_INDIKATOR[nama]
+            langkah[kolom] = buat_status_kolom(harga[:n - 1], jenis, window, df[kolom].to_numpy()[:n - 1])
+        return df, {'waktu': int(waktu[n - 2]), 'penutupan': float(harga[n - 2]), 'langkah': langkah}
+
+    # Lanjutkan dari status lama: hanya bar df yang diproses; status baru
+    # diambil sebelum bar terakhir (bar final baru)
+    kerja = copy.deepcopy(status['langkah'])
+    langkah_baru = kerja
+    nilai = {kolom: np.empty(n) for kolom in kerja}
+    for i in range(n):
+        if i == n - 1:
+            langkah_baru = copy.deepcopy(kerja)
+        for kolom in kerja:
+            nilai[kolom][i] = langkah_indikator(kerja[kolom], float(harga[i]))
+    for kolom in kerja:
+        df[kolom] = nilai[kolom]
+
+    if n < 2:
+        return df, {**status, 'langkah': langkah_baru}
+    return df, {'waktu': int(waktu[n - 2]), 'penutupan': float(harga[n - 2]), 'langkah': langkah_baru}
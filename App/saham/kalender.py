@@ -0,0 +1,178 @@
+# Kalender bursa dan masa berlaku cache yang mengikuti jam perdagangan
+# Data dianggap basi tepat pada batas bar berikutnya selama sesi berjalan,
+# bar harian/mingguan sampai penutupan sesi berikutnya, dan tidak pernah
+# kedaluwarsa di akhir pekan atau hari libur bursa.
+
+import time
+
+import pandas as pd
+from pandas.tseries.holiday import (
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday
+)
+
+from .konfigurasi import MASA_BERLAKU_DATA, PENYEDIA_DATA, TTL_ADAPTIF, WAKTU_REPLAY
+from .resampel import MENIT_INTERVAL
+
+# Hari libur NYSE (sesi penuh); tahun baru di hari Sabtu tidak diganti hari Jumat
+LIBUR_NYSE = [
+    Holiday('Tahun Baru', month=1, day=1, observance=sunday_to_monday),
+    USMartinLutherKingJr,
+    USPresidentsDay,
+    GoodFriday,
+    USMemorialDay,
+    Holiday('Juneteenth', month=6, day=19, start_date='2022-06-19', observance=nearest_workday),
+    Holiday('Hari Kemerdekaan', month=7, day=4, observance=nearest_workday),
+    USLaborDay,
+    USThanksgivingDay,
+    Holiday('Natal', month=12, day=25, observance=nearest_workday)
+]
+
+# Sesi reguler per bursa: zona waktu, menit buka/tutup sejak tengah malam, aturan libur
+# IDX: libur nasional mengikuti kalender lunar dan tidak dihitung (hanya akhir pekan)
+# VALAS: diperdagangkan sepanjang hari kerja
+BURSA = {
+    'NYSE': {'zona': 'America/New_York', 'buka': 9 * 60 + 30, 'tutup': 16 * 60, 'libur': LIBUR_NYSE},
+    'IDX': {'zona': 'Asia/Jakarta', 'buka': 9 * 60, 'tutup': 16 * 60, 'libur': []},
+    'VALAS': {'zona': 'UTC', 'buka': 0, 'tutup': 24 * 60, 'libur': []}
+}
+
+# Jeda setelah penutupan (detik): satu pembaruan lagi untuk bar terakhir yang baru final
+TUNDA_PENUTUPAN = 15 * 60
+
+# Hari libur per (bursa, tahun), dihitung sekali
+_LIBUR = {}
+
+# Waktu "sekarang" untuk data pasar
+def waktu_pasar():
+    """
+    Jam yang dipakai untuk menentukan rentang data: SAHAM_REPLAY_WAKTU pada
+    penyedia replay (jika diisi), selain itu waktu nyata. Masa berlaku cache
+    tetap memakai waktu nyata (time.time()).
+    Return: pd.Timestamp UTC
+    """
+    if PENYEDIA_DATA == 'replay' and WAKTU_REPLAY:
+        sekarang = pd.Timestamp(WAKTU_REPLAY)
+        return sekarang.tz_localize('UTC') if sekarang.tzinfo is None else sekarang.tz_convert('UTC')
+    return pd.Timestamp.now(tz='UTC')
+
+# Menentukan bursa sebuah ticker dari akhirannya
+def bursa_simbol(simbol):
+    simbol = simbol.strip().upper()
+    if simbol.endswith('.JK'):
+        return 'IDX'
+    if simbol.endswith('=X'):
+        return 'VALAS'
+    return 'NYSE'
+
+# Mengecek apakah tanggal lokal bursa adalah hari perdagangan
+def hari_bursa(bursa, tanggal):
+    """
+    Parameter:
+        bursa: kunci BURSA
+        tanggal: pd.Timestamp tanpa zona (tengah malam waktu lokal bursa)
+    """
+    if tanggal.dayofweek >= 5:
+        return False
+    kunci = (bursa, tanggal.year)
+    if kunci not in _LIBUR:
+        awal, akhir = f'{tanggal.year}-01-01', f'{tanggal.year}-12-31'
+        _LIBUR[kunci] = {
+            hari for aturan in BURSA[bursa]['libur']
+            for hari in aturan.dates(awal, akhir)
+        }
+    return tanggal not in _LIBUR[kunci]
+
+# Mencari sesi yang sedang berjalan atau sesi berikutnya
+def sesi_berikutnya(bursa, waktu):
+    """
+    Sesi pertama yang belum selesai (termasuk TUNDA_PENUTUPAN) pada waktu tersebut
+    Parameter:
+        bursa: kunci BURSA
+        waktu: detik epoch UTC
+    Return: (buka, tutup) dalam detik epoch UTC
+    """
+    jadwal = BURSA[bursa]
+    tanggal = pd.Timestamp(waktu, unit='s', tz='UTC').tz_convert(jadwal['zona']).normalize().tz_localize(None)
+    for _ in range(30):
+        if hari_bursa(bursa, tanggal):
+            buka, tutup = (
+                (tanggal + pd.Timedelta(minutes=menit)).tz_localize(jadwal['zona']).timestamp()
+                for menit in (jadwal['buka'], jadwal['tutup'])
+            )
+            if tutup + TUNDA_PENUTUPAN > waktu:
+                return buka, tutup
+        tanggal += pd.Timedelta(days=1)
+    raise ValueError(f'Tidak ada sesi {bursa} dalam 30 hari setelah {waktu}')
+
+# Mengecek apakah sesi reguler bursa ticker sedang berjalan
+def sedang_buka(simbol, waktu):
+    buka, tutup = sesi_berikutnya(bursa_simbol(simbol), waktu)
+    return buka <= waktu < tutup
+
+# Menghitung kapan data sebuah ticker/interval perlu diperbarui
+def berlaku_sampai(simbol, interval, diambil, masa_berlaku=None):
+    """
+    - interval intraday: batas bar berikutnya selama sesi berjalan (bar dihitung
+      dari jam buka); sebelum sesi sampai jam buka; setelah tutup satu pembaruan
+      lagi pada tutup + TUNDA_PENUTUPAN
+    - harian/mingguan/bulanan: penutupan sesi berikutnya + TUNDA_PENUTUPAN
+    Akhir pekan dan hari libur dilewati. Tanpa TTL_ADAPTIF: diambil + MASA_BERLAKU_DATA.
+    Parameter:
+        diambil: waktu data diambil (detik epoch UTC)
+        masa_berlaku: batas umur (detik) selama sesi berjalan, misalnya untuk
+                      mode live; di luar sesi tetap mengikuti kalender
+    Return: detik epoch UTC
+    """
+    if not TTL_ADAPTIF:
+        return diambil + (masa_berlaku or MASA_BERLAKU_DATA.get(interval, 300))
+
+    buka, tutup = sesi_berikutnya(bursa_simbol(simbol), diambil)
+    if diambil >= tutup:
+        return tutup + TUNDA_PENUTUPAN
+    menit = MENIT_INTERVAL.get(interval)
+    if diambil < buka:
+        return buka if menit is not None or masa_berlaku else tutup + TUNDA_PENUTUPAN
+
+    if menit is None:
+        batas = tutup + TUNDA_PENUTUPAN
+    else:
+        langkah = menit * 60
+        batas = min(buka + ((diambil - buka) // langkah + 1) * langkah, tutup)
+    if masa_berlaku:
+        batas = min(batas, diambil + masa_berlaku)
+    return batas
+
+# Mengecek apakah data yang diambil pada waktu tertentu masih berlaku
+def masih_berlaku(simbol, interval, diambil, masa_berlaku=None, sekarang=None):
+    """
+    Parameter:
+        masa_berlaku: lihat berlaku_sampai
+        sekarang: detik epoch UTC, default time.time()
+    """
+    sekarang = time.time() if sekarang is None else sekarang
+    return sekarang < berlaku_sampai(simbol, interval, diambil, masa_berlaku)
+
+# Batas berlaku bersama untuk beberapa ticker, dipakai sebagai bagian kunci cache
+def batas_berlaku(daftar_simbol, interval, masa_berlaku=None, sekarang=None):
+    """
+    Batas paling awal di antara semua ticker. Nilainya tetap sampai batas itu
+    lewat, sehingga entri st.cache_data dengan argumen ini berganti tepat di
+    batas bar (atau setiap kelipatan masa_berlaku selama sesi berjalan).
+    """
+    sekarang = time.time() if sekarang is None else sekarang
+    if not TTL_ADAPTIF:
+        masa = masa_berlaku or MASA_BERLAKU_DATA.get(interval, 300)
+        return (sekarang // masa + 1) * masa
+
+    batas = min((berlaku_sampai(simbol, interval, sekarang) for simbol in daftar_simbol), default=0)
+    if masa_berlaku and any(sedang_buka(simbol, sekarang) for simbol in daftar_simbol):
+        batas = min(batas, (sekarang // masa_berlaku + 1) * masa_berlaku)
+    return batas
@@ -0,0 +1,129 @@
+# Konfigurasi dashboard saham
+# Semua nilai yang bisa diatur lewat environment variable dikumpulkan di sini
+
+import os
+
+# Konstanta kurs USD ke IDR (bisa diupdate secara real-time)
+KURS_USD_IDR = 15700  # Default rate, akan diupdate secara otomatis
+
+# Lokasi database lokal untuk menyimpan data OHLCV antar restart server
+LOKASI_DATABASE = os.environ.get(
+    'SAHAM_DB_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data_saham.db')
+)
+
+# Berapa lama (detik) data tersimpan dianggap masih baru sebelum dicek ulang ke Yahoo
+MASA_BERLAKU_DATA = {
+    '1m': 60,
+    '5m': 300,
+    '30m': 1800,
+    '1h': 3600,
+    '1d': 3600,
+    '1wk': 6 * 3600,
+    '1mo': 6 * 3600
+}
+
+# Masa berlaku mengikuti jam bursa (kalender.py); '0' = selalu pakai MASA_BERLAKU_DATA
+TTL_ADAPTIF = os.environ.get('SAHAM_TTL_ADAPTIF', '1') == '1'
+
+# Batas riwayat data intraday yang disediakan Yahoo (hari)
+BATAS_HARI_INTRADAY = {
+    '1m': 7,
+    '5m': 59,
+    '30m': 59,
+    '1h': 729
+}
+
+# Interval yang dibentuk secara lokal dari interval yang lebih halus (lihat resampel.py)
+SUMBER_INTERVAL = {
+    '30m': '5m',
+    '1wk': '1d',
+    '1mo': '1d'
+}
+
+# Periode yang langsung diunduh untuk interval sumber, agar pergantian periode
+# yang memakai interval itu (1 Hari <-> 1 Minggu, 1 Bulan <-> Maksimal) tidak perlu unduhan baru
+PERIODE_UNDUH_SUMBER = {
+    '5m': '1minggu',
+    '1d': 'max'
+}
+
+# Perkiraan cakupan setiap periode (hari), untuk tahu kapan data lama perlu dilengkapi
+CAKUPAN_PERIODE = {
+    '1d': 1,
+    '5d': 5,
+    '1minggu': 7,
+    '1mo': 31,
+    '3mo': 92,
+    '6mo': 183,
+    '1y': 366,
+    'ytd': 366,
+    '2y': 731,
+    '5y': 1827,
+    '10y': 3653,
+    'max': float('inf')
+}
+
+# Penyedia data pasar: 'yfinance' (default) atau 'replay' (offline, deterministik)
+PENYEDIA_DATA = os.environ.get('SAHAM_PENYEDIA_DATA', 'yfinance')
+
+# Pengaturan penyedia replay
+LOKASI_REPLAY = os.environ.get('SAHAM_REPLAY_DIR', '')  # folder rekaman CSV {SIMBOL}_{interval}.csv
+LATENSI_REPLAY = float(os.environ.get('SAHAM_REPLAY_LATENSI', '0'))  # jeda buatan per permintaan (detik)
+WAKTU_REPLAY = os.environ.get('SAHAM_REPLAY_WAKTU', '')  # waktu "sekarang" tetap, kosong = waktu nyata
+
+# Batas waktu (detik) untuk setiap unduhan dalam satu kali render halaman,
+# dihitung sejak unduhan mulai berjalan di thread pool (bukan sejak dikirim)
+BATAS_WAKTU_UNDUH = {
+    'kurs': 10,
+    'data': 30,
+    'watchlist': 15,
+    'penyaring': 300
+}
+
+# Batas waktu (detik) sebuah unduhan boleh menunggu giliran di antrean thread pool
+BATAS_TUNGGU_ANTREAN = float(os.environ.get('SAHAM_BATAS_TUNGGU_ANTREAN', '120'))
+
+# Folder daftar ticker untuk penyaring: satu file .txt per semesta (misalnya lq45.txt)
+LOKASI_SEMESTA = os.environ.get(
+    'SAHAM_SEMESTA_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'semesta')
+)
+
+# Daftar pantauan bawaan di panel samping
+DAFTAR_PANTAUAN_AWAL = 'AAPL, GOOGL, MSFT, AMZN, TSLA'
+
+# Instrumentasi: port endpoint /metrics (kosong = mati), alamat bind-nya dan
+# pengukuran ukuran payload grafik. Endpoint tanpa autentikasi, jadi defaultnya
+# hanya bisa dijangkau dari mesin yang sama; isi 0.0.0.0 agar Prometheus di
+# mesin lain bisa membaca (lindungi dengan firewall/jaringan internal).
+PORT_METRIK = os.environ.get('SAHAM_PORT_METRIK', '')
+ALAMAT_METRIK = os.environ.get('SAHAM_ALAMAT_METRIK', '127.0.0.1')
+UKUR_PAYLOAD = os.environ.get('SAHAM_UKUR_PAYLOAD', '') == '1'
+
+# Batas bucket histogram durasi (detik), mengikuti bucket bawaan Prometheus
+BUCKET_DURASI = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+# Batas memori untuk frame olahan yang disimpan bersama (MB)
+BATAS_MEMORI_DATA_MB = float(os.environ.get('SAHAM_BATAS_MEMORI_MB', '512'))
+
+# Mode ringkas: frame olahan disimpan dengan float32, volume unsigned dan waktu epoch int64
+MODE_RINGKAS = os.environ.get('SAHAM_MODE_RINGKAS', '') == '1'
+
+# Nilai awal pilihan grafik ringan (WebGL, satu figure bersubplot, array ringkas)
+GRAFIK_RINGAN = os.environ.get('SAHAM_GRAFIK_RINGAN', '') == '1'
+
+# Lebar grafik harga saat dirender selebar halaman (piksel); batas titik
+# downsampling diturunkan dari nilai ini (grafik.py)
+LEBAR_GRAFIK_PIKSEL = int(os.environ.get('SAHAM_LEBAR_GRAFIK', '1200'))
+
+# Pemanasan latar belakang (pemanasan.py): ticker yang selalu dipanaskan, jumlah
+# ticker maksimal (termasuk yang terpopuler menurut permintaan) dan batas laju tugas
+PEMANASAN_AKTIF = os.environ.get('SAHAM_PEMANASAN', '1') == '1'
+TICKER_POPULER = [
+    s.strip().upper()
+    for s in os.environ.get('SAHAM_TICKER_POPULER', 'AAPL, MSFT, GOOGL, AMZN, NVDA, TSLA, META').split(',')
+    if s.strip()
+]
+JUMLAH_TICKER_PEMANASAN = int(os.environ.get('SAHAM_JUMLAH_TICKER_PEMANASAN', '20'))
+BATAS_PEMANASAN_PER_MENIT = float(os.environ.get('SAHAM_PEMANASAN_PER_MENIT', '30'))
@@ -0,0 +1,83 @@
+# Kurs USD/IDR: riwayat kurs per interval dan konversi IDR per bar
+# Riwayat IDR=X disimpan di database lokal yang sama dengan data saham sehingga
+# hanya bar baru yang diunduh ulang.
+
+import numpy as np
+
+from .konfigurasi import KURS_USD_IDR
+from .metrik import catat_cache
+from .pengambilan import ambil_data_saham
+from .pemrosesan import waktu_epoch_ns
+
+# Ticker Yahoo untuk kurs USD/IDR
+SIMBOL_KURS = 'IDR=X'
+
+# Kolom yang ikut dikonversi ke IDR (RSI tidak bersatuan harga)
+KOLOM_RUPIAH = ['Pembukaan', 'Tertinggi', 'Terendah', 'Penutupan', 'SMA_20', 'SMA_50', 'EMA_20', 'EMA_50']
+
+# Fungsi untuk mendapatkan kurs USD/IDR terkini
+def ambil_kurs_usd_idr(batas_berlaku=None):
+    """
+    Mengambil kurs USD/IDR terkini dari riwayat kurs 5 menit
+    Aplikasi membungkus fungsi ini dengan st.cache_data.
+    Parameter:
+        batas_berlaku: hanya bagian kunci cache (kalender.batas_berlaku),
+                       tidak dipakai di dalam fungsi
+    """
+    catat_cache('kurs', 'miss')  # Isi fungsi hanya berjalan jika cache kosong/kedaluwarsa
+    try:
+        riwayat = ambil_data_saham(SIMBOL_KURS, '1d', '5m')
+        if not riwayat.empty:
+            return float(riwayat['Close'].iloc[-1])
+        else:
+            return KURS_USD_IDR  # fallback ke default
+    except:
+        return KURS_USD_IDR  # fallback ke default
+
+# Mengambil riwayat kurs untuk periode dan interval tertentu
+def ambil_riwayat_kurs(periode, interval):
+    """
+    Return:
+        (waktu int64 ns epoch UTC, kurs float64), atau None jika tidak tersedia
+    """
+    try:
+        riwayat = ambil_data_saham(SIMBOL_KURS, periode, interval)
+    except Exception:
+        return None
+    riwayat = riwayat.dropna(subset=['Close'])
+    if riwayat.empty:
+        return None
+    return riwayat.index.as_unit('ns').asi8, riwayat['Close'].to_numpy(dtype=np.float64)
+
+# Mencari kurs yang berlaku pada setiap waktu (as-of join)
+def kurs_per_bar(waktu_ns, riwayat):
+    """
+    Kurs dari bar kurs terakhir yang waktunya <= waktu bar saham
+    Bar saham sebelum data kurs pertama memakai kurs pertama.
+    """
+    waktu_kurs, kurs = riwayat
+    posisi = np.searchsorted(waktu_kurs, waktu_ns, side='right') - 1
+    return kurs[np.clip(posisi, 0, len(kurs) - 1)]
+
+# Menambahkan kolom Kurs ke frame olahan
+def tambah_kurs(df, riwayat):
+    """
+    Kolom Kurs berisi kurs USD/IDR pada waktu setiap bar; kolom ditambahkan
+    langsung ke df. Tanpa riwayat kurs, df dikembalikan apa adanya.
+    """
+    if riwayat is not None and len(df):
+        df['Kurs'] = kurs_per_bar(waktu_epoch_ns(df), riwayat)
+    return df
+
+# Membuat frame dengan harga dan indikator dalam IDR
+def frame_idr(df, kurs):
+    """
+    Kolom harga dan SMA/EMA dikalikan kurs per bar (kolom Kurs) atau kurs
+    tunggal jika kolom itu tidak ada. Frame asli tidak diubah.
+    """
+    kurs_bar = df['Kurs'].to_numpy() if 'Kurs' in df.columns else kurs
+    hasil = df.copy(deep=False)
+    for kolom in KOLOM_RUPIAH:
+        if kolom in df.columns:
+            hasil[kolom] = df[kolom].to_numpy() * kurs_bar
+    return hasil
@@ -0,0 +1,287 @@
+# Layanan data bersama: frame olahan dipakai semua sesi dalam satu proses server
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+
+from .indikator import PARAMETER_INDIKATOR, tambah_indikator, tambah_indikator_inkremental
+from .kalender import masih_berlaku
+from .konfigurasi import BATAS_MEMORI_DATA_MB, MODE_RINGKAS
+from .kurs import ambil_riwayat_kurs, tambah_kurs
+from .metrik import catat_cache, ukur_tahap
+from .pemrosesan import KOLOM_INDIKATOR, frame_ringkas, olah_data, ringkas_frame, waktu_epoch_ns
+from .pengambilan import ambil_data_saham, baca_data_lokal
+from .penyimpanan import posisi_awal_periode, waktu_utc_ns
+
+# Frame olahan (LRU dengan batas memori) beserta status indikatornya, dan
+# unduhan yang sedang berjalan, dipakai bersama oleh semua sesi
+_LAYANAN = {
+    'kunci': threading.Lock(),
+    'lru': OrderedDict(),  # {(simbol, periode, interval): entri}
+    'byte': 0,
+    'sedang_jalan': {}  # {(simbol, periode, interval): Future}
+}
+
+# Batas waktu bawah untuk membaca seluruh riwayat tersimpan (ns epoch UTC)
+SELURUH_RIWAYAT = -2**63
+
+# Layanan data bersama untuk semua sesi dalam satu proses server
+def layanan_data():
+    return _LAYANAN
+
+# Mengukur memori sebuah frame olahan (seluruh kolomnya dimiliki entri LRU)
+def ukuran_frame(df):
+    return int(df.memory_usage(deep=True, index=True).sum()) if df is not None else 0
+
+# Mengukur memori status indikator
+def ukuran_status(status):
+    """
+    Status tidak memuat array per bar (waktu dan nilai indikator ada di frame),
+    hanya dict kecil per kolom dan jendela SMA (array float64 sepanjang window)
+    """
+    if status is None:
+        return 0
+    byte = sys.getsizeof(status) + sys.getsizeof(status['langkah'])
+    for langkah in status['langkah'].values():
+        byte += sys.getsizeof(langkah) + (langkah['jendela'].nbytes if 'jendela' in langkah else 0)
+    return byte
+
+# Menyimpan frame ke LRU dan membuang entri lama jika melewati batas memori
+def simpan_ke_lru(layanan, kunci, data, status):
+    """
+    Harus dipanggil saat layanan['kunci'] sedang dipegang
+    Return: entri baru {'data', 'status', 'waktu', 'byte'}
+    """
+    lama = layanan['lru'].pop(kunci, None)
+    if lama is not None:
+        layanan['byte'] -= lama['byte']
+
+    entri = {'data': data, 'status': status, 'waktu': time.time(), 'byte': ukuran_frame(data) + ukuran_status(status)}
+    layanan['lru'][kunci] = entri
+    layanan['byte'] += entri['byte']
+
+    batas_byte = BATAS_MEMORI_DATA_MB * 2**20
+    while layanan['byte'] > batas_byte and len(layanan['lru']) > 1:
+        _, dibuang = layanan['lru'].popitem(last=False)
+        layanan['byte'] -= dibuang['byte']
+    return entri
+
+# Menambahkan kurs per bar dan meringkas frame olahan baru
+def selesaikan_frame(data, riwayat_kurs):
+    """
+    Menambahkan kolom Kurs dan, pada MODE_RINGKAS, mengubah frame ke
+    representasi ringkas (ringkas_frame)
+    """
+    with ukur_tahap('kurs_per_bar', len(data)):
+        data = tambah_kurs(data, riwayat_kurs)
+    if MODE_RINGKAS:
+        with ukur_tahap('ringkas_frame', len(data)):
+            data = ringkas_frame(data)
+    return data
+
+# Mengunduh dan mengolah satu ticker (dipanggil sekali untuk semua sesi)
+def muat_data_olahan(simbol, periode, interval, masa_berlaku=None, indikator=(), entri_lama=None):
+    """
+    Unduh, olah_data, hitung indikator yang diminta, lalu tambah kolom Kurs
+    (kurs USD/IDR per bar dari riwayat kurs interval yang sama)
+    Indikator dihitung pada seluruh riwayat tersimpan, sebelum dipotong per
+    periode, sehingga periode bergulir (1mo, 1y) juga bisa dilanjutkan:
+    - entri lama dengan status: hanya bar setelah bar final status yang dibaca
+      dari database; indikator di status dilanjutkan untuk bar itu saja lalu
+      digabung dengan frame lama
+    - selain itu (atau jika bar final status sudah berubah, misalnya setelah
+      split): seluruh riwayat dibaca dan indikator yang diminta dihitung penuh
+    Hasil dipotong ke periode (posisi_awal_periode) dan hanya potongan itu
+    yang disimpan. Pada MODE_RINGKAS frame disimpan dalam representasi ringkas.
+    Return: (DataFrame olahan, status indikator), atau (None, None) jika data tidak ditemukan
+    """
+    status_lama = entri_lama['status'] if entri_lama is not None else None
+    if status_lama is not None:
+        basis = ambil_data_saham(simbol, periode, interval, masa_berlaku, status_lama['waktu'])
+        bisa_lanjut = (
+            len(basis) >= 2
+            and waktu_utc_ns(basis.index[:1])[0] == status_lama['waktu']
+            and basis['Close'].iat[0] == status_lama['penutupan']
+        )
+        if bisa_lanjut:
+            return lanjutkan_data_olahan(simbol, periode, interval, entri_lama, basis.iloc[1:])
+
+    basis = ambil_data_saham(simbol, periode, interval, masa_berlaku, SELURUH_RIWAYAT)
+    if basis.empty:
+        return None, None
+
+    with ukur_tahap('olah_data', len(basis)):
+        data = olah_data(basis)
+
+    with ukur_tahap('tambah_indikator', len(data)):
+        data, status = tambah_indikator_inkremental(data, indikator)
+
+    # Potongan periode disalin agar frame di LRU tidak menahan seluruh riwayat
+    awal = posisi_awal_periode(basis.index, periode, simbol)
+    data = data.iloc[awal:].reset_index(drop=True)
+    if awal:
+        data = data.copy()
+    return selesaikan_frame(data, ambil_riwayat_kurs(periode, interval)), status
+
+# Melanjutkan frame olahan lama dengan bar baru
+def lanjutkan_data_olahan(simbol, periode, interval, entri_lama, bar_baru):
+    """
+    Bar setelah bar final status lama diolah dan indikatornya dilanjutkan
+    (tambah_indikator_inkremental), lalu digabung dengan baris frame lama
+    sampai bar final tersebut. Kolom indikator tanpa status tidak dibawa;
+    kolom itu dihitung ulang saat diminta (lengkapi_indikator).
+    Return: (DataFrame olahan, status indikator)
+    """
+    with ukur_tahap('olah_data', len(bar_baru)):
+        baru = olah_data(bar_baru)
+    with ukur_tahap('tambah_indikator', len(baru)):
+        baru, status = tambah_indikator_inkremental(baru, (), entri_lama['status'])
+    baru = selesaikan_frame(baru, ambil_riwayat_kurs(periode, interval))
+
+    lama = entri_lama['data']
+    kolom = [k for k in lama.columns if k not in KOLOM_INDIKATOR or k in status['langkah']]
+    waktu_lama = waktu_epoch_ns(lama)
+    akhir = int(np.searchsorted(waktu_lama, entri_lama['status']['waktu'], side='right'))
+    waktu = np.concatenate([waktu_lama[:akhir], waktu_epoch_ns(baru)])
+    awal = posisi_awal_periode(pd.to_datetime(waktu, utc=True), periode, simbol)
+
+    data = pd.concat([lama.iloc[min(awal, akhir):akhir][kolom], baru.iloc[max(awal - akhir, 0):]], ignore_index=True)
+    return data, status
+
+# Melengkapi frame di LRU dengan indikator yang belum pernah dihitung
+def lengkapi_indikator(layanan, kunci, entri, indikator):
+    """
+    Setiap kolom indikator dihitung sekali per frame lalu disimpan di entri,
+    sehingga sesi lain yang memilih indikator yang sama langsung memakainya.
+    Dihitung dari seluruh riwayat tersimpan (baca_data_lokal, tanpa unduhan)
+    sampai bar terakhir frame, sama seperti muat_data_olahan, dan statusnya
+    ikut disimpan untuk lanjutan berikutnya. Jika riwayat tersimpan sudah
+    tidak cocok dengan frame, kolom dihitung pada frame ini saja tanpa status.
+    Entri mendapat frame baru (salinan dangkal + kolom baru); frame lama yang
+    sedang dibaca sesi lain tidak diubah.
+    Return: DataFrame olahan dengan semua indikator yang diminta
+    """
+    kurang = [
+        nama for nama in indikator
+        if nama in PARAMETER_INDIKATOR and PARAMETER_INDIKATOR[nama][0] not in entri['data'].columns
+    ]
+    if not kurang:
+        return entri['data']
+
+    data = entri['data']
+    status = entri['status']
+    waktu = waktu_epoch_ns(data)
+    n = len(waktu)
+    basis = baca_data_lokal(kunci[0], kunci[1], kunci[2], SELURUH_RIWAYAT)
+    waktu_basis = waktu_utc_ns(basis.index)
+    akhir = int(np.searchsorted(waktu_basis, waktu[-1], side='right'))
+
+    with ukur_tahap('tambah_indikator', akhir):
+        if status is not None and akhir >= n and np.array_equal(waktu_basis[akhir - n:akhir], waktu):
+            # Bar terakhir frame bisa belum final: pakai harga yang ada di frame
+            harga = basis['Close'].to_numpy(dtype=np.float64)[:akhir].copy()
+            harga[-1] = float(data['Penutupan'].iat[-1])
+            seri = pd.DataFrame({'Tanggal': waktu_basis[:akhir], 'Penutupan': harga}, copy=False)
+            seri, status_seri = tambah_indikator_inkremental(seri, kurang)
+            langkah = status_seri['langkah'] if status_seri is not None and status_seri['waktu'] == status['waktu'] else {}
+            seri = seri.iloc[akhir - n:]
+        else:
+            seri = tambah_indikator(pd.DataFrame({'Penutupan': data['Penutupan'].to_numpy(dtype=np.float64)}), kurang)
+            langkah = {}
+
+    with layanan['kunci']:
+        # Kolom ditambahkan ke frame terkini entri agar kolom dari sesi lain tidak hilang
+        data = entri['data'].copy(deep=False)
+        for nama in kurang:
+            kolom = PARAMETER_INDIKATOR[nama][0]
+            if kolom not in data.columns:
+                nilai = seri[kolom].to_numpy()
+                data[kolom] = nilai.astype(np.float32) if frame_ringkas(data) else nilai
+        entri['data'] = data
+        if entri['status'] is not None:
+            entri['status'] = {**entri['status'], 'langkah': {**entri['status']['langkah'], **langkah}}
+        if layanan['lru'].get(kunci) is entri:
+            byte = ukuran_frame(data) + ukuran_status(entri['status'])
+            layanan['byte'] += byte - entri['byte']
+            entri['byte'] = byte
+    return data
+
+# Mengambil frame olahan lewat layanan bersama
+def ambil_data_olahan(simbol, periode, interval, masa_berlaku=None, indikator=()):
+    """
+    Frame hasil olah_data + indikator yang diminta, dipakai bersama antar sesi
+    - Frame yang masih berlaku (kalender.masih_berlaku) langsung diambil dari memori
+    - Permintaan identik yang datang bersamaan menunggu satu unduhan yang sama
+    - Hanya indikator yang diminta yang dihitung; kolom yang sudah dihitung
+      sesi lain untuk frame yang sama dipakai ulang (lihat lengkapi_indikator)
+    masa_berlaku (detik) menggantikan kebijakan jam bursa, misalnya untuk mode live.
+    Frame yang dikembalikan dipakai bersama: jangan diubah di tempat.
+    """
+    layanan = layanan_data()
+    kunci = (simbol.strip().upper(), periode, interval)
+    catat_cache('data_olahan', 'permintaan')
+
+    with layanan['kunci']:
+        entri = layanan['lru'].get(kunci)
+        if entri is not None and masih_berlaku(kunci[0], interval, entri['waktu'], masa_berlaku):
+            layanan['lru'].move_to_end(kunci)
+            future = None
+        else:
+            # Frame lama dengan kunci yang sama dipakai untuk lanjutan inkremental
+            entri_lama = entri
+            future = layanan['sedang_jalan'].get(kunci)
+            pemilik = future is None
+            if pemilik:
+                future = Future()
+                layanan['sedang_jalan'][kunci] = future
+
+    if future is not None:
+        if not pemilik:
+            # Sesi lain sedang mengunduh data yang sama: tunggu hasilnya
+            catat_cache('data_olahan_gabung', 'permintaan')
+            entri = future.result()
+        else:
+            catat_cache('data_olahan', 'miss')
+            try:
+                data, status = muat_data_olahan(kunci[0], periode, interval, masa_berlaku, indikator, entri_lama)
+            except Exception as galat:
+                with layanan['kunci']:
+                    layanan['sedang_jalan'].pop(kunci, None)
+                future.set_exception(galat)
+                raise
+
+            with layanan['kunci']:
+                entri = simpan_ke_lru(layanan, kunci, data, status) if data is not None else None
+                layanan['sedang_jalan'].pop(kunci, None)
+            future.set_result(entri)
+
+    if entri is None:
+        return None
+    return lengkapi_indikator(layanan, kunci, entri, indikator)
+
+# Menambahkan indikator yang baru dipilih pada frame olahan yang sudah dimuat sesi
+def lengkapi_data_olahan(simbol, periode, interval, data, indikator):
+    """
+    Jika frame sesi masih sama dengan frame di LRU, kolom diambil/dihitung
+    lewat lengkapi_indikator (dipakai bersama antar sesi); jika frame di LRU
+    sudah diperbarui, kolom dihitung pada salinan dangkal frame sesi saja.
+    Return: DataFrame dengan semua indikator yang diminta
+    """
+    layanan = layanan_data()
+    kunci = (simbol.strip().upper(), periode, interval)
+    with layanan['kunci']:
+        entri = layanan['lru'].get(kunci)
+        sama = (
+            entri is not None
+            and len(entri['data']) == len(data)
+            and np.array_equal(waktu_epoch_ns(entri['data'])[-1:], waktu_epoch_ns(data)[-1:])
+        )
+    if sama:
+        return lengkapi_indikator(layanan, kunci, entri, indikator)
+    with ukur_tahap('tambah_indikator', len(data)):
+        return tambah_indikator(data.copy(deep=False), indikator)
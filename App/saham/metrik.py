@@ -0,0 +1,202 @@
+# Instrumentasi: durasi tahap, ukuran payload, statistik cache dan ekspor Prometheus
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from .konfigurasi import ALAMAT_METRIK, BUCKET_DURASI
+
+# Penyimpanan metrik per proses server, dipakai bersama oleh semua sesi
+_REGISTRI = {
+    'kunci': threading.Lock(),
+    'tahap': {},
+    'payload': {},
+    'cache': {},
+    'gauge': {}
+}
+
+# Server /metrics yang sudah berjalan, per (alamat, port)
+_SERVER_METRIK = {}
+_KUNCI_SERVER = threading.Lock()
+
+# Mengambil registri metrik proses ini
+def registri_metrik():
+    """
+    Metrik per proses server: durasi tahap, baris diproses, byte payload, cache
+    """
+    return _REGISTRI
+
+# Mencatat durasi satu tahap
+def catat_tahap(tahap, durasi, baris=None):
+    """
+    Parameter:
+        tahap: nama tahap (unduh, olah_data, tambah_indikator, ...)
+        durasi: waktu dalam detik
+        baris: jumlah baris yang diproses (opsional)
+    """
+    registri = registri_metrik()
+    with registri['kunci']:
+        data_tahap = registri['tahap'].setdefault(tahap, {
+            'bucket': [0] * len(BUCKET_DURASI),
+            'jumlah_detik': 0.0,
+            'hitungan': 0,
+            'baris': 0,
+            'sampel': deque(maxlen=1000)
+        })
+        for i, batas in enumerate(BUCKET_DURASI):
+            if durasi <= batas:
+                data_tahap['bucket'][i] += 1
+        data_tahap['jumlah_detik'] += durasi
+        data_tahap['hitungan'] += 1
+        data_tahap['sampel'].append(durasi)
+        if baris is not None:
+            data_tahap['baris'] += int(baris)
+
+# Mengukur waktu sebuah blok kode
+@contextmanager
+def ukur_tahap(tahap, baris=None):
+    """
+    Contoh:
+        with ukur_tahap('olah_data', len(data)):
+            data = olah_data(data)
+    """
+    mulai = time.perf_counter()
+    try:
+        yield
+    finally:
+        catat_tahap(tahap, time.perf_counter() - mulai, baris)
+
+# Mencatat ukuran payload grafik yang dikirim ke browser
+def catat_payload(grafik, jumlah_byte):
+    registri = registri_metrik()
+    with registri['kunci']:
+        data_payload = registri['payload'].setdefault(grafik, {'byte': 0, 'hitungan': 0})
+        data_payload['byte'] += int(jumlah_byte)
+        data_payload['hitungan'] += 1
+
+# Mencatat permintaan atau miss sebuah cache
+def catat_cache(cache, jenis):
+    """
+    Parameter:
+        cache: nama cache (kurs, watchlist, penyimpanan)
+        jenis: 'permintaan' setiap kali dipanggil, 'miss' jika harus mengambil ke sumber
+    """
+    registri = registri_metrik()
+    with registri['kunci']:
+        data_cache = registri['cache'].setdefault(cache, {'permintaan': 0, 'miss': 0})
+        data_cache[jenis] += 1
+
+# Mencatat nilai terkini sebuah gauge (misalnya kedalaman antrean pemanasan)
+def atur_gauge(nama, nilai):
+    registri = registri_metrik()
+    with registri['kunci']:
+        registri['gauge'][nama] = nilai
+
+# Ringkasan metrik untuk panel debug
+def ringkasan_metrik():
+    """
+    Return: (DataFrame per tahap dengan p50/p95, DataFrame cache)
+    """
+    registri = registri_metrik()
+    with registri['kunci']:
+        baris_tahap = []
+        for tahap, data_tahap in registri['tahap'].items():
+            sampel = np.array(data_tahap['sampel'])
+            baris_tahap.append({
+                'Tahap': tahap,
+                'Jumlah': data_tahap['hitungan'],
+                'p50 (ms)': np.percentile(sampel, 50) * 1000,
+                'p95 (ms)': np.percentile(sampel, 95) * 1000,
+                'Total (s)': data_tahap['jumlah_detik'],
+                'Baris': data_tahap['baris'],
+                'Payload (byte)': registri['payload'].get(tahap, {}).get('byte', 0)
+            })
+        baris_cache = [
+            {
+                'Cache': cache,
+                'Hit': data_cache['permintaan'] - data_cache['miss'],
+                'Miss': data_cache['miss']
+            }
+            for cache, data_cache in registri['cache'].items()
+        ]
+    return pd.DataFrame(baris_tahap), pd.DataFrame(baris_cache)
+
+# Mengekspor metrik dalam format teks Prometheus
+def ekspor_prometheus(registri=None):
+    """
+    Format teks exposition Prometheus (versi 0.0.4)
+    """
+    registri = registri or registri_metrik()
+    baris = []
+    with registri['kunci']:
+        baris.append('# HELP saham_tahap_durasi_detik Durasi setiap tahap pemrosesan dashboard')
+        baris.append('# TYPE saham_tahap_durasi_detik histogram')
+        for tahap, data_tahap in sorted(registri['tahap'].items()):
+            for batas, jumlah in zip(BUCKET_DURASI, data_tahap['bucket']):
+                baris.append(f'saham_tahap_durasi_detik_bucket{{tahap="{tahap}",le="{batas}"}} {jumlah}')
+            baris.append(f'saham_tahap_durasi_detik_bucket{{tahap="{tahap}",le="+Inf"}} {data_tahap["hitungan"]}')
+            baris.append(f'saham_tahap_durasi_detik_sum{{tahap="{tahap}"}} {data_tahap["jumlah_detik"]}')
+            baris.append(f'saham_tahap_durasi_detik_count{{tahap="{tahap}"}} {data_tahap["hitungan"]}')
+
+        baris.append('# HELP saham_tahap_baris_total Jumlah baris data yang diproses per tahap')
+        baris.append('# TYPE saham_tahap_baris_total counter')
+        for tahap, data_tahap in sorted(registri['tahap'].items()):
+            baris.append(f'saham_tahap_baris_total{{tahap="{tahap}"}} {data_tahap["baris"]}')
+
+        baris.append('# HELP saham_payload_byte_total Ukuran JSON grafik yang dikirim ke browser')
+        baris.append('# TYPE saham_payload_byte_total counter')
+        for grafik, data_payload in sorted(registri['payload'].items()):
+            baris.append(f'saham_payload_byte_total{{grafik="{grafik}"}} {data_payload["byte"]}')
+
+        baris.append('# HELP saham_cache_total Hit dan miss setiap cache')
+        baris.append('# TYPE saham_cache_total counter')
+        for cache, data_cache in sorted(registri['cache'].items()):
+            baris.append(f'saham_cache_total{{cache="{cache}",hasil="hit"}} {data_cache["permintaan"] - data_cache["miss"]}')
+            baris.append(f'saham_cache_total{{cache="{cache}",hasil="miss"}} {data_cache["miss"]}')
+
+        for nama, nilai in sorted(registri['gauge'].items()):
+            baris.append(f'# TYPE saham_{nama} gauge')
+            baris.append(f'saham_{nama} {nilai}')
+
+    return '\n'.join(baris) + '\n'
+
+# Menjalankan endpoint HTTP /metrics untuk Prometheus (sekali per proses)
+def jalankan_server_metrik(port, alamat=ALAMAT_METRIK):
+    """
+    Server HTTP kecil di thread terpisah yang melayani GET /metrics
+    Aman dipanggil pada setiap rerun: server untuk alamat dan port yang sama hanya dibuat sekali.
+    Parameter:
+        port: port endpoint
+        alamat: alamat bind, default ALAMAT_METRIK (127.0.0.1, tanpa autentikasi)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    kunci = (alamat, int(port))
+    with _KUNCI_SERVER:
+        if kunci in _SERVER_METRIK:
+            return _SERVER_METRIK[kunci]
+        registri = registri_metrik()
+
+        class PenanganMetrik(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                isi = ekspor_prometheus(registri).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(isi)))
+                self.end_headers()
+                self.wfile.write(isi)
+
+            def log_message(self, format, *args):
+                pass  # Jangan penuhi log Streamlit dengan setiap scrape
+
+        server = ThreadingHTTPServer(kunci, PenanganMetrik)
+        threading.Thread(target=server.serve_forever, name='server-metrik', daemon=True).start()
+        _SERVER_METRIK[kunci] = server
+        return server
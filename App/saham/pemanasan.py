@@ -0,0 +1,274 @@
+# Pemanasan latar belakang: frame olahan ticker populer disiapkan sebelum diminta
+# Satu thread per proses server mengambil (simbol, periode) dari antrean berurut
+# waktu jatuh tempo, memanggil ambil_data_olahan (database lokal + LRU bersama)
+# dengan semua indikator di PARAMETER_INDIKATOR, lalu menjadwalkan ulang tugas itu pada batas bar berikutnya (kalender.berlaku_sampai).
+# Sesi yang meminta kunci yang sedang dipanaskan ikut menunggu unduhan yang sama.
+
+import heapq
+import threading
+import time
+
+from .indikator import PARAMETER_INDIKATOR
+from .kalender import berlaku_sampai
+from .konfigurasi import (
+    BATAS_PEMANASAN_PER_MENIT,
+    JUMLAH_TICKER_PEMANASAN,
+    TICKER_POPULER
+)
+from .layanan import ambil_data_olahan
+from .metrik import atur_gauge, ukur_tahap
+
+# Jeda setelah batas bar (detik) agar bar baru sudah tersedia di penyedia data
+JEDA_SETELAH_BAR = 10
+
+# Jeda sebelum mencoba ulang tugas yang gagal (detik), berlipat dua setiap kegagalan
+JEDA_GAGAL = 300
+JEDA_GAGAL_MAKS = 3600
+
+# Ticker yang gagal sebanyak ini berturut-turut dibuang dari target selama UMUR_PANTAUAN
+BATAS_GAGAL = 3
+
+# Ticker daftar pantauan yang tidak terlihat lagi selama ini (detik) dilupakan
+UMUR_PANTAUAN = 6 * 3600
+
+# Waktu paruh skor permintaan (detik) dan skor terendah yang masih disimpan
+PARUH_WAKTU_PERMINTAAN = 3600
+SKOR_MINIMUM = 0.05
+
+# Skor ticker daftar pantauan yang masih terlihat, setara satu permintaan baru
+SKOR_PANTAUAN = 1.0
+
+# Status penjadwal, dipakai bersama oleh semua sesi dalam satu proses server
+_PENJADWAL = {
+    'kunci': threading.Lock(),
+    'bangun': threading.Event(),
+    'thread': None,
+    'antrean': [],  # heap [(jatuh tempo, (simbol, periode))]
+    'terjadwal': {},  # {(simbol, periode): jatuh tempo}
+    'interval': {},  # {periode: interval}
+    'pantauan': {},  # {ticker daftar pantauan: terakhir terlihat}
+    'permintaan': {},  # {ticker: (skor permintaan, waktu skor)}, meluruh eksponensial
+    'target': set(),
+    'gagal': {},  # {(simbol, periode): jumlah kegagalan berturut-turut}
+    'dibuang': {},  # {simbol: waktu dibuang} setelah BATAS_GAGAL kegagalan
+    'selesai': 0,
+    'token_berikutnya': 0.0
+}
+
+# Status penjadwal proses ini
+def penjadwal_pemanasan():
+    return _PENJADWAL
+
+# Skor permintaan sebuah ticker pada waktu tertentu
+def skor_permintaan(penjadwal, simbol, sekarang):
+    skor, waktu = penjadwal['permintaan'].get(simbol, (0.0, sekarang))
+    return skor * 0.5 ** ((sekarang - waktu) / PARUH_WAKTU_PERMINTAAN)
+
+# Mencatat ticker yang diminta sesi, untuk peringkat ticker populer
+def catat_permintaan(simbol):
+    penjadwal = penjadwal_pemanasan()
+    simbol = simbol.strip().upper()
+    sekarang = time.time()
+    with penjadwal['kunci']:
+        penjadwal['permintaan'][simbol] = (skor_permintaan(penjadwal, simbol, sekarang) + 1, sekarang)
+
+# Menentukan ticker yang dipanaskan
+def daftar_target(penjadwal, sekarang):
+    """
+    TICKER_POPULER, lalu ticker lain berurut skor: skor permintaan yang meluruh
+    (PARUH_WAKTU_PERMINTAAN) ditambah SKOR_PANTAUAN jika ticker ada di daftar
+    pantauan sesi mana pun dalam UMUR_PANTAUAN terakhir. Paling banyak
+    JUMLAH_TICKER_PEMANASAN. Entri pantauan kedaluwarsa, skor di bawah
+    SKOR_MINIMUM dan ticker dibuang yang sudah lewat UMUR_PANTAUAN dihapus.
+    Harus dipanggil saat kunci dipegang.
+    """
+    for simbol, terlihat in list(penjadwal['pantauan'].items()):
+        if sekarang - terlihat > UMUR_PANTAUAN:
+            del penjadwal['pantauan'][simbol]
+    for simbol in list(penjadwal['permintaan']):
+        if skor_permintaan(penjadwal, simbol, sekarang) < SKOR_MINIMUM:
+            del penjadwal['permintaan'][simbol]
+    for simbol, dibuang in list(penjadwal['dibuang'].items()):
+        if sekarang - dibuang > UMUR_PANTAUAN:
+            del penjadwal['dibuang'][simbol]
+
+    skor = {simbol: skor_permintaan(penjadwal, simbol, sekarang) for simbol in penjadwal['permintaan']}
+    for simbol in penjadwal['pantauan']:
+        skor[simbol] = skor.get(simbol, 0.0) + SKOR_PANTAUAN
+    peringkat = sorted(skor, key=lambda simbol: (-skor[simbol], simbol))
+    target = [
+        simbol for simbol in dict.fromkeys([*TICKER_POPULER, *peringkat])
+        if simbol not in penjadwal['dibuang']
+    ]
+    return set(target[:JUMLAH_TICKER_PEMANASAN])
+
+# Memperbarui target dan menjadwalkan tugas baru
+def perbarui_target(daftar_pantauan, pemetaan_interval):
+    """
+    Aman dipanggil pada setiap rerun; tugas yang sudah terjadwal tidak diubah.
+    Ticker yang keluar dari target dibuang saat tugasnya jatuh tempo.
+    Parameter:
+        daftar_pantauan: ticker daftar pantauan sesi ini
+        pemetaan_interval: {periode: interval} seperti di aplikasi
+    """
+    penjadwal = penjadwal_pemanasan()
+    sekarang = time.time()
+    with penjadwal['kunci']:
+        penjadwal['pantauan'].update((s.strip().upper(), sekarang) for s in daftar_pantauan if s.strip())
+        penjadwal['interval'] = dict(pemetaan_interval)
+        penjadwal['target'] = daftar_target(penjadwal, sekarang)
+        baru = False
+        for simbol in sorted(penjadwal['target']):
+            for periode in penjadwal['interval']:
+                kunci = (simbol, periode)
+                if kunci not in penjadwal['terjadwal']:
+                    penjadwal['terjadwal'][kunci] = sekarang
+                    heapq.heappush(penjadwal['antrean'], (sekarang, kunci))
+                    baru = True
+        perbarui_gauge(penjadwal, sekarang)
+    if baru:
+        penjadwal['bangun'].set()
+
+# Kedalaman antrean: tugas yang sudah jatuh tempo tetapi belum dikerjakan
+def kedalaman_antrean(penjadwal, sekarang):
+    return sum(1 for jatuh_tempo in penjadwal['terjadwal'].values() if jatuh_tempo <= sekarang)
+
+# Menyalin status antrean ke gauge Prometheus
+def perbarui_gauge(penjadwal, sekarang):
+    """
+    Harus dipanggil saat kunci dipegang
+    """
+    atur_gauge('pemanasan_antrean', kedalaman_antrean(penjadwal, sekarang))
+    atur_gauge('pemanasan_terjadwal', len(penjadwal['terjadwal']))
+    atur_gauge('pemanasan_selesai', penjadwal['selesai'])
+    atur_gauge('pemanasan_gagal', sum(1 for n in penjadwal['gagal'].values() if n))
+
+# Ringkasan status untuk panel debug
+def status_pemanasan():
+    """
+    Return: dict {'aktif', 'ticker', 'terjadwal', 'antrean', 'selesai', 'gagal', 'berikutnya'}
+    """
+    penjadwal = penjadwal_pemanasan()
+    sekarang = time.time()
+    with penjadwal['kunci']:
+        thread = penjadwal['thread']
+        return {
+            'aktif': thread is not None and thread.is_alive(),
+            'ticker': len(penjadwal['target']),
+            'terjadwal': len(penjadwal['terjadwal']),
+            'antrean': kedalaman_antrean(penjadwal, sekarang),
+            'selesai': penjadwal['selesai'],
+            'gagal': sum(1 for n in penjadwal['gagal'].values() if n),
+            'berikutnya': min(penjadwal['terjadwal'].values(), default=None)
+        }
+
+# Menunggu giliran sesuai batas laju (tugas per menit)
+def tunggu_giliran(penjadwal):
+    jeda = 60.0 / BATAS_PEMANASAN_PER_MENIT
+    sisa = penjadwal['token_berikutnya'] - time.monotonic()
+    if sisa > 0:
+        time.sleep(sisa)
+    penjadwal['token_berikutnya'] = time.monotonic() + jeda
+
+# Mengambil tugas berikutnya yang sudah jatuh tempo
+def ambil_tugas(penjadwal):
+    """
+    Return: (kunci, None) jika ada tugas, atau (None, detik tunggu) jika belum ada
+    """
+    with penjadwal['kunci']:
+        while penjadwal['antrean']:
+            jatuh_tempo, kunci = penjadwal['antrean'][0]
+            if penjadwal['terjadwal'].get(kunci) != jatuh_tempo:
+                heapq.heappop(penjadwal['antrean'])  # entri lama dari penjadwalan ulang
+                continue
+            if kunci[0] not in penjadwal['target'] or kunci[1] not in penjadwal['interval']:
+                heapq.heappop(penjadwal['antrean'])
+                del penjadwal['terjadwal'][kunci]
+                penjadwal['gagal'].pop(kunci, None)
+                continue
+            sisa = jatuh_tempo - time.time()
+            if sisa > 0:
+                return None, sisa
+            heapq.heappop(penjadwal['antrean'])
+            return kunci, None
+        return None, None
+
+# Menjadwalkan ulang sebuah tugas
+def jadwalkan(penjadwal, kunci, jatuh_tempo):
+    with penjadwal['kunci']:
+        penjadwal['terjadwal'][kunci] = jatuh_tempo
+        heapq.heappush(penjadwal['antrean'], (jatuh_tempo, kunci))
+
+# Mencatat kegagalan tugas; ticker yang terus gagal dibuang dari target
+def catat_gagal(penjadwal, kunci):
+    """
+    Return: waktu jatuh tempo percobaan berikutnya (detik epoch UTC)
+    """
+    sekarang = time.time()
+    with penjadwal['kunci']:
+        gagal = penjadwal['gagal'][kunci] = penjadwal['gagal'].get(kunci, 0) + 1
+        if gagal >= BATAS_GAGAL:
+            # Misalnya salah ketik di daftar pantauan: tidak dipanaskan lagi
+            # sampai UMUR_PANTAUAN lewat; tugasnya dibuang oleh ambil_tugas
+            simbol = kunci[0]
+            penjadwal['dibuang'][simbol] = sekarang
+            penjadwal['pantauan'].pop(simbol, None)
+            penjadwal['permintaan'].pop(simbol, None)
+            penjadwal['target'].discard(simbol)
+    return sekarang + min(JEDA_GAGAL * 2 ** (gagal - 1), JEDA_GAGAL_MAKS)
+
+# Mengerjakan satu tugas pemanasan
+def kerjakan_tugas(penjadwal, kunci):
+    """
+    Semua indikator di PARAMETER_INDIKATOR ikut dihitung, sehingga sesi yang
+    memilih indikator apa pun langsung memakai kolom dari LRU tanpa menghitung
+    ulang. Data yang tidak ditemukan (None) dihitung sebagai kegagalan.
+    Return: waktu jatuh tempo berikutnya (detik epoch UTC)
+    """
+    simbol, periode = kunci
+    interval = penjadwal['interval'][periode]
+    try:
+        with ukur_tahap('pemanasan'):
+            data = ambil_data_olahan(simbol, periode, interval, indikator=list(PARAMETER_INDIKATOR))
+    except Exception:
+        return catat_gagal(penjadwal, kunci)
+    if data is None:
+        return catat_gagal(penjadwal, kunci)
+
+    with penjadwal['kunci']:
+        penjadwal['gagal'].pop(kunci, None)
+        penjadwal['selesai'] += 1
+    return berlaku_sampai(simbol, interval, time.time()) + JEDA_SETELAH_BAR
+
+# Perulangan thread pemanasan
+def jalankan_pekerja(penjadwal):
+    while True:
+        kunci, tunggu = ambil_tugas(penjadwal)
+        if kunci is None:
+            with penjadwal['kunci']:
+                perbarui_gauge(penjadwal, time.time())
+            # Dibangunkan lebih awal jika ada tugas baru dari perbarui_target
+            penjadwal['bangun'].wait(60 if tunggu is None else min(tunggu, 60))
+            penjadwal['bangun'].clear()
+            continue
+
+        tunggu_giliran(penjadwal)
+        jadwalkan(penjadwal, kunci, kerjakan_tugas(penjadwal, kunci))
+        with penjadwal['kunci']:
+            perbarui_gauge(penjadwal, time.time())
+
+# Menjalankan penjadwal pemanasan (sekali per proses)
+def jalankan_pemanasan(daftar_pantauan, pemetaan_interval):
+    """
+    Aman dipanggil pada setiap rerun: thread hanya dibuat sekali, panggilan
+    berikutnya hanya memperbarui target (lihat perbarui_target).
+    """
+    perbarui_target(daftar_pantauan, pemetaan_interval)
+    penjadwal = penjadwal_pemanasan()
+    with penjadwal['kunci']:
+        if penjadwal['thread'] is None:
+            penjadwal['thread'] = threading.Thread(
+                target=jalankan_pekerja, args=(penjadwal,), name='pemanasan', daemon=True
+            )
+            penjadwal['thread'].start()
+    return penjadwal
@@ -0,0 +1,149 @@
+# Pemrosesan data: normalisasi kolom/zona waktu dan metrik ringkasan
+
+import numpy as np
+import pandas as pd
+
+# Zona waktu tampilan untuk kolom Tanggal
+ZONA_WAKTU = 'US/Eastern'
+
+# Pemetaan kolom yfinance ke kolom frame olahan (urutan = urutan kolom hasil)
+KOLOM_OLAHAN = {
+    'Open': 'Pembukaan',
+    'High': 'Tertinggi',
+    'Low': 'Terendah',
+    'Close': 'Penutupan',
+    'Volume': 'Volume'
+}
+
+# Memproses dan membersihkan data
+def olah_data(df):
+    """
+    Mengkonversi data ke timezone yang sesuai dan format yang benar
+    Frame hasil dibangun sekali dari array NumPy kolom masukan dengan
+    copy=False, jadi kolom harga berbagi memori dengan df tanpa bergantung
+    pada copy-on-write; hasil diperlakukan hanya-baca (kolom baru ditambahkan
+    dengan assignment kolom, bukan ditulis di tempat) dan selalu memiliki
+    skema yang sama:
+        Tanggal (datetime ZONA_WAKTU), Pembukaan, Tertinggi, Terendah,
+        Penutupan, Volume, dengan index RangeIndex 0..n-1
+    df masukan tidak diubah.
+    """
+    # Kolom MultiIndex (Price, Ticker) cukup dibaca level pertamanya
+    nama_kolom = df.columns.get_level_values(0) if isinstance(df.columns, pd.MultiIndex) else df.columns
+    posisi = {}
+    for i, nama in enumerate(nama_kolom):
+        posisi.setdefault(nama, i)
+
+    waktu = df.index
+    if waktu.tzinfo is None:
+        waktu = waktu.tz_localize('UTC')
+
+    kolom = {'Tanggal': waktu.tz_convert(ZONA_WAKTU)}
+    for asal, tujuan in KOLOM_OLAHAN.items():
+        kolom[tujuan] = df.iloc[:, posisi[asal]].to_numpy()
+
+    return pd.DataFrame(kolom, index=pd.RangeIndex(len(df)), copy=False)
+
+# Menghitung metrik penting
+def hitung_metrik(df, kurs):
+    """
+    Menghitung statistik dasar dari data saham dalam USD dan IDR
+    Jika df memiliki kolom Kurs, nilai IDR memakai kurs pada waktu setiap bar
+    (harga awal dengan kurs saat itu, tertinggi/terendah IDR per bar); jika
+    tidak, semua nilai dikalikan kurs tunggal.
+    """
+    harga_terakhir_usd = df['Penutupan'].iloc[-1]
+    harga_awal_usd = df['Penutupan'].iloc[0]
+    perubahan_usd = harga_terakhir_usd - harga_awal_usd
+    perubahan_persen = (perubahan_usd / harga_awal_usd) * 100
+    harga_tertinggi_usd = df['Tertinggi'].max()
+    harga_terendah_usd = df['Terendah'].min()
+    total_volume = df['Volume'].sum()
+    
+    # Konversi ke IDR
+    kurs_bar = df['Kurs'].to_numpy(dtype=np.float64) if 'Kurs' in df.columns else np.full(len(df), float(kurs))
+    harga_terakhir_idr = float(harga_terakhir_usd) * kurs_bar[-1]
+    harga_awal_idr = float(harga_awal_usd) * kurs_bar[0]
+    perubahan_idr = harga_terakhir_idr - harga_awal_idr
+    perubahan_persen_idr = (perubahan_idr / harga_awal_idr) * 100
+    harga_tertinggi_idr = np.nanmax(df['Tertinggi'].to_numpy(dtype=np.float64) * kurs_bar)
+    harga_terendah_idr = np.nanmin(df['Terendah'].to_numpy(dtype=np.float64) * kurs_bar)
+    
+    return {
+        'harga_terakhir_usd': harga_terakhir_usd,
+        'harga_terakhir_idr': harga_terakhir_idr,
+        'perubahan_usd': perubahan_usd,
+        'perubahan_idr': perubahan_idr,
+        'perubahan_persen': perubahan_persen,
+        'perubahan_persen_idr': perubahan_persen_idr,
+        'harga_tertinggi_usd': harga_tertinggi_usd,
+        'harga_tertinggi_idr': harga_tertinggi_idr,
+        'harga_terendah_usd': harga_terendah_usd,
+        'harga_terendah_idr': harga_terendah_idr,
+        'total_volume': total_volume
+    }
+
+# Kolom harga dan indikator yang disimpan sebagai float32 pada mode ringkas
+KOLOM_HARGA = ['Pembukaan', 'Tertinggi', 'Terendah', 'Penutupan']
+KOLOM_INDIKATOR = ['SMA_20', 'SMA_50', 'EMA_20', 'EMA_50', 'RSI']
+
+# Mengubah frame olahan ke representasi ringkas untuk disimpan di memori
+def ringkas_frame(df):
+    """
+    Frame hasil olah_data + indikator dengan tipe data yang lebih kecil:
+    - harga, indikator dan Kurs float32: galat relatif maksimal 2^-24 (~6e-8) per
+      nilai, misalnya harga 1.000 USD bergeser paling banyak 0,00006 USD
+    - Volume uint32 (uint64 jika ada volume >= 2^32)
+    - Tanggal int64 nanodetik epoch UTC; zona waktu tampilan (ZONA_WAKTU)
+      baru diterapkan saat render lewat waktu_tampilan/frame_tampilan
+    Indikator tetap dihitung dengan float64 sebelum diringkas.
+    """
+    hasil = {'Tanggal': waktu_epoch_ns(df)}
+    for kolom in df.columns:
+        if kolom == 'Tanggal':
+            continue
+        nilai = df[kolom].to_numpy()
+        if kolom in KOLOM_HARGA or kolom in KOLOM_INDIKATOR or kolom == 'Kurs':
+            nilai = nilai.astype(np.float32)
+        elif kolom == 'Volume':
+            volume = np.nan_to_num(nilai.astype(np.float64, copy=False), nan=0.0)
+            tipe = np.uint32 if volume.max(initial=0) < 2**32 else np.uint64
+            nilai = volume.astype(tipe)
+        hasil[kolom] = nilai
+    return pd.DataFrame(hasil, copy=False)
+
+# Mengecek apakah frame memakai representasi ringkas
+def frame_ringkas(df):
+    return df['Tanggal'].dtype.kind == 'i'
+
+# Waktu setiap bar sebagai nanodetik epoch UTC (int64)
+def waktu_epoch_ns(df):
+    if frame_ringkas(df):
+        return df['Tanggal'].to_numpy()
+    return pd.DatetimeIndex(df['Tanggal']).as_unit('ns').asi8
+
+# Mengubah nanodetik epoch menjadi waktu tampilan
+def waktu_tampilan(waktu_ns):
+    """
+    Return: DatetimeIndex dalam ZONA_WAKTU
+    """
+    return pd.DatetimeIndex(np.asarray(waktu_ns, dtype='datetime64[ns]')).tz_localize('UTC').tz_convert(ZONA_WAKTU)
+
+# Mengubah frame (biasanya potongan kecil) ke tipe data tampilan
+def frame_tampilan(df):
+    """
+    Frame biasa dikembalikan apa adanya. Frame ringkas dikonversi: Tanggal
+    menjadi datetime ZONA_WAKTU, float32 menjadi float64 dengan nilai desimal
+    terpendek (232.35, bukan 232.35000610351562), Volume menjadi int64.
+    Pakai hanya pada baris yang benar-benar ditampilkan.
+    """
+    if not frame_ringkas(df):
+        return df
+    hasil = df.copy()
+    hasil['Tanggal'] = waktu_tampilan(df['Tanggal'].to_numpy())
+    for kolom in df.columns:
+        if df[kolom].dtype == np.float32:
+            hasil[kolom] = df[kolom].astype(str).astype(np.float64)
+        elif kolom == 'Volume':
+            hasil[kolom] = df[kolom].astype(np.int64)
+    return hasil
@@ -0,0 +1,303 @@
+# Pengambilan data saham: database lokal, pembaruan inkremental dan unduhan bersamaan
+
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+import pandas as pd
+
+from .konfigurasi import (
+    BATAS_HARI_INTRADAY,
+    BATAS_TUNGGU_ANTREAN,
+    BATAS_WAKTU_UNDUH,
+    CAKUPAN_PERIODE,
+    PERIODE_UNDUH_SUMBER,
+    SUMBER_INTERVAL
+)
+from .kalender import BURSA, bursa_simbol, masih_berlaku, waktu_pasar
+from .metrik import catat_cache, ukur_tahap
+from .penyedia import unduh_data
+from .penyimpanan import (
+    baca_data_tersimpan,
+    baca_periode_tersimpan,
+    riwayat_berubah,
+    simpan_data_tersimpan,
+    waktu_utc_ns
+)
+from .resampel import resampel_ohlcv
+
+# Jumlah bar final yang diunduh ulang bersama pembaruan untuk mendeteksi split/dividen
+BAR_TUMPANG_TINDIH = 5
+
+# Mengunduh data saham langsung dari penyedia data
+def unduh_data_saham(simbol, periode, interval):
+    """
+    Mengunduh seluruh periode dari penyedia data tanpa database lokal
+    """
+    tanggal_akhir = waktu_pasar()
+    
+    if periode == '1minggu':
+        tanggal_awal = tanggal_akhir - timedelta(days=7)
+        data_saham = unduh_data(simbol, start=tanggal_awal, end=tanggal_akhir, interval=interval)
+    else:
+        data_saham = unduh_data(simbol, period=periode, interval=interval)
+    
+    return data_saham
+
+# Interval sumber untuk interval yang dibentuk secara lokal
+def sumber_resampel(periode, interval):
+    """
+    Return: interval sumber (SUMBER_INTERVAL) selama riwayatnya cukup untuk periode, selain itu None
+    """
+    sumber = SUMBER_INTERVAL.get(interval)
+    if sumber is not None and CAKUPAN_PERIODE.get(periode, float('inf')) <= BATAS_HARI_INTRADAY.get(sumber, float('inf')):
+        return sumber
+    return None
+
+# Membentuk bar interval kasar satu ticker dengan jam sesi bursanya
+def resampel_simbol(data_sumber, simbol, interval, sumber):
+    jadwal = BURSA[bursa_simbol(simbol)]
+    with ukur_tahap('resampel', len(data_sumber)):
+        return resampel_ohlcv(data_sumber, interval, sumber, jadwal['zona'], jadwal['buka'])
+
+# Membaca data saham dari database lokal tanpa unduhan
+def baca_data_lokal(simbol, periode, interval, sejak_ns=None):
+    """
+    Parameter:
+        simbol: kode ticker saham (huruf besar)
+        periode: rentang waktu data
+        interval: interval waktu per data point; interval di SUMBER_INTERVAL
+                  dibentuk dari interval sumbernya
+        sejak_ns: None = bar dalam periode; selain itu semua bar dengan waktu
+                  >= sejak_ns (ns epoch UTC, -2**63 = seluruh riwayat) tanpa
+                  dipotong per periode. Untuk interval hasil resampling nilainya
+                  harus awal sebuah bucket (label bar) agar bucket pertama utuh.
+    Return: DataFrame OHLCV dengan index UTC
+    """
+    sumber = sumber_resampel(periode, interval)
+    if sumber is not None:
+        return resampel_simbol(baca_data_lokal(simbol, periode, sumber, sejak_ns), simbol, interval, sumber)
+
+    if sejak_ns is None:
+        return baca_periode_tersimpan(simbol, periode, interval)
+    data, _ = baca_data_tersimpan(simbol, interval, sejak_ns)
+    return data
+
+# Mengambil data saham (database lokal + pembaruan inkremental dari Yahoo)
+def ambil_data_saham(simbol, periode, interval, masa_berlaku=None, sejak_ns=None):
+    """
+    Fungsi untuk mendapatkan data historis saham
+    Data dibaca dari database lokal; hanya bar setelah waktu terakhir yang
+    tersimpan (ditambah BAR_TUMPANG_TINDIH bar sebelumnya) diunduh ulang dari
+    Yahoo Finance lalu digabungkan. Jika bar tumpang tindih berbeda (split atau
+    dividen menyesuaikan ulang riwayat), seluruh riwayat diunduh ulang dan diganti.
+    Untuk keputusan ini hanya bar terakhir yang dibaca; hasil dibaca dari
+    database lewat baca_data_lokal.
+    Interval di SUMBER_INTERVAL dibentuk dari interval yang lebih halus, dan
+    interval sumber diunduh sekaligus untuk PERIODE_UNDUH_SUMBER.
+    Parameter:
+        simbol: kode ticker saham
+        periode: rentang waktu data
+        interval: interval waktu per data point
+        masa_berlaku: batas umur data tersimpan (detik), default mengikuti jam bursa (kalender.berlaku_sampai)
+        sejak_ns: lihat baca_data_lokal (None = bar dalam periode)
+    """
+    simbol = simbol.strip().upper()
+    cakupan_hari = CAKUPAN_PERIODE.get(periode, float('inf'))
+
+    # Interval kasar dibentuk dari data interval halus (selama riwayatnya cukup)
+    sumber = sumber_resampel(periode, interval)
+    if sumber is not None:
+        data_sumber = ambil_data_saham(simbol, periode, sumber, masa_berlaku, sejak_ns)
+        return resampel_simbol(data_sumber, simbol, interval, sumber)
+
+    # Unduhan penuh mencakup periode terpanjang yang memakai interval ini
+    periode_unduh = periode
+    if CAKUPAN_PERIODE.get(PERIODE_UNDUH_SUMBER.get(interval), 0) > cakupan_hari:
+        periode_unduh = PERIODE_UNDUH_SUMBER[interval]
+
+    catat_cache('penyimpanan', 'permintaan')
+    with ukur_tahap('baca_penyimpanan'):
+        data_tersimpan, info = baca_data_tersimpan(simbol, interval, batas_bar=BAR_TUMPANG_TINDIH + 1)
+
+    if data_tersimpan.empty or info is None or info[1] < cakupan_hari:
+        # Belum ada data atau periode yang diminta lebih panjang: unduh penuh
+        catat_cache('penyimpanan', 'miss')
+        data_saham = unduh_data_saham(simbol, periode_unduh, interval)
+        if data_saham.empty and data_tersimpan.empty:
+            return data_saham
+        if not data_saham.empty:
+            simpan_data_tersimpan(simbol, interval, data_saham, CAKUPAN_PERIODE.get(periode_unduh, cakupan_hari))
+    elif not masih_berlaku(simbol, interval, info[0], masa_berlaku):
+        catat_cache('penyimpanan', 'miss')
+        waktu_terakhir = data_tersimpan.index[-1]
+        batas_intraday = BATAS_HARI_INTRADAY.get(interval)
+        if batas_intraday and waktu_pasar() - waktu_terakhir > timedelta(days=batas_intraday):
+            # Celah terlalu jauh untuk data intraday: ulangi unduhan penuh
+            # Bar lama bisa saja memakai dasar penyesuaian lama: ganti semuanya
+            data_saham = unduh_data_saham(simbol, periode_unduh, interval)
+            if not data_saham.empty:
+                simpan_data_tersimpan(
+                    simbol, interval, data_saham, CAKUPAN_PERIODE.get(periode_unduh, cakupan_hari), ganti=True
+                )
+        else:
+            # Unduh mulai beberapa bar sebelum bar terakhir: bar terakhir bisa saja
+            # belum final, dan bar sebelumnya dibandingkan dengan yang tersimpan
+            awal_ulang = data_tersimpan.index[-min(len(data_tersimpan), BAR_TUMPANG_TINDIH + 1)]
+            awal = awal_ulang if batas_intraday else awal_ulang.strftime('%Y-%m-%d')
+            try:
+                data_baru = unduh_data(simbol, start=awal, interval=interval)
+            except Exception:
+                data_baru = pd.DataFrame()  # Gagal memperbarui: tetap pakai data tersimpan
+            if data_baru.empty:
+                data_baru = data_tersimpan.iloc[:0]
+            waktu_tersimpan = waktu_utc_ns(data_tersimpan.index)
+            if riwayat_berubah(waktu_tersimpan, data_tersimpan['Close'].to_numpy(), data_baru, waktu_tersimpan[-1]):
+                # Split/dividen: riwayat tersimpan memakai dasar lama, unduh ulang penuh
+                data_saham = unduh_data_saham(simbol, periode_unduh, interval)
+                if not data_saham.empty:
+                    simpan_data_tersimpan(
+                        simbol, interval, data_saham, CAKUPAN_PERIODE.get(periode_unduh, cakupan_hari), ganti=True
+                    )
+            else:
+                simpan_data_tersimpan(simbol, interval, data_baru)
+
+    return baca_data_lokal(simbol, periode, interval, sejak_ns)
+
+# Mengambil data seluruh daftar pantauan dalam satu permintaan
+def ambil_data_watchlist(daftar_simbol, periode='1d', interval='5m', batas_berlaku=None):
+    """
+    Mengunduh data banyak saham sekaligus lalu memecahnya per ticker
+    Aplikasi membungkus fungsi ini dengan st.cache_data (semua sesi).
+    Parameter:
+        daftar_simbol: tuple kode ticker saham
+        periode: rentang waktu data
+        interval: interval waktu per data point
+        batas_berlaku: hanya bagian kunci cache (kalender.batas_berlaku),
+                       tidak dipakai di dalam fungsi
+    Return:
+        dict {simbol: DataFrame mentah}, ticker tanpa data tidak disertakan
+    """
+    catat_cache('watchlist', 'miss')  # Isi fungsi hanya berjalan jika cache kosong/kedaluwarsa
+    daftar_simbol = tuple(dict.fromkeys(s.strip().upper() for s in daftar_simbol if s.strip()))
+    if not daftar_simbol:
+        return {}
+
+    data_gabungan = unduh_data(
+        list(daftar_simbol),
+        period=periode,
+        interval=interval,
+        group_by='ticker',
+        threads=True
+    )
+
+    hasil = {}
+    if data_gabungan.empty:
+        return hasil
+
+    # Kolom MultiIndex (Ticker, Harga) dipecah per ticker
+    if isinstance(data_gabungan.columns, pd.MultiIndex):
+        ticker_tersedia = set(data_gabungan.columns.get_level_values(0))
+        for simbol in daftar_simbol:
+            if simbol in ticker_tersedia:
+                data_simbol = data_gabungan[simbol].dropna(how='all')
+                if not data_simbol.empty:
+                    hasil[simbol] = data_simbol
+    else:
+        hasil[daftar_simbol[0]] = data_gabungan.dropna(how='all')
+
+    return hasil
+
+# Kumpulan thread untuk unduhan, dibuat saat pertama dipakai
+_KOLAM_UNDUHAN = None
+_KUNCI_KOLAM = threading.Lock()
+
+# Mengambil kumpulan thread unduhan, dipakai bersama oleh semua sesi
+def kolam_unduhan():
+    """
+    Thread pool tunggal per proses server untuk menjalankan unduhan
+    """
+    global _KOLAM_UNDUHAN
+    with _KUNCI_KOLAM:
+        if _KOLAM_UNDUHAN is None:
+            _KOLAM_UNDUHAN = ThreadPoolExecutor(max_workers=8, thread_name_prefix='unduh')
+        return _KOLAM_UNDUHAN
+
+# Membungkus fungsi agar membawa konteks Streamlit ke thread lain
+def bawa_konteks_streamlit(fungsi):
+    """
+    Di dalam aplikasi Streamlit, konteks skrip dibawa ke thread pekerja agar
+    st.cache_data tetap berfungsi. Di luar Streamlit fungsi dikembalikan apa adanya.
+    """
+    if 'streamlit' not in sys.modules:
+        return fungsi
+    from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+    konteks = get_script_run_ctx(suppress_warning=True)
+    if konteks is None:
+        return fungsi
+
+    def jalankan(*argumen):
+        add_script_run_ctx(threading.current_thread(), konteks)
+        return fungsi(*argumen)
+    return jalankan
+
+# Membungkus fungsi agar mencatat kapan tugas mulai berjalan
+def catat_mulai(fungsi, nama, waktu_mulai):
+    def jalankan(*argumen):
+        waktu_mulai[nama] = time.monotonic()
+        return fungsi(*argumen)
+    return jalankan
+
+# Menjalankan beberapa unduhan yang saling lepas secara bersamaan
+def ambil_bersamaan(tugas, batas_waktu=None):
+    """
+    Menjalankan semua tugas sekaligus lalu mengumpulkan hasilnya
+    Thread pool dipakai bersama semua sesi, jadi tugas bisa mengantre lama
+    (misalnya puluhan ticker mode perbandingan). Batas waktu tugas dihitung
+    sejak tugas mulai berjalan; selama masih mengantre berlaku BATAS_TUNGGU_ANTREAN
+    sejak dikirim.
+    Parameter:
+        tugas: dict {nama: (fungsi, argumen1, argumen2, ...)}
+        batas_waktu: dict {nama: detik}, default BATAS_WAKTU_UNDUH
+    Return:
+        dict {nama: hasil}; None jika tugas gagal atau melewati batas waktu
+    """
+    batas_waktu = batas_waktu or BATAS_WAKTU_UNDUH
+
+    dikirim = time.monotonic()
+    waktu_mulai = {}
+    kolam = kolam_unduhan()
+    menunggu = {
+        nama: kolam.submit(catat_mulai(bawa_konteks_streamlit(fungsi), nama, waktu_mulai), *argumen)
+        for nama, (fungsi, *argumen) in tugas.items()
+    }
+
+    hasil = {}
+    while menunggu:
+        sekarang = time.monotonic()
+        tenggat_terdekat = float('inf')
+        for nama, f in list(menunggu.items()):
+            if f.done():
+                try:
+                    hasil[nama] = f.result()
+                except Exception:
+                    hasil[nama] = None
+                del menunggu[nama]
+                continue
+            if nama in waktu_mulai:
+                tenggat = waktu_mulai[nama] + batas_waktu.get(nama, 30)
+            else:
+                tenggat = dikirim + BATAS_TUNGGU_ANTREAN
+            if tenggat <= sekarang:
+                f.cancel()  # Tugas yang sudah berjalan tetap selesai di latar belakang
+                hasil[nama] = None
+                del menunggu[nama]
+            else:
+                tenggat_terdekat = min(tenggat_terdekat, tenggat)
+        if menunggu:
+            # Diperiksa ulang paling lambat tiap detik: tugas yang baru mulai mendapat tenggat baru
+            wait(menunggu.values(), timeout=min(tenggat_terdekat - sekarang, 1.0), return_when=FIRST_COMPLETED)
+    return {nama: hasil[nama] for nama in tugas}
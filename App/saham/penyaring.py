@@ -0,0 +1,287 @@
+# Penyaring saham: mengevaluasi kondisi teknikal untuk banyak ticker sekaligus
+# dari database lokal. Harga semua ticker disusun rata kanan dalam matriks 2D
+# (baris = bar, bar terakhir setiap ticker di baris terakhir; kolom = ticker)
+# lalu indikator dihitung per kelompok kolom dengan kernel NumPy yang sama.
+
+import glob
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from .indikator import hitung_indikator_matriks
+from .kalender import masih_berlaku
+from .konfigurasi import CAKUPAN_PERIODE, LOKASI_SEMESTA
+from .metrik import ukur_tahap
+from .penyedia import unduh_data
+from .penyimpanan import baca_banyak_tersimpan, baca_info_banyak, riwayat_berubah, simpan_data_tersimpan
+
+# Kondisi yang bisa dipilih: label -> kunci
+KONDISI_PENYARING = {
+    'RSI < 30 (jenuh jual)': 'rsi_rendah',
+    'RSI > 70 (jenuh beli)': 'rsi_tinggi',
+    'SMA 20 memotong ke atas SMA 50': 'silang_naik',
+    'SMA 20 memotong ke bawah SMA 50': 'silang_turun',
+    'Dekat harga tertinggi periode': 'dekat_puncak'
+}
+
+# Periode yang bisa disaring (data harian)
+PERIODE_PENYARING = ['3mo', '6mo', '1y', '2y']
+
+JENDELA_SILANG = 5  # persilangan SMA dicari dalam 5 bar terakhir
+TOLERANSI_PUNCAK = 0.03  # dekat puncak: penutupan paling jauh 3% di bawah harga tertinggi
+UKURAN_KELOMPOK = 256  # jumlah ticker per kelompok perhitungan indikator
+UKURAN_KELOMPOK_UNDUH = 100  # jumlah ticker per permintaan unduhan
+HARI_TUMPANG_TINDIH = 7  # hari sebelum bar terakhir yang diunduh ulang untuk mendeteksi split/dividen
+
+# Membaca daftar semesta saham dari folder LOKASI_SEMESTA
+def daftar_semesta():
+    """
+    Return: dict {nama: tuple ticker}, nama diambil dari nama file (lq45.txt -> LQ45)
+    """
+    semesta = {}
+    for lokasi in sorted(glob.glob(os.path.join(LOKASI_SEMESTA, '*.txt'))):
+        with open(lokasi, encoding='utf-8') as berkas:
+            baris = [b.split('#')[0] for b in berkas]
+        simbol = [s.strip().upper() for b in baris for s in b.split(',') if s.strip()]
+        if simbol:
+            nama = os.path.splitext(os.path.basename(lokasi))[0].upper()
+            semesta[nama] = tuple(dict.fromkeys(simbol))
+    return semesta
+
+# Mengunduh beberapa ticker per permintaan lalu menyimpannya ke database lokal
+def unduh_kelompok(daftar_simbol, interval, cakupan_hari=None, pembanding=None, ganti=False, **argumen):
+    """
+    Parameter:
+        daftar_simbol: ticker yang diunduh
+        interval: interval waktu per data point
+        cakupan_hari: diteruskan ke simpan_data_tersimpan (None = pembaruan)
+        pembanding: {simbol: (waktu ns, penutupan, waktu bar terakhir ns)} bar
+                    tersimpan; ticker yang riwayatnya berubah tidak disimpan
+        ganti: diteruskan ke simpan_data_tersimpan
+        argumen: period/start untuk unduh_data
+    Return: ticker yang riwayatnya berubah (lihat riwayat_berubah)
+    """
+    berubah = []
+    for i in range(0, len(daftar_simbol), UKURAN_KELOMPOK_UNDUH):
+        kelompok = daftar_simbol[i:i + UKURAN_KELOMPOK_UNDUH]
+        try:
+            data = unduh_data(kelompok, interval=interval, group_by='ticker', threads=True, **argumen)
+        except Exception:
+            continue  # Kelompok gagal: ticker-nya memakai data tersimpan (jika ada)
+        if data.empty:
+            continue
+        ticker_tersedia = set(data.columns.get_level_values(0)) if isinstance(data.columns, pd.MultiIndex) else None
+        for simbol in kelompok:
+            if ticker_tersedia is None:
+                data_simbol = data
+            elif simbol in ticker_tersedia:
+                data_simbol = data[simbol]
+            else:
+                continue
+            data_simbol = data_simbol.dropna(how='all')
+            if data_simbol.empty and cakupan_hari is not None:
+                continue
+            if pembanding and simbol in pembanding:
+                waktu_lama, penutupan_lama, terakhir = pembanding[simbol]
+                if riwayat_berubah(waktu_lama, penutupan_lama, data_simbol, terakhir):
+                    berubah.append(simbol)
+                    continue
+            simpan_data_tersimpan(simbol, interval, data_simbol, cakupan_hari, ganti)
+    return berubah
+
+# Memastikan database lokal berisi data terbaru untuk seluruh semesta
+def lengkapi_data_semesta(daftar_simbol, periode, interval='1d'):
+    """
+    Ticker yang belum tersimpan (atau cakupannya kurang) diunduh penuh untuk
+    periode ini; ticker yang datanya sudah tidak berlaku (kalender.masih_berlaku)
+    hanya diperbarui sejak bar terakhir. Keduanya diunduh berkelompok, bukan per ticker.
+    Ticker yang riwayatnya disesuaikan ulang (split/dividen) diunduh ulang penuh.
+    """
+    cakupan_hari = CAKUPAN_PERIODE.get(periode, float('inf'))
+    info = baca_info_banyak(daftar_simbol, interval)
+    sekarang = time.time()
+
+    kosong = [s for s in daftar_simbol if s not in info or info[s][1] < cakupan_hari]
+    basi = [
+        s for s in daftar_simbol
+        if s in info and info[s][1] >= cakupan_hari and not masih_berlaku(s, interval, info[s][0], sekarang=sekarang)
+    ]
+
+    if kosong:
+        unduh_kelompok(kosong, interval, cakupan_hari, period=periode)
+    if basi:
+        # Unduh mulai beberapa hari sebelum bar terakhir yang paling lama: bar itu
+        # bisa saja belum final, dan bar sebelumnya dibandingkan dengan yang tersimpan
+        awal = pd.Timestamp(min(info[s][2] for s in basi), tz='UTC') - pd.Timedelta(days=HARI_TUMPANG_TINDIH)
+        tersimpan = baca_banyak_tersimpan(basi, interval, awal.value)
+        pembanding = {
+            simbol: (grup['waktu'].to_numpy(), grup['close'].to_numpy(), info[simbol][2])
+            for simbol, grup in tersimpan.groupby('simbol', sort=False)
+        }
+        berubah = unduh_kelompok(basi, interval, pembanding=pembanding, start=awal.strftime('%Y-%m-%d'))
+        if berubah:
+            unduh_kelompok(berubah, interval, cakupan_hari, ganti=True, period=periode)
+
+# Menyusun matriks harga rata kanan untuk seluruh semesta
+def bangun_matriks_semesta(daftar_simbol, periode, interval='1d'):
+    """
+    Membaca semua ticker dalam satu query, memotong periode per ticker
+    (sama seperti potong_periode: dihitung mundur dari bar terakhir ticker
+    itu), lalu menyusunnya rata kanan. Baris di atas bar pertama ticker
+    yang riwayatnya lebih pendek berisi NaN.
+    Return:
+        dict {'simbol', 'panjang', 'waktu_terakhir' (ns epoch UTC),
+              'penutupan', 'tertinggi', 'terendah', 'volume' (array (bar, simbol))}
+    """
+    info = baca_info_banyak(daftar_simbol, interval)
+    kosong = {
+        'simbol': [], 'panjang': np.empty(0, dtype=np.int64), 'waktu_terakhir': np.empty(0, dtype=np.int64),
+        'penutupan': np.empty((0, 0)), 'tertinggi': np.empty((0, 0)),
+        'terendah': np.empty((0, 0)), 'volume': np.empty((0, 0))
+    }
+    if not info:
+        return kosong
+
+    # Praseleksi di SQL: bar yang lebih lama dari periode terpanjang tidak dibaca
+    hari_periode = CAKUPAN_PERIODE.get(periode, 366)
+    sejak = min(v[2] for v in info.values()) - (hari_periode + 1) * 86400 * 10**9
+    with ukur_tahap('baca_semesta'):
+        data = baca_banyak_tersimpan(list(info), interval, sejak)
+    if data.empty:
+        return kosong
+
+    kode = data['simbol'].to_numpy()
+    waktu = data['waktu'].to_numpy()
+    awal = np.flatnonzero(np.r_[True, kode[1:] != kode[:-1]])
+    panjang = np.diff(np.r_[awal, len(kode)])
+    waktu_terakhir = waktu[awal + panjang - 1]
+
+    # Batas periode per ticker dari bar terakhirnya
+    if periode.endswith('mo'):
+        geser = pd.DateOffset(months=int(periode[:-2]))
+    else:
+        geser = pd.DateOffset(years=int(periode[:-1]))
+    batas = (pd.DatetimeIndex(waktu_terakhir.astype('datetime64[ns]')) - geser).as_unit('ns').asi8
+    masuk = waktu > np.repeat(batas, panjang)
+
+    kode, data = kode[masuk], data[masuk]
+    awal = np.flatnonzero(np.r_[True, kode[1:] != kode[:-1]])
+    panjang = np.diff(np.r_[awal, len(kode)])
+
+    n, k = int(panjang.max()), len(awal)
+    kolom = np.repeat(np.arange(k), panjang)
+    baris = np.arange(len(kode)) - np.repeat(awal, panjang) + np.repeat(n - panjang, panjang)
+
+    def rata_kanan(nilai):
+        matriks = np.full((n, k), np.nan)
+        matriks[baris, kolom] = nilai
+        return matriks
+
+    return {
+        'simbol': kode[awal].tolist(),
+        'panjang': panjang,
+        'waktu_terakhir': waktu_terakhir,
+        'penutupan': rata_kanan(data['close'].to_numpy(dtype=np.float64)),
+        'tertinggi': rata_kanan(data['high'].to_numpy(dtype=np.float64)),
+        'terendah': rata_kanan(data['low'].to_numpy(dtype=np.float64)),
+        'volume': rata_kanan(data['volume'].to_numpy(dtype=np.float64))
+    }
+
+# Mengunduh (jika perlu) lalu menyusun matriks seluruh semesta
+def muat_semesta(daftar_simbol, periode, interval='1d'):
+    """
+    Return: (hasil bangun_matriks_semesta, daftar ticker tanpa data)
+    """
+    daftar_simbol = list(dict.fromkeys(s.strip().upper() for s in daftar_simbol if s.strip()))
+    if not daftar_simbol:
+        return bangun_matriks_semesta([], periode, interval), []
+    with ukur_tahap('lengkapi_semesta', len(daftar_simbol)):
+        lengkapi_data_semesta(daftar_simbol, periode, interval)
+    matriks = bangun_matriks_semesta(daftar_simbol, periode, interval)
+    tersedia = set(matriks['simbol'])
+    return matriks, [s for s in daftar_simbol if s not in tersedia]
+
+# Mengevaluasi kondisi untuk satu kelompok kolom
+def evaluasi_kelompok(penutupan, tertinggi, terendah, volume):
+    """
+    Return: dict {nama kolom: array per ticker}
+    """
+    indikator = hitung_indikator_matriks(penutupan, ['SMA 20', 'SMA 50', 'RSI'])
+    sma_20, sma_50, rsi = indikator['SMA 20'], indikator['SMA 50'], indikator['RSI']
+
+    # Bar pertama dan terakhir; matriks rata kanan jadi bar terakhir = baris terakhir
+    awal = np.argmax(~np.isnan(penutupan), axis=0)
+    harga_awal = penutupan[awal, np.arange(penutupan.shape[1])]
+    harga_terakhir = penutupan[-1]
+    harga_tertinggi = np.nanmax(tertinggi, axis=0)
+
+    # Tanda selisih SMA 20 - SMA 50 pada JENDELA_SILANG + 1 bar terakhir
+    tanda = np.sign(sma_20[-(JENDELA_SILANG + 1):] - sma_50[-(JENDELA_SILANG + 1):])
+    rsi_terakhir = rsi[-1]
+    with np.errstate(invalid='ignore'):
+        perubahan = (harga_terakhir / harga_awal - 1) * 100
+        jarak_puncak = (harga_terakhir / harga_tertinggi - 1) * 100
+        rsi_rendah = rsi_terakhir < 30
+        rsi_tinggi = rsi_terakhir > 70
+
+    return {
+        'Harga': harga_terakhir,
+        'Perubahan (%)': perubahan,
+        'Tertinggi': harga_tertinggi,
+        'Terendah': np.nanmin(terendah, axis=0),
+        'Jarak ke Tertinggi (%)': jarak_puncak,
+        'RSI': rsi_terakhir,
+        'SMA 20': sma_20[-1],
+        'SMA 50': sma_50[-1],
+        'Total Volume': np.nansum(volume, axis=0),
+        'rsi_rendah': rsi_rendah,
+        'rsi_tinggi': rsi_tinggi,
+        'silang_naik': ((tanda[:-1] <= 0) & (tanda[1:] > 0)).any(axis=0),
+        'silang_turun': ((tanda[:-1] >= 0) & (tanda[1:] < 0)).any(axis=0),
+        'dekat_puncak': harga_terakhir >= (1 - TOLERANSI_PUNCAK) * harga_tertinggi
+    }
+
+# Menyaring dan mengurutkan seluruh semesta
+def saring_semesta(matriks, kondisi):
+    """
+    Parameter:
+        matriks: hasil bangun_matriks_semesta
+        kondisi: daftar label dari KONDISI_PENYARING
+    Return:
+        DataFrame satu baris per ticker: metrik, kolom per kondisi terpilih,
+        Skor (jumlah kondisi terpenuhi) dan Lolos (semua terpenuhi); urut
+        Skor lalu Perubahan (%) menurun
+    Harga tertinggi/terendah dan perubahan memakai definisi hitung_metrik.
+    """
+    kunci_kondisi = [(label, KONDISI_PENYARING[label]) for label in kondisi if label in KONDISI_PENYARING]
+    k = len(matriks['simbol'])
+
+    kolom_metrik = ['Harga', 'Perubahan (%)', 'Tertinggi', 'Terendah', 'Jarak ke Tertinggi (%)',
+                    'RSI', 'SMA 20', 'SMA 50', 'Total Volume']
+    if k == 0:
+        return pd.DataFrame(columns=['Saham', *kolom_metrik, 'Bar', *(l for l, _ in kunci_kondisi), 'Skor', 'Lolos'])
+
+    bagian = []
+    for mulai in range(0, k, UKURAN_KELOMPOK):
+        potong = slice(mulai, mulai + UKURAN_KELOMPOK)
+        bagian.append(evaluasi_kelompok(
+            matriks['penutupan'][:, potong], matriks['tertinggi'][:, potong],
+            matriks['terendah'][:, potong], matriks['volume'][:, potong]
+        ))
+    nilai = {nama: np.concatenate([b[nama] for b in bagian]) for nama in bagian[0]}
+
+    hasil = {'Saham': matriks['simbol']}
+    for nama in kolom_metrik:
+        hasil[nama] = nilai[nama]
+    hasil['Bar'] = matriks['panjang']
+    skor = np.zeros(k, dtype=np.int64)
+    for label, kunci in kunci_kondisi:
+        hasil[label] = nilai[kunci]
+        skor += nilai[kunci]
+    hasil['Skor'] = skor
+    hasil['Lolos'] = skor == len(kunci_kondisi)
+
+    tabel = pd.DataFrame(hasil)
+    return tabel.sort_values(['Skor', 'Perubahan (%)'], ascending=False, ignore_index=True)
@@ -0,0 +1,178 @@
+# Penyedia data pasar: Yahoo Finance dan replay offline
+# yfinance baru diimpor saat penyedia Yahoo benar-benar dipakai
+
+import os
+import time
+import zlib
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from .konfigurasi import (
+    BATAS_HARI_INTRADAY,
+    CAKUPAN_PERIODE,
+    LATENSI_REPLAY,
+    LOKASI_REPLAY,
+    PENYEDIA_DATA
+)
+from .kalender import BURSA, bursa_simbol, waktu_pasar
+from .metrik import catat_tahap
+from .penyimpanan import potong_periode, rapikan_kolom
+
+# Penyedia data: Yahoo Finance
+def unduh_yfinance(tickers, **kwargs):
+    """
+    Mengunduh data dari Yahoo Finance (argumen sama dengan yf.download)
+    """
+    import yfinance as yf
+
+    kwargs.setdefault('progress', False)
+    return yf.download(tickers, **kwargs)
+
+# Membuat bilangan acak deterministik dari timestamp
+def acak_deterministik(waktu_ns, benih, urutan):
+    """
+    Hash integer (splitmix64) dari timestamp sehingga nilai sebuah bar selalu
+    sama, berapa pun rentang data yang diminta. Return: array float di [0, 1)
+    """
+    x = (waktu_ns.astype(np.uint64) // np.uint64(10**9)) ^ np.uint64(benih * 1000003 + urutan)
+    x = (x + np.uint64(0x9E3779B97F4A7C15))
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    x = x ^ (x >> np.uint64(31))
+    return (x >> np.uint64(11)).astype(np.float64) / float(2**53)
+
+# Membuat jadwal bar sesuai jam bursa
+def buat_jadwal_bar(awal, akhir, interval, bursa='NYSE'):
+    """
+    Membuat index waktu bar pada hari kerja (intraday: jam sesi reguler BURSA[bursa])
+    """
+    if interval in BATAS_HARI_INTRADAY:
+        menit = {'1m': 1, '5m': 5, '30m': 30, '1h': 60}[interval]
+        jadwal_bursa = BURSA[bursa]
+        zona = jadwal_bursa['zona']
+        hari = pd.bdate_range(awal.tz_convert(zona).normalize().tz_localize(None),
+                              akhir.tz_convert(zona).normalize().tz_localize(None))
+        jam = pd.timedelta_range(pd.Timedelta(minutes=jadwal_bursa['buka']),
+                                 pd.Timedelta(minutes=jadwal_bursa['tutup'] - 1), freq=f'{menit}min')
+        jadwal = (hari.values[:, None] + jam.values[None, :]).ravel()
+        jadwal = pd.DatetimeIndex(jadwal).tz_localize(zona)
+        jadwal = jadwal[(jadwal >= awal) & (jadwal <= akhir)]
+        return jadwal.rename('Datetime')
+
+    frekuensi = {'1d': 'B', '1wk': 'W-MON', '1mo': 'MS'}.get(interval, 'B')
+    awal_naif = awal.tz_convert('UTC').tz_localize(None).normalize()
+    akhir_naif = akhir.tz_convert('UTC').tz_localize(None)
+    return pd.date_range(awal_naif, akhir_naif, freq=frekuensi, name='Date')
+
+# Membuat data OHLCV sintetis untuk satu ticker
+def buat_data_sintetis(simbol, awal, akhir, interval):
+    """
+    Data OHLCV sintetis yang deterministik per (simbol, waktu bar)
+    """
+    jadwal = buat_jadwal_bar(awal, akhir, interval, bursa_simbol(simbol))
+    waktu_ns = jadwal.as_unit('ns').asi8
+    benih = zlib.crc32(simbol.encode())
+    harga_dasar = 15700.0 if simbol == 'IDR=X' else 20 + benih % 480
+
+    hari = waktu_ns / 86400e9
+    u = [acak_deterministik(waktu_ns, benih, i) for i in range(5)]
+    penutupan = harga_dasar * np.exp(
+        0.25 * np.sin(2 * np.pi * hari / 365.25 + benih % 7)
+        + 0.06 * np.sin(2 * np.pi * hari / 29.5 + benih % 11)
+        + 0.01 * np.sin(2 * np.pi * hari * 3.1)
+        + 0.006 * (u[0] - 0.5)
+    )
+    pembukaan = penutupan * np.exp(0.004 * (u[1] - 0.5))
+    tertinggi = np.maximum(pembukaan, penutupan) * (1 + 0.003 * u[2])
+    terendah = np.minimum(pembukaan, penutupan) * (1 - 0.003 * u[3])
+    volume = (1e5 + 2e6 * u[4]).astype('int64')
+
+    return pd.DataFrame({
+        'Close': penutupan,
+        'High': tertinggi,
+        'Low': terendah,
+        'Open': pembukaan,
+        'Volume': volume
+    }, index=jadwal)
+
+# Membaca rekaman OHLCV dari folder replay
+def baca_rekaman_replay(simbol, interval):
+    """
+    Membaca {LOKASI_REPLAY}/{SIMBOL}_{interval}.csv (kolom Open..Volume, index waktu)
+    Return: DataFrame dengan index UTC, atau None jika rekaman tidak ada
+    """
+    if not LOKASI_REPLAY:
+        return None
+    lokasi = os.path.join(LOKASI_REPLAY, f'{simbol}_{interval}.csv')
+    if not os.path.exists(lokasi):
+        return None
+    df = pd.read_csv(lokasi, index_col=0)
+    df.index = pd.to_datetime(df.index, utc=True)
+    return rapikan_kolom(df)
+
+# Penyedia data: replay/sintetis tanpa jaringan
+def unduh_replay(tickers, period=None, interval='1d', start=None, end=None, group_by='column', **kwargs):
+    """
+    Pengganti yf.download untuk benchmark dan uji beban offline
+    Data diambil dari rekaman CSV jika ada, selain itu dibuat secara sintetis.
+    Bentuk hasil (MultiIndex kolom, nama index, timezone) mengikuti yfinance.
+    """
+    if LATENSI_REPLAY > 0:
+        time.sleep(LATENSI_REPLAY)
+
+    daftar = [tickers] if isinstance(tickers, str) else list(tickers)
+    akhir = pd.Timestamp(end) if end is not None else waktu_pasar()
+    akhir = akhir.tz_localize('UTC') if akhir.tzinfo is None else akhir
+
+    if start is not None:
+        awal = pd.Timestamp(start)
+        awal = awal.tz_localize('UTC') if awal.tzinfo is None else awal
+    else:
+        period = period or '1mo'
+        batas_intraday = BATAS_HARI_INTRADAY.get(interval)
+        if period == 'max':
+            awal = pd.Timestamp('1990-01-01', tz='UTC')
+        elif period.endswith('d') and period != 'ytd':
+            awal = akhir - timedelta(days=int(period[:-1]) * 2 + 4)  # dipotong per sesi di bawah
+        else:
+            awal = akhir - timedelta(days=CAKUPAN_PERIODE.get(period, 31))
+        if batas_intraday:
+            awal = max(awal, akhir - timedelta(days=batas_intraday))
+
+    hasil = {}
+    for simbol in daftar:
+        df = baca_rekaman_replay(simbol, interval)
+        if df is None:
+            df = buat_data_sintetis(simbol, awal, akhir, interval)
+        else:
+            df = df[(df.index >= awal) & (df.index <= akhir)]
+        if start is None and period.endswith('d') and period != 'ytd' and not df.empty:
+            # Periode hari = N sesi terakhir
+            if df.index.tzinfo is None:
+                df = df.iloc[-int(period[:-1]):]
+            else:
+                df = potong_periode(df, period, simbol)
+        hasil[simbol] = df
+
+    data = pd.concat(hasil, axis=1, names=['Ticker', 'Price'])  # kolom (Ticker, Price)
+    if group_by != 'ticker':
+        data = data.swaplevel(0, 1, axis=1)
+    return data
+
+# Daftar penyedia data yang tersedia
+DAFTAR_PENYEDIA = {
+    'yfinance': unduh_yfinance,
+    'replay': unduh_replay
+}
+
+# Mengunduh data lewat penyedia yang aktif
+def unduh_data(tickers, **kwargs):
+    """
+    Titik tunggal untuk semua unduhan data pasar (argumen sama dengan yf.download)
+    """
+    mulai = time.perf_counter()
+    data = DAFTAR_PENYEDIA[PENYEDIA_DATA](tickers, **kwargs)
+    catat_tahap('unduh', time.perf_counter() - mulai, len(data))
+    return data
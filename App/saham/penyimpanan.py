@@ -0,0 +1,287 @@
+# Penyimpanan OHLCV lokal (SQLite) antar restart server
+
+import sqlite3
+import time
+from contextlib import closing
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+from .kalender import BURSA, bursa_simbol, waktu_pasar
+from .konfigurasi import BATAS_HARI_INTRADAY, CAKUPAN_PERIODE, LOKASI_DATABASE
+
+# Selisih relatif harga penutupan yang dianggap penyesuaian ulang riwayat
+TOLERANSI_PENYESUAIAN = 1e-4
+
+# Membuka koneksi ke database lokal
+def buka_database():
+    """
+    Membuka koneksi SQLite dan memastikan tabel penyimpanan sudah ada
+    """
+    conn = sqlite3.connect(LOKASI_DATABASE, timeout=30)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS ohlcv (
+            simbol TEXT NOT NULL,
+            interval TEXT NOT NULL,
+            waktu INTEGER NOT NULL,
+            open REAL,
+            high REAL,
+            low REAL,
+            close REAL,
+            volume REAL,
+            PRIMARY KEY (simbol, interval, waktu)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS pembaruan (
+            simbol TEXT NOT NULL,
+            interval TEXT NOT NULL,
+            diambil REAL NOT NULL,
+            cakupan_hari REAL NOT NULL,
+            PRIMARY KEY (simbol, interval)
+        )
+    ''')
+    return conn
+
+# Merapikan kolom hasil yfinance menjadi OHLCV datar
+def rapikan_kolom(df):
+    """
+    Meratakan kolom MultiIndex dan hanya menyisakan kolom OHLCV
+    Return: frame baru; kolom df milik pemanggil tidak diubah
+    """
+    if isinstance(df.columns, pd.MultiIndex):
+        df = df.droplevel(list(range(1, df.columns.nlevels)), axis=1)
+    return df[['Open', 'High', 'Low', 'Close', 'Volume']]
+
+# Waktu bar sebagai nanodetik epoch UTC
+def waktu_utc_ns(index):
+    """
+    Index tanpa zona (bar harian yfinance) dianggap UTC, sama seperti saat disimpan
+    """
+    if index.tzinfo is None:
+        index = index.tz_localize('UTC')
+    return index.tz_convert('UTC').as_unit('ns').asi8
+
+# Mengecek apakah penyedia data sudah menyesuaikan ulang riwayat yang tersimpan
+def riwayat_berubah(waktu_lama, penutupan_lama, df_baru, sebelum_ns):
+    """
+    yfinance memakai auto_adjust=True: setelah split atau dividen seluruh
+    riwayat dihitung ulang, sehingga bar lama yang diunduh ulang tidak lagi
+    sama dengan yang tersimpan. Menambahkan bar baru saja akan membuat
+    riwayat tersimpan tidak sambung.
+    Parameter:
+        waktu_lama, penutupan_lama: array bar tersimpan (ns epoch UTC, Close)
+        df_baru: DataFrame hasil unduhan ulang (format yfinance)
+        sebelum_ns: hanya bar sebelum waktu ini yang dibandingkan (bar terakhir bisa belum final)
+    Return: True jika ada bar tumpang tindih dengan harga penutupan berbeda
+    """
+    df_baru = rapikan_kolom(df_baru).dropna(subset=['Close'])
+    waktu_baru = waktu_utc_ns(df_baru.index)
+    sama, posisi_lama, posisi_baru = np.intersect1d(
+        np.asarray(waktu_lama), waktu_baru, assume_unique=True, return_indices=True
+    )
+    final = sama < sebelum_ns
+    lama = np.asarray(penutupan_lama, dtype=np.float64)[posisi_lama[final]]
+    baru = df_baru['Close'].to_numpy(dtype=np.float64)[posisi_baru[final]]
+    return not np.allclose(lama, baru, rtol=TOLERANSI_PENYESUAIAN, atol=0, equal_nan=True)
+
+# Menyimpan data OHLCV ke database lokal
+def simpan_data_tersimpan(simbol, interval, df, cakupan_hari=None, ganti=False):
+    """
+    Menggabungkan bar baru ke database; bar dengan waktu yang sama ditimpa
+    Bar intraday yang lebih tua dari BATAS_HARI_INTRADAY dihapus (penyedia
+    juga tidak lagi menyediakannya), sehingga tabel tidak tumbuh tanpa batas.
+    Parameter:
+        simbol: kode ticker saham
+        interval: interval waktu per data point
+        df: DataFrame OHLCV dengan index waktu
+        cakupan_hari: cakupan periode yang sudah diunduh penuh (opsional)
+        ganti: hapus semua bar lama terlebih dahulu (riwayat disesuaikan ulang)
+    """
+    df = rapikan_kolom(df).dropna(subset=['Close'])
+    waktu = waktu_utc_ns(df.index)
+
+    baris = zip(
+        [simbol] * len(df),
+        [interval] * len(df),
+        waktu.tolist(),
+        df['Open'].tolist(),
+        df['High'].tolist(),
+        df['Low'].tolist(),
+        df['Close'].tolist(),
+        df['Volume'].tolist()
+    )
+
+    with closing(buka_database()) as conn, conn:
+        if ganti:
+            conn.execute('DELETE FROM ohlcv WHERE simbol = ? AND interval = ?', (simbol, interval))
+        conn.executemany(
+            'INSERT OR REPLACE INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            baris
+        )
+        if interval in BATAS_HARI_INTRADAY:
+            batas = waktu_pasar() - timedelta(days=BATAS_HARI_INTRADAY[interval])
+            conn.execute(
+                'DELETE FROM ohlcv WHERE simbol = ? AND interval = ? AND waktu < ?',
+                (simbol, interval, batas.value)
+            )
+        if cakupan_hari is None:
+            conn.execute(
+                'UPDATE pembaruan SET diambil = ? WHERE simbol = ? AND interval = ?',
+                (time.time(), simbol, interval)
+            )
+        else:
+            conn.execute(
+                'INSERT OR REPLACE INTO pembaruan VALUES (?, ?, ?, ?)',
+                (simbol, interval, time.time(), cakupan_hari)
+            )
+
+# Membaca data OHLCV dari database lokal
+def baca_data_tersimpan(simbol, interval, sejak_ns=None, batas_bar=None):
+    """
+    Membaca bar tersimpan dalam format yang sama dengan yfinance
+    Filter waktu dan jumlah bar dijalankan di query SQL (index primary key).
+    Parameter:
+        simbol: kode ticker saham
+        interval: interval waktu per data point
+        sejak_ns: hanya bar dengan waktu >= nilai ini (ns epoch UTC), opsional
+        batas_bar: hanya sejumlah bar terakhir, opsional
+    Return:
+        (DataFrame OHLCV dengan index UTC, info pembaruan atau None)
+    """
+    with closing(buka_database()) as conn:
+        df = pd.read_sql_query(
+            'SELECT * FROM ('
+            'SELECT waktu, open, high, low, close, volume FROM ohlcv '
+            'WHERE simbol = ? AND interval = ? AND waktu >= ? ORDER BY waktu DESC LIMIT ?'
+            ') ORDER BY waktu',
+            conn,
+            params=(simbol, interval, -2**63 if sejak_ns is None else int(sejak_ns), -1 if batas_bar is None else batas_bar)
+        )
+        info = conn.execute(
+            'SELECT diambil, cakupan_hari FROM pembaruan WHERE simbol = ? AND interval = ?',
+            (simbol, interval)
+        ).fetchone()
+
+    nama_index = 'Datetime' if interval in BATAS_HARI_INTRADAY else 'Date'
+    df.index = pd.DatetimeIndex(pd.to_datetime(df.pop('waktu'), unit='ns', utc=True), name=nama_index)
+    df.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+    df['Volume'] = df['Volume'].fillna(0).astype('int64')
+    return df, info
+
+# Membaca info pembaruan banyak ticker sekaligus
+def baca_info_banyak(daftar_simbol, interval):
+    """
+    Return:
+        dict {simbol: (diambil, cakupan_hari, waktu bar terakhir ns)} untuk
+        ticker yang sudah tersimpan
+    """
+    penanda = ', '.join('?' * len(daftar_simbol))
+    with closing(buka_database()) as conn:
+        baris = conn.execute(
+            'SELECT p.simbol, p.diambil, p.cakupan_hari, '
+            '(SELECT MAX(o.waktu) FROM ohlcv o WHERE o.simbol = p.simbol AND o.interval = p.interval) '
+            f'FROM pembaruan p WHERE p.interval = ? AND p.simbol IN ({penanda})',
+            (interval, *daftar_simbol)
+        ).fetchall()
+    return {simbol: (diambil, cakupan, terakhir) for simbol, diambil, cakupan, terakhir in baris if terakhir is not None}
+
+# Membaca bar tersimpan banyak ticker dalam satu query
+def baca_banyak_tersimpan(daftar_simbol, interval, sejak_ns=None):
+    """
+    Parameter:
+        daftar_simbol: kode ticker
+        interval: interval waktu per data point
+        sejak_ns: hanya bar dengan waktu >= nilai ini (ns epoch UTC), opsional
+    Return:
+        DataFrame panjang (simbol, waktu, high, low, close, volume) urut
+        per simbol lalu waktu; waktu dalam ns epoch UTC
+    """
+    penanda = ', '.join('?' * len(daftar_simbol))
+    with closing(buka_database()) as conn:
+        return pd.read_sql_query(
+            'SELECT simbol, waktu, high, low, close, volume FROM ohlcv '
+            f'WHERE interval = ? AND simbol IN ({penanda}) AND waktu >= ? AND close IS NOT NULL '
+            'ORDER BY simbol, waktu',
+            conn,
+            params=(interval, *daftar_simbol, -2**63 if sejak_ns is None else int(sejak_ns))
+        )
+
+# Batas bawah waktu bar yang perlu dibaca untuk sebuah periode
+def batas_baca_periode(periode, waktu_terakhir):
+    """
+    Batas longgar (tidak pernah melewati awal periode sebenarnya) untuk filter
+    SQL; potong_periode kemudian memotong tepat
+    Parameter:
+        periode: rentang waktu data
+        waktu_terakhir: pd.Timestamp bar terakhir yang tersimpan
+    Return: ns epoch UTC, atau None untuk seluruh riwayat
+    """
+    if periode == '1minggu':
+        return (waktu_pasar() - timedelta(days=7)).value
+    if periode.endswith('d') and periode != 'ytd':
+        # N sesi terakhir; akhir pekan dan libur bursa ikut dicakup
+        return (waktu_terakhir - timedelta(days=int(periode[:-1]) * 7 // 5 + 10)).value
+    if periode in CAKUPAN_PERIODE and periode != 'max':
+        return (waktu_terakhir - timedelta(days=CAKUPAN_PERIODE[periode] + 2)).value
+    return None
+
+# Membaca bar tersimpan untuk satu periode
+def baca_periode_tersimpan(simbol, periode, interval):
+    """
+    Hanya bar di sekitar periode yang dibaca dari database, lalu dipotong
+    dengan potong_periode
+    Return: DataFrame OHLCV dengan index UTC
+    """
+    terakhir, _ = baca_data_tersimpan(simbol, interval, batas_bar=1)
+    if terakhir.empty:
+        return terakhir
+    data, _ = baca_data_tersimpan(simbol, interval, batas_baca_periode(periode, terakhir.index[-1]))
+    return potong_periode(data, periode, simbol)
+
+# Posisi bar pertama sebuah periode pada index waktu yang urut
+def posisi_awal_periode(index, periode, simbol):
+    """
+    Mengikuti arti periode di yfinance; bar yang masuk periode selalu berupa
+    ekor index, jadi cukup posisi awalnya
+    Parameter:
+        index: DatetimeIndex ber-zona, urut waktu
+        periode: rentang waktu data
+        simbol: kode ticker; periode hari dihitung per sesi di zona waktu bursanya
+    Return: posisi int (0 = seluruh index)
+    """
+    if len(index) == 0 or periode == 'max':
+        return 0
+
+    if periode == '1minggu':
+        return int(index.searchsorted(waktu_pasar() - timedelta(days=7)))
+
+    if periode.endswith('d') and periode != 'ytd':
+        # Periode hari dihitung per sesi bursa, bukan per 24 jam
+        tanggal_bursa = index.tz_convert(BURSA[bursa_simbol(simbol)]['zona']).normalize()
+        sesi = tanggal_bursa.unique()[-int(periode[:-1]):]
+        return int(tanggal_bursa.searchsorted(sesi[0]))
+
+    waktu_terakhir = index[-1]
+    if periode == 'ytd':
+        batas = waktu_terakhir.normalize().replace(month=1, day=1)
+    elif periode.endswith('mo'):
+        batas = waktu_terakhir - pd.DateOffset(months=int(periode[:-2]))
+    elif periode.endswith('y'):
+        batas = waktu_terakhir - pd.DateOffset(years=int(periode[:-1]))
+    else:
+        return 0
+    return int(index.searchsorted(batas, side='right'))
+
+# Memotong data tersimpan sesuai periode yang diminta
+def potong_periode(df, periode, simbol):
+    """
+    Mengambil bar yang masuk dalam periode (lihat posisi_awal_periode)
+    Parameter:
+        df: DataFrame OHLCV dengan index waktu ber-zona
+        periode: rentang waktu data
+        simbol: kode ticker
+    """
+    return df.iloc[posisi_awal_periode(df.index, periode, simbol):]
@@ -0,0 +1,120 @@
+# Perbandingan banyak saham: harga penutupan semua ticker disejajarkan dalam
+# satu matriks 2D (baris = waktu, kolom = ticker) lalu dihitung sekaligus
+
+import numpy as np
+import pandas as pd
+
+from .indikator import PARAMETER_INDIKATOR, hitung_indikator_matriks
+
+# Pilihan tampilan grafik perbandingan: label -> kunci hasil hitung_perbandingan
+TAMPILAN_PERBANDINGAN = {
+    'Return Ternormalisasi': 'normal',
+    'Performa Relatif': 'relatif',
+    'Drawdown': 'drawdown'
+}
+
+# Mengambil harga penutupan dan waktu (ns epoch UTC) dari data mentah
+def penutupan_mentah(df):
+    """
+    Data mentah hasil ambil_data_saham/yfinance (kolom datar atau MultiIndex)
+    Return: (waktu int64, harga float64)
+    """
+    nama_kolom = df.columns.get_level_values(0) if isinstance(df.columns, pd.MultiIndex) else df.columns
+    harga = df.iloc[:, list(nama_kolom).index('Close')].to_numpy(dtype=np.float64)
+    waktu = df.index
+    if waktu.tzinfo is None:
+        waktu = waktu.tz_localize('UTC')
+    return waktu.as_unit('ns').asi8, harga
+
+# Mengisi nilai kosong dengan nilai terakhir di kolom yang sama
+def isi_maju(matriks):
+    """
+    Forward-fill per kolom tanpa loop Python; NaN sebelum nilai pertama tetap NaN
+    """
+    n, k = matriks.shape
+    baris = np.where(~np.isnan(matriks), np.arange(n)[:, None], 0)
+    np.maximum.accumulate(baris, axis=0, out=baris)
+    return matriks[baris, np.arange(k)]
+
+# Menyusun matriks harga penutupan (waktu x ticker)
+def bangun_matriks_harga(data_per_simbol):
+    """
+    Menyejajarkan harga penutupan semua ticker pada gabungan seluruh timestamp
+    Bar yang tidak dimiliki sebuah ticker diisi harga terakhirnya; sebelum bar
+    pertama ticker tersebut nilainya NaN.
+    Parameter:
+        data_per_simbol: dict {simbol: DataFrame mentah}, None/kosong dilewati
+    Return:
+        dict {'simbol': list, 'waktu': int64 ns epoch UTC, 'harga': array (waktu, simbol)}
+    """
+    simbol, seri = [], []
+    for kode, df in data_per_simbol.items():
+        if df is None or df.empty:
+            continue
+        simbol.append(kode)
+        seri.append(penutupan_mentah(df))
+
+    if not simbol:
+        return {'simbol': [], 'waktu': np.empty(0, dtype=np.int64), 'harga': np.empty((0, 0))}
+
+    waktu = np.unique(np.concatenate([w for w, _ in seri]))
+    harga = np.full((len(waktu), len(simbol)), np.nan)
+    for j, (waktu_simbol, harga_simbol) in enumerate(seri):
+        harga[np.searchsorted(waktu, waktu_simbol), j] = harga_simbol
+
+    return {'simbol': simbol, 'waktu': waktu, 'harga': isi_maju(harga)}
+
+# Menghitung return, performa relatif, drawdown dan indikator untuk semua ticker
+def hitung_perbandingan(matriks, indikator):
+    """
+    Semua perhitungan berjalan pada seluruh kolom sekaligus
+    Parameter:
+        matriks: hasil bangun_matriks_harga
+        indikator: daftar pilihan dari PARAMETER_INDIKATOR
+    Return:
+        dict dengan array (waktu, simbol):
+            normal: return sejak bar pertama tiap ticker (pecahan, 0.1 = 10%)
+            relatif: kinerja terhadap rata-rata seluruh ticker (bobot sama)
+            drawdown: penurunan dari harga puncak sebelumnya
+            indikator: {nama: nilai indikator pada skala harga}
+        serta 'simbol', 'waktu', 'harga', 'harga_awal' dan tabel 'ringkasan'
+    """
+    harga = matriks['harga']
+    n, k = harga.shape
+    kolom = np.arange(k)
+    ada = ~np.isnan(harga)
+    awal = np.argmax(ada, axis=0)  # bar pertama setiap ticker
+    harga_awal = harga[awal, kolom]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        normal = harga / harga_awal - 1
+        rata_keranjang = np.nanmean(1 + normal, axis=1, keepdims=True)
+        relatif = (1 + normal) / rata_keranjang - 1
+        drawdown = harga / np.fmax.accumulate(harga, axis=0) - 1
+
+    nilai_indikator = hitung_indikator_matriks(harga, indikator)
+
+    ringkasan = {
+        'Saham': matriks['simbol'],
+        'Return (%)': normal[-1] * 100 if n else [],
+        'Relatif (%)': relatif[-1] * 100 if n else [],
+        'Drawdown Saat Ini (%)': drawdown[-1] * 100 if n else [],
+        'Drawdown Maks (%)': np.nanmin(drawdown, axis=0) * 100 if n else []
+    }
+    for nama, nilai in nilai_indikator.items():
+        if PARAMETER_INDIKATOR[nama][1] == 'RSI':
+            ringkasan[nama] = nilai[-1]
+        else:
+            ringkasan[f'Harga vs {nama} (%)'] = (harga[-1] / nilai[-1] - 1) * 100
+
+    return {
+        'simbol': matriks['simbol'],
+        'waktu': matriks['waktu'],
+        'harga': harga,
+        'harga_awal': harga_awal,
+        'normal': normal,
+        'relatif': relatif,
+        'drawdown': drawdown,
+        'indikator': nilai_indikator,
+        'ringkasan': pd.DataFrame(ringkasan)
+    }
@@ -0,0 +1,156 @@
+# Indeks rentang: metrik ringkasan (hitung_metrik) untuk potongan waktu mana pun
+# Indeks dibangun sekali per frame: jumlah kumulatif untuk volume dan tabel
+# agregat per blok untuk tertinggi/terendah, sehingga metrik potongan yang
+# dipilih di grafik dihitung tanpa memindai ulang frame.
+
+import numpy as np
+import pandas as pd
+
+from .pemrosesan import ZONA_WAKTU, waktu_epoch_ns
+
+# Jumlah bar per blok tabel tertinggi/terendah
+UKURAN_BLOK = 64
+
+# Membangun tabel agregat (maksimum/minimum) untuk kueri rentang
+def tabel_rentang(nilai, fungsi):
+    """
+    Tiga bagian dengan memori O(n):
+    - awalan/akhiran: agregat dari awal blok sampai bar i / dari bar i sampai akhir blok
+    - jarang: sparse table atas agregat setiap blok (level k = 2^k blok berurutan)
+    Parameter:
+        nilai: array float64
+        fungsi: np.fmax atau np.fmin (NaN diabaikan, seperti max/min pandas)
+    """
+    n = len(nilai)
+    jumlah_blok = max(-(-n // UKURAN_BLOK), 1)
+    isi = np.full(jumlah_blok * UKURAN_BLOK, np.nan)
+    isi[:n] = nilai
+    blok = isi.reshape(jumlah_blok, UKURAN_BLOK)
+
+    awalan = fungsi.accumulate(blok, axis=1).ravel()[:n]
+    akhiran = fungsi.accumulate(blok[:, ::-1], axis=1)[:, ::-1]
+    jarang = [akhiran[:, 0].copy()]
+    lebar = 1
+    while 2 * lebar <= jumlah_blok:
+        sebelumnya = jarang[-1]
+        jarang.append(fungsi(sebelumnya[:-lebar], sebelumnya[lebar:]))
+        lebar *= 2
+
+    return {
+        'nilai': nilai,
+        'fungsi': fungsi,
+        'awalan': awalan,
+        'akhiran': akhiran.ravel()[:n],
+        'jarang': jarang
+    }
+
+# Agregat nilai[awal:akhir] dari tabel_rentang
+def kueri_rentang(tabel, awal, akhir):
+    """
+    Paling banyak empat nilai tabel (O(1)); rentang di dalam satu blok
+    dihitung langsung dari paling banyak UKURAN_BLOK nilai.
+    """
+    fungsi = tabel['fungsi']
+    blok_awal = awal // UKURAN_BLOK
+    blok_akhir = (akhir - 1) // UKURAN_BLOK
+    if blok_awal == blok_akhir:
+        return fungsi.reduce(tabel['nilai'][awal:akhir])
+
+    hasil = fungsi(tabel['akhiran'][awal], tabel['awalan'][akhir - 1])
+    kiri, kanan = blok_awal + 1, blok_akhir
+    if kanan > kiri:
+        level = (kanan - kiri).bit_length() - 1
+        jarang = tabel['jarang'][level]
+        hasil = fungsi(hasil, fungsi(jarang[kiri], jarang[kanan - (1 << level)]))
+    return hasil
+
+# Membangun indeks rentang untuk satu frame olahan
+def bangun_indeks_rentang(df, kurs):
+    """
+    Parameter:
+        df: frame olahan (biasa atau ringkas); kolom Kurs dipakai jika ada
+        kurs: kurs tunggal jika df tidak memiliki kolom Kurs
+    Return: dict indeks untuk cari_rentang dan metrik_rentang
+    """
+    tertinggi = df['Tertinggi'].to_numpy(dtype=np.float64)
+    terendah = df['Terendah'].to_numpy(dtype=np.float64)
+    kurs_bar = df['Kurs'].to_numpy(dtype=np.float64) if 'Kurs' in df.columns else np.full(len(df), float(kurs))
+
+    volume = df['Volume'].to_numpy()
+    if volume.dtype.kind == 'f':
+        volume = np.nan_to_num(volume.astype(np.float64, copy=False), nan=0.0)
+    volume_kumulatif = np.cumsum(volume)
+
+    return {
+        'waktu': waktu_epoch_ns(df),
+        'penutupan': df['Penutupan'].to_numpy(dtype=np.float64),
+        'kurs': kurs_bar,
+        'volume_kumulatif': np.concatenate([np.zeros(1, dtype=volume_kumulatif.dtype), volume_kumulatif]),
+        'tertinggi': tabel_rentang(tertinggi, np.fmax),
+        'terendah': tabel_rentang(terendah, np.fmin),
+        'tertinggi_idr': tabel_rentang(tertinggi * kurs_bar, np.fmax),
+        'terendah_idr': tabel_rentang(terendah * kurs_bar, np.fmin)
+    }
+
+# Mencari indeks bar dalam rentang waktu
+def cari_rentang(indeks, mulai_ns, selesai_ns):
+    """
+    Pencarian biner pada waktu bar (O(log n))
+    Return: (awal, akhir) untuk potongan [awal:akhir], atau None jika tidak ada bar
+    """
+    awal = int(np.searchsorted(indeks['waktu'], mulai_ns, side='left'))
+    akhir = int(np.searchsorted(indeks['waktu'], selesai_ns, side='right'))
+    return (awal, akhir) if akhir > awal else None
+
+# Mengubah batas rentang dari grafik menjadi nanodetik epoch UTC
+def rentang_dari_grafik(x0, x1):
+    """
+    Parameter:
+        x0, x1: batas sumbu x dari seleksi Plotly (teks waktu ZONA_WAKTU tanpa
+                zona, atau milidetik jam dinding seperti waktu_milidetik)
+    Return: (mulai_ns, selesai_ns), atau None jika tidak bisa dibaca
+    """
+    def baca(x):
+        return pd.Timestamp(x, unit='ms') if isinstance(x, (int, float)) else pd.Timestamp(x)
+
+    try:
+        batas = pd.DatetimeIndex(sorted([baca(x0), baca(x1)]))
+    except (TypeError, ValueError):
+        return None
+    if batas.tz is None:
+        batas = batas.tz_localize(ZONA_WAKTU, ambiguous='NaT', nonexistent='shift_forward')
+    if batas.isna().any():
+        return None
+    mulai, selesai = batas.as_unit('ns').asi8
+    return int(mulai), int(selesai)
+
+# Menghitung metrik ringkasan untuk potongan [awal:akhir]
+def metrik_rentang(indeks, awal=0, akhir=None):
+    """
+    Hasil sama dengan hitung_metrik pada df.iloc[awal:akhir], tanpa membaca frame
+    """
+    if akhir is None:
+        akhir = len(indeks['waktu'])
+    penutupan = indeks['penutupan']
+    kurs_bar = indeks['kurs']
+
+    harga_terakhir_usd = penutupan[akhir - 1]
+    harga_awal_usd = penutupan[awal]
+    perubahan_usd = harga_terakhir_usd - harga_awal_usd
+    harga_terakhir_idr = harga_terakhir_usd * kurs_bar[akhir - 1]
+    harga_awal_idr = harga_awal_usd * kurs_bar[awal]
+    perubahan_idr = harga_terakhir_idr - harga_awal_idr
+
+    return {
+        'harga_terakhir_usd': harga_terakhir_usd,
+        'harga_terakhir_idr': harga_terakhir_idr,
+        'perubahan_usd': perubahan_usd,
+        'perubahan_idr': perubahan_idr,
+        'perubahan_persen': (perubahan_usd / harga_awal_usd) * 100,
+        'perubahan_persen_idr': (perubahan_idr / harga_awal_idr) * 100,
+        'harga_tertinggi_usd': kueri_rentang(indeks['tertinggi'], awal, akhir),
+        'harga_tertinggi_idr': kueri_rentang(indeks['tertinggi_idr'], awal, akhir),
+        'harga_terendah_usd': kueri_rentang(indeks['terendah'], awal, akhir),
+        'harga_terendah_idr': kueri_rentang(indeks['terendah_idr'], awal, akhir),
+        'total_volume': indeks['volume_kumulatif'][akhir] - indeks['volume_kumulatif'][awal]
+    }
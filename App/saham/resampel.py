@@ -0,0 +1,92 @@
+# Resampling OHLCV: membentuk bar interval kasar dari bar interval halus
+# (30m dari 5m, mingguan/bulanan dari harian) tanpa unduhan tambahan
+
+import numpy as np
+import pandas as pd
+
+from .konfigurasi import BATAS_HARI_INTRADAY
+from .pemrosesan import ZONA_WAKTU
+
+# Panjang bar intraday (menit)
+MENIT_INTERVAL = {
+    '1m': 1,
+    '5m': 5,
+    '30m': 30,
+    '1h': 60
+}
+
+# Jam buka sesi bawaan (menit sejak tengah malam): sesi reguler bursa AS;
+# bursa lain memakai jam buka dari kalender.BURSA
+MENIT_BUKA_AWAL = 9 * 60 + 30
+NS_MENIT = 60 * 10**9
+NS_HARI = 86400 * 10**9
+
+# Menentukan bucket setiap bar
+def kunci_bucket(waktu, interval, interval_sumber, zona=ZONA_WAKTU, menit_buka=MENIT_BUKA_AWAL):
+    """
+    Parameter:
+        waktu: DatetimeIndex tz-aware dari data sumber
+        interval: interval tujuan
+        interval_sumber: interval data sumber
+        zona, menit_buka: zona waktu dan jam buka bursa ticker
+    Return:
+        (kunci bucket int64 per bar, label awal bucket per bar sebagai ns UTC)
+    Semua bucket dihitung dari jam dinding bursa:
+    - intraday: kelipatan interval sejak jam buka pada hari yang sama, sehingga
+      tidak ada bar yang melewati batas sesi (juga saat DST)
+    - harian: minggu (mulai Senin) atau bulan dari tanggal lokal bursa. Bar
+      harian datang sebagai tengah malam waktu bursa (tz-aware; .JK 00:00 WIB
+      = 17:00 UTC hari sebelumnya) atau tanggal bursa pukul 00:00 UTC
+      (yf.download harian tanpa zona); tanggal lokal diambil pada tengah hari
+      bar tersebut sehingga keduanya jatuh pada tanggal bursa yang sama
+    Label adalah waktu UTC bar dikurangi jaraknya ke awal bucket pada jam
+    dinding, jadi jam dinding tidak pernah dilokalkan ulang: jam yang berulang
+    saat DST mundur (bar 24 jam seperti valas/kripto) tidak ambigu.
+    """
+    utc = waktu.tz_convert('UTC').as_unit('ns').asi8
+
+    if interval_sumber in BATAS_HARI_INTRADAY:
+        dinding = waktu.tz_convert(zona).tz_localize(None).as_unit('ns').asi8
+        nol_sesi = dinding // NS_HARI * NS_HARI + menit_buka * NS_MENIT
+        lebar = MENIT_INTERVAL[interval] * NS_MENIT
+        label = utc - (dinding - nol_sesi) % lebar
+        # Kunci = label UTC, sehingga dua jam 01:00 saat DST mundur tetap bucket berbeda
+        return label, label
+
+    tengah_hari = (waktu + pd.Timedelta(hours=12)).tz_convert(zona).tz_localize(None).as_unit('ns').asi8
+    hari = tengah_hari // NS_HARI * NS_HARI
+    tanggal = pd.DatetimeIndex(hari.astype('datetime64[ns]'))
+    mundur = tanggal.weekday if interval == '1wk' else tanggal.day - 1
+    kunci = hari - np.asarray(mundur, dtype=np.int64) * NS_HARI
+    # Label: bar pertama bucket dimundurkan ke tanggal awal bucket (jam bar tetap)
+    return kunci, utc - (hari - kunci)
+
+# Membentuk bar interval kasar dari data interval halus
+def resampel_ohlcv(df, interval, interval_sumber, zona=ZONA_WAKTU, menit_buka=MENIT_BUKA_AWAL):
+    """
+    Agregasi OHLCV per bucket: open pertama, high maksimum, low minimum,
+    close terakhir, volume dijumlah
+    Parameter:
+        df: DataFrame OHLCV (hasil ambil_data_saham) urut waktu
+        interval: interval tujuan ('30m', '1wk', '1mo', ...)
+        interval_sumber: interval df
+        zona, menit_buka: zona waktu dan jam buka bursa ticker (kalender.BURSA)
+    Return:
+        DataFrame OHLCV dengan index UTC seperti baca_data_tersimpan
+    """
+    nama_index = 'Datetime' if interval in BATAS_HARI_INTRADAY else 'Date'
+    if df.empty:
+        return df.rename_axis(nama_index)
+
+    waktu = df.index if df.index.tzinfo is not None else df.index.tz_localize('UTC')
+    kunci, label = kunci_bucket(waktu, interval, interval_sumber, zona, menit_buka)
+    awal = np.flatnonzero(np.r_[True, kunci[1:] != kunci[:-1]])
+    akhir = np.r_[awal[1:], len(kunci)] - 1
+
+    return pd.DataFrame({
+        'Open': df['Open'].to_numpy()[awal],
+        'High': np.fmax.reduceat(df['High'].to_numpy(), awal),
+        'Low': np.fmin.reduceat(df['Low'].to_numpy(), awal),
+        'Close': df['Close'].to_numpy()[akhir],
+        'Volume': np.add.reduceat(df['Volume'].to_numpy(), awal, dtype=np.int64)
+    }, index=pd.DatetimeIndex(label[awal].astype('datetime64[ns]'), name=nama_index).tz_localize('UTC'))
@@ -0,0 +1,118 @@
+# Sapuan parameter: uji balik persilangan dua garis (SMA/EMA) untuk seluruh
+# kombinasi window sekaligus. Semua garis dihitung sekali sebagai matriks
+# (waktu, window), lalu uji balik berjalan per kelompok baris grid di beberapa
+# thread (operasi NumPy melepas GIL, dan matriks tidak perlu disalin ke proses lain).
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .indikator import hitung_ema_banyak, hitung_sma_banyak
+from .pemrosesan import waktu_epoch_ns
+from .ujibalik import skala_tahunan
+
+# Jenis garis yang bisa disapu
+GARIS_SAPUAN = {
+    'SMA': hitung_sma_banyak,
+    'EMA': hitung_ema_banyak
+}
+
+# Metrik hasil sapuan yang bisa ditampilkan (nama sama dengan ringkasan uji_balik)
+METRIK_SAPUAN = ['Total Return (%)', 'Sharpe', 'Drawdown Maks (%)', 'Jumlah Transaksi']
+
+# Batas sel grid (window cepat x window lambat x bar) per kelompok kerja
+SEL_PER_KELOMPOK = 1_000_000
+
+# Menghitung metrik uji balik untuk banyak kolom sinyal sekaligus
+def metrik_sinyal(sinyal, return_harga, biaya_bps, bar_per_tahun):
+    """
+    Definisi sama dengan uji_balik: posisi berlaku mulai bar berikutnya,
+    biaya per perubahan posisi.
+    Parameter:
+        sinyal: array (waktu, kombinasi) berisi 0/1
+        return_harga: array (waktu,) return harga per bar (bar pertama 0)
+    Return: dict {nama metrik: array (kombinasi,)}
+    """
+    posisi = np.zeros_like(sinyal)
+    posisi[1:] = sinyal[:-1]
+    perubahan = np.diff(posisi, axis=0, prepend=0.0)
+
+    return_strategi = posisi * return_harga[:, None]
+    return_strategi -= np.abs(perubahan) * (biaya_bps / 1e4)
+    ekuitas = np.cumprod(1.0 + return_strategi, axis=0)
+    drawdown = (ekuitas / np.maximum.accumulate(ekuitas, axis=0)).min(axis=0) - 1.0
+
+    rata = return_strategi[1:].mean(axis=0)
+    simpangan = return_strategi[1:].std(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(simpangan > 0, rata / simpangan * np.sqrt(bar_per_tahun), np.nan)
+
+    return {
+        'Total Return (%)': (ekuitas[-1] - 1.0) * 100,
+        'Sharpe': sharpe,
+        'Drawdown Maks (%)': drawdown * 100,
+        'Jumlah Transaksi': (perubahan > 0).sum(axis=0).astype(np.float64)
+    }
+
+# Menyapu seluruh kombinasi window persilangan
+def sapu_parameter(df, jenis_cepat, window_cepat, jenis_lambat, window_lambat, biaya_bps=10, pekerja=None):
+    """
+    Posisi long selama garis cepat di atas garis lambat, untuk setiap pasangan
+    (window cepat, window lambat)
+    Parameter:
+        df: DataFrame hasil olah_data
+        jenis_cepat, jenis_lambat: kunci GARIS_SAPUAN ('SMA' atau 'EMA')
+        window_cepat, window_lambat: daftar window untuk baris dan kolom grid
+        biaya_bps: biaya per perubahan posisi (basis poin)
+        pekerja: jumlah thread, default jumlah core CPU
+    Return:
+        dict {'jenis_cepat', 'jenis_lambat', 'window_cepat', 'window_lambat',
+              'metrik': {nama: array (cepat, lambat)}}
+    """
+    window_cepat = list(window_cepat)
+    window_lambat = list(window_lambat)
+    harga = df['Penutupan'].to_numpy(dtype=np.float64)
+    n = len(harga)
+
+    garis_cepat = GARIS_SAPUAN[jenis_cepat](harga, window_cepat)
+    garis_lambat = GARIS_SAPUAN[jenis_lambat](harga, window_lambat)
+
+    return_harga = np.zeros(n)
+    if n > 1:
+        np.divide(harga[1:], harga[:-1], out=return_harga[1:])
+        return_harga[1:] -= 1.0
+    _, bar_per_tahun = skala_tahunan(waktu_epoch_ns(df))
+
+    # Baris grid dibagi ke kelompok dengan ukuran matriks kerja yang terbatas
+    baris_per_kelompok = max(1, SEL_PER_KELOMPOK // max(n * len(window_lambat), 1))
+    kelompok = [
+        range(mulai, min(mulai + baris_per_kelompok, len(window_cepat)))
+        for mulai in range(0, len(window_cepat), baris_per_kelompok)
+    ]
+
+    def hitung_kelompok(baris):
+        cepat = garis_cepat[:, baris.start:baris.stop]
+        with np.errstate(invalid='ignore'):
+            sinyal = (cepat[:, :, None] > garis_lambat[:, None, :]).astype(np.float64)
+        hasil = metrik_sinyal(sinyal.reshape(n, -1), return_harga, biaya_bps, bar_per_tahun)
+        return {nama: nilai.reshape(len(baris), len(window_lambat)) for nama, nilai in hasil.items()}
+
+    pekerja = pekerja or os.cpu_count() or 1
+    if pekerja > 1 and len(kelompok) > 1:
+        with ThreadPoolExecutor(max_workers=min(pekerja, len(kelompok)), thread_name_prefix='sapuan') as kolam:
+            hasil_kelompok = list(kolam.map(hitung_kelompok, kelompok))
+    else:
+        hasil_kelompok = [hitung_kelompok(baris) for baris in kelompok]
+
+    return {
+        'jenis_cepat': jenis_cepat,
+        'jenis_lambat': jenis_lambat,
+        'window_cepat': window_cepat,
+        'window_lambat': window_lambat,
+        'metrik': {
+            nama: np.concatenate([h[nama] for h in hasil_kelompok]) if hasil_kelompok
+            else np.empty((0, len(window_lambat)))
+            for nama in METRIK_SAPUAN
+        }
+    }
@@ -0,0 +1,136 @@
+# Uji balik (backtest) strategi dari kolom indikator SMA/EMA/RSI
+# Sinyal, posisi, ekuitas dan statistik transaksi dihitung sebagai array NumPy
+# tanpa loop per bar, sehingga uji balik puluhan tahun data harian selesai
+# dalam hitungan milidetik.
+
+import numpy as np
+
+from .indikator import PARAMETER_INDIKATOR, tambah_indikator
+from .pemrosesan import waktu_epoch_ns
+from .perbandingan import isi_maju
+
+# Strategi yang bisa diuji: label -> (jenis, kolom cepat/RSI, kolom lambat)
+STRATEGI_UJI = {
+    'Persilangan SMA 20/50': ('silang', 'SMA_20', 'SMA_50'),
+    'Persilangan EMA 20/50': ('silang', 'EMA_20', 'EMA_50'),
+    'RSI Batas Bawah/Atas': ('rsi', 'RSI', None)
+}
+
+NS_TAHUN = 365.25 * 86400 * 10**9
+
+# Lama data dan jumlah bar per tahun, untuk CAGR, volatilitas dan Sharpe tahunan
+def skala_tahunan(waktu):
+    """
+    Parameter:
+        waktu: int64 ns epoch UTC per bar
+    Return: (tahun, bar per tahun); (0, 0) jika kurang dari dua bar
+    """
+    if len(waktu) < 2 or waktu[-1] <= waktu[0]:
+        return 0.0, 0.0
+    tahun = (waktu[-1] - waktu[0]) / NS_TAHUN
+    return tahun, (len(waktu) - 1) / tahun
+
+# Posisi dari persilangan dua garis
+def posisi_silang(cepat, lambat):
+    """
+    1 selama garis cepat di atas garis lambat, 0 selain itu (termasuk saat NaN)
+    """
+    with np.errstate(invalid='ignore'):
+        return (cepat > lambat).astype(np.float64)
+
+# Posisi dari batas RSI
+def posisi_rsi(rsi, batas_bawah, batas_atas):
+    """
+    Masuk saat RSI < batas_bawah, keluar saat RSI > batas_atas; di antaranya
+    posisi terakhir dipertahankan (forward-fill, bukan loop)
+    """
+    sinyal = np.full(len(rsi), np.nan)
+    with np.errstate(invalid='ignore'):
+        sinyal[rsi < batas_bawah] = 1.0
+        sinyal[rsi > batas_atas] = 0.0
+    return np.nan_to_num(isi_maju(sinyal[:, None])[:, 0], nan=0.0)
+
+# Menjalankan uji balik satu strategi
+def uji_balik(df, strategi, batas_bawah=30, batas_atas=70, biaya_bps=10):
+    """
+    Strategi long-only: sinyal dihitung dari harga penutupan bar t dan posisi
+    berlaku mulai bar t+1 (tanpa melihat ke depan).
+    Parameter:
+        df: DataFrame hasil olah_data (+ indikator; yang belum ada dihitung)
+        strategi: label dari STRATEGI_UJI
+        batas_bawah, batas_atas: batas RSI untuk strategi RSI
+        biaya_bps: biaya per perubahan posisi (basis poin dari nilai ekuitas)
+    Return:
+        dict {'waktu' (ns epoch UTC), 'posisi', 'ekuitas', 'ekuitas_tahan'
+        (beli dan tahan), 'drawdown', 'transaksi' (indeks masuk, indeks keluar,
+        return per transaksi) dan 'ringkasan' (dict statistik)}
+    """
+    jenis, kolom_a, kolom_b = STRATEGI_UJI[strategi]
+
+    # Indikator yang belum ada dihitung pada salinan dangkal (frame dipakai bersama)
+    belum_ada = [
+        nama for nama, (kolom, _, _) in PARAMETER_INDIKATOR.items()
+        if kolom in (kolom_a, kolom_b) and kolom not in df.columns
+    ]
+    if belum_ada:
+        df = tambah_indikator(df.copy(deep=False), belum_ada)
+
+    harga = df['Penutupan'].to_numpy(dtype=np.float64)
+    n = len(harga)
+    if jenis == 'silang':
+        sinyal = posisi_silang(df[kolom_a].to_numpy(dtype=np.float64), df[kolom_b].to_numpy(dtype=np.float64))
+    else:
+        sinyal = posisi_rsi(df[kolom_a].to_numpy(dtype=np.float64), batas_bawah, batas_atas)
+
+    posisi = np.zeros(n)
+    posisi[1:] = sinyal[:-1]
+
+    return_harga = np.zeros(n)
+    np.divide(harga[1:], harga[:-1], out=return_harga[1:])
+    return_harga[1:] -= 1.0
+    pergantian = np.abs(np.diff(posisi, prepend=0.0))
+    return_strategi = posisi * return_harga - pergantian * (biaya_bps / 1e4)
+
+    ekuitas = np.cumprod(1.0 + return_strategi)
+    ekuitas_tahan = harga / harga[0]
+    drawdown = ekuitas / np.maximum.accumulate(ekuitas) - 1.0
+
+    # Transaksi = potongan bar berurutan dengan posisi 1; biaya keluar ikut dihitung
+    perubahan = np.diff(posisi, prepend=0.0, append=0.0)
+    masuk = np.flatnonzero(perubahan > 0)
+    keluar = np.flatnonzero(perubahan < 0)
+    hasil_transaksi = ekuitas[np.minimum(keluar, n - 1)] / ekuitas[masuk - 1] - 1.0
+
+    waktu = waktu_epoch_ns(df)
+    tahun, bar_per_tahun = skala_tahunan(waktu)
+    simpangan = return_strategi[1:].std() if n > 1 else 0.0
+
+    ringkasan = {
+        'Total Return (%)': (ekuitas[-1] - 1) * 100,
+        'Beli & Tahan (%)': (ekuitas_tahan[-1] - 1) * 100,
+        'CAGR (%)': (ekuitas[-1] ** (1 / tahun) - 1) * 100 if tahun > 0 else np.nan,
+        'Volatilitas Tahunan (%)': simpangan * np.sqrt(bar_per_tahun) * 100,
+        'Sharpe': return_strategi[1:].mean() / simpangan * np.sqrt(bar_per_tahun) if simpangan > 0 else np.nan,
+        'Drawdown Maks (%)': drawdown.min() * 100,
+        'Jumlah Transaksi': len(masuk),
+        'Win Rate (%)': (hasil_transaksi > 0).mean() * 100 if len(masuk) else np.nan,
+        'Rata-rata per Transaksi (%)': hasil_transaksi.mean() * 100 if len(masuk) else np.nan,
+        'Waktu di Pasar (%)': posisi.mean() * 100
+    }
+
+    return {
+        'waktu': waktu,
+        'posisi': posisi,
+        'ekuitas': ekuitas,
+        'ekuitas_tahan': ekuitas_tahan,
+        'drawdown': drawdown,
+        'transaksi': (masuk, keluar, hasil_transaksi),
+        'ringkasan': ringkasan
+    }
+
+# Format statistik untuk tampilan
+def format_statistik(nilai, akhiran=''):
+    """
+    '-' untuk statistik yang tidak tersedia (NaN, misalnya belum ada transaksi)
+    """
+    return '-' if np.isnan(nilai) else f'{nilai:,.2f}{akhiran}'
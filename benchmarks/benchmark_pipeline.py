@@ -0,0 +1,627 @@
+# Benchmark pipeline data dashboard saham
+# Mengukur waktu dan memori puncak setiap tahap (olah_data, tambah_indikator,
+# hitung_metrik, pembuatan grafik) pada data OHLCV sintetis, serta waktu impor
+# dan memori awal modul paket saham. Berjalan offline. Sebelum mengukur, hasil
+# kernel indikator, resampling dan indeks rentang dibandingkan dengan acuannya.
+# --periksa-aplikasi juga menjalankan App/app.py (Streamlit AppTest, penyedia
+# replay) untuk memastikan jalur optimasi benar-benar dipakai titik masuk aplikasi,
+# dan satu tugas pemanasan untuk memastikan frame yang dipanaskan langsung
+# melayani indikator pilihan sesi tanpa menghitung ulang.
+#
+# Contoh:
+#   python benchmarks/benchmark_pipeline.py
+#   python benchmarks/benchmark_pipeline.py --ukuran 1000 1000000 --ulang 5
+#   python benchmarks/benchmark_pipeline.py --bandingkan
+#   python benchmarks/benchmark_pipeline.py --hanya-periksa
+#   python benchmarks/benchmark_pipeline.py --hanya-periksa --periksa-aplikasi
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+LOKASI_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOKASI_APP = os.path.join(LOKASI_REPO, 'App')
+LOKASI_HASIL = os.path.join(LOKASI_REPO, 'benchmarks', 'hasil')
+
+UKURAN_AWAL = [500, 5_000, 50_000, 500_000, 2_000_000]
+SEMUA_INDIKATOR = ['SMA 20', 'SMA 50', 'EMA 20', 'EMA 50', 'RSI']
+
+# Modul yang diukur waktu impornya (masing-masing di proses Python baru)
+MODUL_IMPOR = {
+    'saham.pengambilan': ['saham.pengambilan'],
+    'saham.layanan': ['saham.layanan'],
+    'saham.grafik': ['saham.grafik'],
+    'aplikasi': ['streamlit', 'saham.grafik', 'saham.layanan', 'saham.metrik', 'saham.pengambilan']
+}
+MODUL_BERAT = ['yfinance', 'plotly', 'scipy', 'ta', 'streamlit']
+
+# Memuat fungsi-fungsi dashboard dari paket saham tanpa Streamlit
+def muat_fungsi_dashboard():
+    """
+    Return: dict {nama: fungsi} untuk tahap yang diukur
+    """
+    os.environ.setdefault('SAHAM_PENYEDIA_DATA', 'replay')
+    sys.path.insert(0, LOKASI_APP)
+    from saham.grafik import buat_grafik_harga, buat_grafik_rsi
+    from saham.indikator import hitung_indikator_matriks, tambah_indikator, tambah_indikator_inkremental
+    from saham.layanan import ukuran_frame
+    from saham.pemrosesan import hitung_metrik, olah_data, ringkas_frame
+    from saham.rentang import bangun_indeks_rentang, metrik_rentang
+    from saham.resampel import resampel_ohlcv
+
+    return {
+        'olah_data': olah_data,
+        'tambah_indikator': tambah_indikator,
+        'tambah_indikator_inkremental': tambah_indikator_inkremental,
+        'hitung_indikator_matriks': hitung_indikator_matriks,
+        'hitung_metrik': hitung_metrik,
+        'buat_grafik_harga': buat_grafik_harga,
+        'buat_grafik_rsi': buat_grafik_rsi,
+        'ringkas_frame': ringkas_frame,
+        'ukuran_frame': ukuran_frame,
+        'resampel_ohlcv': resampel_ohlcv,
+        'bangun_indeks_rentang': bangun_indeks_rentang,
+        'metrik_rentang': metrik_rentang
+    }
+
+# Mengukur waktu impor dan memori awal setiap modul di proses baru
+def ukur_impor(ulang):
+    """
+    Setiap pengukuran memakai interpreter baru (cold start), diambil yang tercepat
+    Return: daftar hasil dengan tahap 'impor'
+    """
+    hasil = []
+    for varian, daftar_modul in MODUL_IMPOR.items():
+        kode = (
+            'import importlib, json, resource, sys, time\n'
+            'mulai = time.perf_counter()\n'
+            f'for modul in {daftar_modul!r}:\n'
+            '    importlib.import_module(modul)\n'
+            'durasi = time.perf_counter() - mulai\n'
+            'print(json.dumps({\n'
+            "    'detik': durasi,\n"
+            "    'memori_puncak': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,\n"
+            f"    'modul_berat': [m for m in {MODUL_BERAT!r} if m in sys.modules]\n"
+            '}))\n'
+        )
+        pengukuran = []
+        for _ in range(ulang):
+            keluaran = subprocess.run(
+                [sys.executable, '-c', kode],
+                cwd=LOKASI_APP, capture_output=True, text=True, check=True
+            ).stdout
+            pengukuran.append(json.loads(keluaran.strip().splitlines()[-1]))
+        terbaik = min(pengukuran, key=lambda p: p['detik'])
+        hasil.append({
+            'tahap': 'impor',
+            'baris': 0,
+            'varian': varian,
+            'detik': terbaik['detik'],
+            'memori_puncak': terbaik['memori_puncak'],
+            'modul_berat': ','.join(terbaik['modul_berat']) or '-'
+        })
+    return hasil
+
+# Kode yang dijalankan di proses baru: satu sesi App/app.py lewat AppTest
+KODE_PERIKSA_APLIKASI = '''
+import json, sqlite3
+from streamlit.testing.v1 import AppTest
+from saham.konfigurasi import LOKASI_DATABASE
+from saham.metrik import registri_metrik
+
+def hitungan():
+    registri = registri_metrik()
+    return {
+        'tahap': {tahap: data['hitungan'] for tahap, data in registri['tahap'].items()},
+        'cache': {cache: dict(data) for cache, data in registri['cache'].items()}
+    }
+
+at = AppTest.from_file('app.py', default_timeout=120)
+at.run()
+at.sidebar.multiselect[0].set_value(['SMA 20', 'RSI'])
+at.sidebar.button[0].click().run()
+pertama = hitungan()
+next(s for s in at.sidebar.selectbox if s.label == 'Tipe Grafik').set_value('Garis').run()
+kedua = hitungan()
+with sqlite3.connect(LOKASI_DATABASE) as conn:
+    baris = conn.execute('SELECT COUNT(*) FROM ohlcv').fetchone()[0]
+print(json.dumps({
+    'galat': [str(e.value) for e in at.exception],
+    'grafik': len(at.get('plotly_chart')),
+    'baris_tersimpan': baris,
+    'pertama': pertama,
+    'kedua': kedua
+}))
+'''
+
+# Memastikan titik masuk aplikasi memakai jalur pengambilan/pemrosesan paket saham
+def periksa_aplikasi(kesalahan):
+    """
+    Satu sesi App/app.py dijalankan di proses baru dengan penyedia replay,
+    database sementara dan tanpa pemanasan, lalu metrik tahap/cache-nya diperiksa:
+    database lokal dan penyedia data, indikator terpilih, grafik, unduhan
+    bersamaan, layanan data bersama, dan rerun tampilan tanpa unduhan ulang.
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        lingkungan = {
+            **os.environ,
+            'SAHAM_PENYEDIA_DATA': 'replay',
+            'SAHAM_DB_PATH': os.path.join(folder, 'uji.db'),
+            'SAHAM_PEMANASAN': '0'
+        }
+        proses = subprocess.run(
+            [sys.executable, '-c', KODE_PERIKSA_APLIKASI],
+            cwd=LOKASI_APP, env=lingkungan, capture_output=True, text=True
+        )
+    if proses.returncode != 0:
+        kesalahan.append(f'aplikasi: gagal dijalankan\n{proses.stderr.strip()[-2000:]}')
+        return
+    hasil = json.loads(proses.stdout.strip().splitlines()[-1])
+    pertama, kedua = hasil['pertama'], hasil['kedua']
+
+    if hasil['galat']:
+        kesalahan.append(f"aplikasi: exception {hasil['galat']}")
+    if not hasil['grafik']:
+        kesalahan.append('aplikasi: grafik harga tidak ditampilkan')
+    if not hasil['baris_tersimpan']:
+        kesalahan.append('aplikasi: tidak ada bar yang disimpan ke database lokal')
+    for jenis, nama in [
+        ('cache', 'penyimpanan'),
+        ('cache', 'data_olahan'),
+        ('tahap', 'unduh'),
+        ('tahap', 'tambah_indikator'),
+        ('tahap', 'buat_grafik'),
+        ('tahap', 'ambil_bersamaan')
+    ]:
+        if nama not in pertama[jenis]:
+            kesalahan.append(f'aplikasi: {jenis} {nama} tidak tercatat')
+    if kedua['tahap'].get('unduh') != pertama['tahap'].get('unduh'):
+        kesalahan.append('aplikasi: mengganti tipe grafik memicu unduhan ulang')
+
+# Kode yang dijalankan di proses baru: satu tugas pemanasan lalu permintaan sesi
+KODE_PERIKSA_PEMANASAN = '''
+import json
+from saham.indikator import PARAMETER_INDIKATOR
+from saham.layanan import ambil_data_olahan
+from saham.metrik import registri_metrik
+from saham.pemanasan import kerjakan_tugas, penjadwal_pemanasan
+
+def hitungan_indikator():
+    tahap = registri_metrik()['tahap'].get('tambah_indikator')
+    return tahap['hitungan'] if tahap else 0
+
+penjadwal = penjadwal_pemanasan()
+penjadwal['interval'] = {'1mo': '1d'}
+kerjakan_tugas(penjadwal, ('AAPL', '1mo'))
+sebelum = hitungan_indikator()
+data = ambil_data_olahan('AAPL', '1mo', '1d', None, list(PARAMETER_INDIKATOR))
+print(json.dumps({
+    'selesai': penjadwal['selesai'],
+    'sebelum': sebelum,
+    'sesudah': hitungan_indikator(),
+    'kolom': all(PARAMETER_INDIKATOR[nama][0] in data.columns for nama in PARAMETER_INDIKATOR)
+}))
+'''
+
+# Memastikan frame yang dipanaskan melayani indikator tanpa menghitung ulang
+def periksa_pemanasan(kesalahan):
+    """
+    Satu tugas pemanasan (kerjakan_tugas) dijalankan di proses baru dengan
+    penyedia replay dan database sementara, lalu sesi meminta semua indikator
+    untuk kunci yang sama: tahap tambah_indikator tidak boleh bertambah.
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        lingkungan = {
+            **os.environ,
+            'SAHAM_PENYEDIA_DATA': 'replay',
+            'SAHAM_DB_PATH': os.path.join(folder, 'uji.db'),
+            'SAHAM_PEMANASAN': '0'
+        }
+        proses = subprocess.run(
+            [sys.executable, '-c', KODE_PERIKSA_PEMANASAN],
+            cwd=LOKASI_APP, env=lingkungan, capture_output=True, text=True
+        )
+    if proses.returncode != 0:
+        kesalahan.append(f'pemanasan: gagal dijalankan\n{proses.stderr.strip()[-2000:]}')
+        return
+    hasil = json.loads(proses.stdout.strip().splitlines()[-1])
+
+    if not hasil['selesai']:
+        kesalahan.append('pemanasan: tugas pemanasan gagal')
+    if not hasil['kolom']:
+        kesalahan.append('pemanasan: frame tidak memuat semua indikator')
+    if hasil['sesudah'] != hasil['sebelum']:
+        kesalahan.append('pemanasan: indikator dihitung ulang untuk frame yang sudah dipanaskan')
+
+# Membuat data mentah sintetis dengan bentuk seperti hasil yf.download
+def buat_data_mentah(jumlah_baris, zona_waktu=False, multiindex=True, simbol='BENCH'):
+    """
+    Parameter:
+        jumlah_baris: jumlah bar
+        zona_waktu: True = index tz-aware (intraday), False = tz-naive (harian)
+        multiindex: True = kolom (Price, Ticker) seperti yfinance terbaru
+    """
+    rng = np.random.default_rng(jumlah_baris)
+    if zona_waktu:
+        waktu = pd.date_range('2000-01-03 09:30', periods=jumlah_baris, freq='min', tz='America/New_York', name='Datetime')
+    else:
+        waktu = pd.date_range('1970-01-01', periods=jumlah_baris, freq='h', name='Date')
+
+    penutupan = 100 * np.exp(np.cumsum(rng.standard_normal(jumlah_baris) * 0.001))
+    pembukaan = penutupan * np.exp(rng.standard_normal(jumlah_baris) * 0.0005)
+    df = pd.DataFrame({
+        'Close': penutupan,
+        'High': np.maximum(pembukaan, penutupan) * 1.001,
+        'Low': np.minimum(pembukaan, penutupan) * 0.999,
+        'Open': pembukaan,
+        'Volume': rng.integers(1_000, 1_000_000, jumlah_baris)
+    }, index=waktu)
+
+    if multiindex:
+        df.columns = pd.MultiIndex.from_product([df.columns, [simbol]], names=['Price', 'Ticker'])
+    return df
+
+# Membuat bar OHLCV sintetis pada waktu tertentu (index UTC seperti baca_data_tersimpan)
+def buat_bar(waktu, benih=0):
+    rng = np.random.default_rng(benih)
+    n = len(waktu)
+    penutupan = 100 * np.exp(np.cumsum(rng.standard_normal(n) * 0.01))
+    pembukaan = penutupan * np.exp(rng.standard_normal(n) * 0.002)
+    return pd.DataFrame({
+        'Open': pembukaan,
+        'High': np.maximum(pembukaan, penutupan) * 1.002,
+        'Low': np.minimum(pembukaan, penutupan) * 0.998,
+        'Close': penutupan,
+        'Volume': rng.integers(1_000, 1_000_000, n)
+    }, index=waktu.tz_convert('UTC'))
+
+# Jadwal bar intraday hari kerja pada jam dinding sebuah zona
+def jadwal_intraday(awal, akhir, zona, buka, tutup, menit=5):
+    hari = pd.bdate_range(awal, akhir)
+    jam = pd.timedelta_range(buka, tutup, freq=f'{menit}min', closed='left')
+    return pd.DatetimeIndex((hari.values[:, None] + jam.values[None, :]).ravel()).tz_localize(zona)
+
+# Acuan resampling dengan pandas, langsung dari jam dinding bursa
+def resampel_acuan(df, interval, zona, menit_buka=9 * 60 + 30, tanggal=None):
+    """
+    Return: (DataFrame OHLCV per bucket, label awal bucket sebagai ns epoch UTC)
+    Bucket harian: Senin / tanggal 1 dari tanggal bursa setiap bar (tanggal).
+    Bucket intraday: kelipatan interval sejak jam buka; jam dinding yang
+    berulang saat DST mundur tetap menjadi bucket terpisah karena bar tidak berurutan.
+    """
+    utc = df.index.as_unit('ns').asi8
+    dinding = df.index.tz_convert(zona).tz_localize(None)
+    hari = dinding.normalize() if tanggal is None else tanggal
+    if interval == '1wk':
+        kunci = hari - pd.to_timedelta(hari.weekday, unit='D')
+    elif interval == '1mo':
+        kunci = hari - pd.to_timedelta(hari.day - 1, unit='D')
+    else:
+        lebar = pd.Timedelta(minutes=int(interval[:-1]))
+        nol = hari + pd.Timedelta(minutes=menit_buka)
+        kunci = nol + (dinding - nol) // lebar * lebar
+    kunci = kunci.as_unit('ns').asi8
+    awal = np.flatnonzero(np.r_[True, kunci[1:] != kunci[:-1]])
+    nomor = np.cumsum(np.r_[True, kunci[1:] != kunci[:-1]])
+    acuan = df.groupby(nomor).agg({'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'})
+    # Label: bar pertama bucket digeser ke awal bucket (harian: jam bar tetap)
+    dasar = hari.as_unit('ns').asi8 if interval in ('1wk', '1mo') else dinding.as_unit('ns').asi8
+    return acuan, utc[awal] - (dasar[awal] - kunci[awal])
+
+# Mencatat ketidaksamaan dua hasil numerik
+def bandingkan(nama, hasil, acuan, kesalahan, rtol=1e-8, atol=1e-8):
+    hasil = np.asarray(hasil, dtype=np.float64)
+    acuan = np.asarray(acuan, dtype=np.float64)
+    if hasil.shape != acuan.shape:
+        kesalahan.append(f'{nama}: bentuk {hasil.shape} != {acuan.shape}')
+    elif not np.allclose(hasil, acuan, rtol=rtol, atol=atol, equal_nan=True):
+        selisih = np.nanmax(np.abs(hasil - acuan))
+        kesalahan.append(f'{nama}: selisih maksimal {selisih:.3g}')
+
+# Kernel indikator NumPy sama dengan library ta, juga versi matriks dan inkremental
+def periksa_indikator(fungsi, kesalahan):
+    import ta
+
+    data = fungsi['olah_data'](buat_data_mentah(5_000))
+    penutupan = data['Penutupan']
+    acuan = {
+        'SMA_20': ta.trend.sma_indicator(penutupan, window=20),
+        'SMA_50': ta.trend.sma_indicator(penutupan, window=50),
+        'EMA_20': ta.trend.ema_indicator(penutupan, window=20),
+        'EMA_50': ta.trend.ema_indicator(penutupan, window=50),
+        'RSI': ta.momentum.rsi(penutupan, window=14)
+    }
+    penuh = fungsi['tambah_indikator'](data.copy(deep=False), SEMUA_INDIKATOR)
+    for kolom, nilai in acuan.items():
+        bandingkan(f'indikator {kolom} vs ta', penuh[kolom], nilai, kesalahan)
+
+    # Lanjutan inkremental dua kali berturut-turut, masing-masing hanya dari bar
+    # setelah bar final status, sama dengan hitung ulang penuh
+    n = len(data)
+    _, status = fungsi['tambah_indikator_inkremental'](data.iloc[:n - 10].copy(deep=False), SEMUA_INDIKATOR)
+    lanjut, status = fungsi['tambah_indikator_inkremental'](data.iloc[n - 11:n - 4].copy(deep=False), (), status)
+    for kolom in acuan:
+        bandingkan(f'indikator {kolom} inkremental', lanjut[kolom], penuh[kolom].iloc[n - 11:n - 4], kesalahan)
+    lanjut, _ = fungsi['tambah_indikator_inkremental'](data.iloc[n - 5:].copy(deep=False), (), status)
+    for kolom in acuan:
+        bandingkan(f'indikator {kolom} inkremental lanjutan', lanjut[kolom], penuh[kolom].iloc[n - 5:], kesalahan)
+
+    # Status yang hanya memuat sebagian indikator: hanya indikator itu yang dilanjutkan
+    _, status = fungsi['tambah_indikator_inkremental'](data.iloc[:n - 10].copy(deep=False), ['SMA 20'])
+    sebagian, _ = fungsi['tambah_indikator_inkremental'](data.iloc[n - 11:].copy(deep=False), SEMUA_INDIKATOR, status)
+    bandingkan('indikator SMA_20 inkremental sebagian', sebagian['SMA_20'], penuh['SMA_20'].iloc[n - 11:], kesalahan)
+    if set(sebagian.columns) & (set(acuan) - {'SMA_20'}):
+        kesalahan.append('indikator inkremental sebagian: indikator di luar status ikut dihitung')
+
+    # Matriks banyak ticker dengan bar pertama berbeda sama dengan per ticker
+    harga = np.column_stack([penutupan.to_numpy(), penutupan.to_numpy()[::-1]])
+    harga[:700, 1] = np.nan
+    matriks = fungsi['hitung_indikator_matriks'](harga, SEMUA_INDIKATOR)
+    for j, awal in enumerate([0, 700]):
+        per_ticker = fungsi['tambah_indikator'](pd.DataFrame({'Penutupan': harga[awal:, j]}), SEMUA_INDIKATOR)
+        for nama in SEMUA_INDIKATOR:
+            kolom = nama.replace(' ', '_')
+            bandingkan(f'indikator {kolom} matriks kolom {j}', matriks[nama][awal:, j], per_ticker[kolom], kesalahan)
+            if np.isfinite(matriks[nama][:awal, j]).any():
+                kesalahan.append(f'indikator {kolom} matriks kolom {j}: ada nilai sebelum bar pertama')
+
+# Kasus resampling: (nama, bar sumber, interval tujuan, interval sumber, zona bursa, menit buka, tanggal bursa)
+def kasus_resampel():
+    """
+    Bar harian dalam dua bentuk dari Yahoo: tengah malam waktu bursa (untuk
+    .JK itu 17:00 UTC hari sebelumnya) dan tanggal bursa tanpa zona yang
+    disimpan sebagai 00:00 UTC. Bar 24 jam (kripto) melewati jam 01:00-02:00
+    yang berulang saat DST mundur.
+    """
+    tanggal_us = pd.bdate_range('2023-10-02', '2024-06-28')
+    tanggal_jk = pd.bdate_range('2024-01-01', '2024-06-28')
+    intraday_us = jadwal_intraday('2024-03-06', '2024-03-13', 'America/New_York', '9h30min', '16h').append(
+        jadwal_intraday('2024-10-30', '2024-11-06', 'America/New_York', '9h30min', '16h')
+    )
+    intraday_jk = jadwal_intraday('2024-01-08', '2024-01-12', 'Asia/Jakarta', '9h', '16h')
+    kripto = pd.date_range('2024-11-02 20:00', '2024-11-03 08:00', freq='5min', tz='UTC').tz_convert('America/New_York')
+    buka_us, buka_jk = 9 * 60 + 30, 9 * 60
+
+    kasus = []
+    for simbol, tanggal, zona, buka, benih in [
+        ('AAPL', tanggal_us, 'America/New_York', buka_us, 1),
+        ('BBCA.JK', tanggal_jk, 'Asia/Jakarta', buka_jk, 2)
+    ]:
+        for bentuk, waktu in [('zona bursa', tanggal.tz_localize(zona)), ('tanpa zona', tanggal.tz_localize('UTC'))]:
+            for interval in ['1wk', '1mo']:
+                kasus.append((f'{simbol} 1d->{interval} {bentuk}', buat_bar(waktu, benih), interval, '1d', zona, buka, tanggal))
+    return kasus + [
+        ('AAPL 5m->30m', buat_bar(intraday_us, 3), '30m', '5m', 'America/New_York', buka_us, None),
+        ('BBCA.JK 5m->30m', buat_bar(intraday_jk, 4), '30m', '5m', 'Asia/Jakarta', buka_jk, None),
+        ('BTC-USD 5m->30m DST mundur', buat_bar(kripto, 5), '30m', '5m', 'America/New_York', buka_us, None)
+    ]
+
+# Resampling lokal (resampel_ohlcv) sama dengan acuan pandas
+def periksa_resampel(fungsi, kesalahan):
+    for nama, df, interval, sumber, zona, menit_buka, tanggal in kasus_resampel():
+        try:
+            hasil = fungsi['resampel_ohlcv'](df, interval, sumber, zona, menit_buka)
+        except Exception as galat:
+            kesalahan.append(f'resampel {nama}: {type(galat).__name__}: {galat}')
+            continue
+        acuan, label = resampel_acuan(df, interval, zona, menit_buka, tanggal)
+        if len(hasil) != len(acuan):
+            kesalahan.append(f'resampel {nama}: {len(hasil)} bucket, acuan {len(acuan)}')
+            continue
+        for kolom in ['Open', 'High', 'Low', 'Close', 'Volume']:
+            bandingkan(f'resampel {nama} {kolom}', hasil[kolom], acuan[kolom], kesalahan)
+        if not np.array_equal(hasil.index.as_unit('ns').asi8, label):
+            kesalahan.append(f'resampel {nama}: label bucket berbeda dari acuan')
+
+# Metrik rentang dari indeks sama dengan hitung_metrik pada potongan frame
+def periksa_rentang(fungsi, kesalahan):
+    data = fungsi['olah_data'](buat_data_mentah(20_000))
+    data['Kurs'] = 15_000 + np.random.default_rng(3).random(len(data)) * 1_000
+    indeks = fungsi['bangun_indeks_rentang'](data, 15_700.0)
+    rng = np.random.default_rng(4)
+    potongan = [(0, len(data)), (5, 6), (63, 65), (64, 128)]
+    potongan += [tuple(sorted(int(i) for i in rng.choice(len(data) + 1, 2, replace=False))) for _ in range(200)]
+    for awal, akhir in potongan:
+        hasil = fungsi['metrik_rentang'](indeks, awal, akhir)
+        acuan = fungsi['hitung_metrik'](data.iloc[awal:akhir], 15_700.0)
+        for kunci, nilai in acuan.items():
+            bandingkan(f'rentang [{awal}:{akhir}] {kunci}', hasil[kunci], nilai, kesalahan, rtol=1e-9)
+
+# Menjalankan semua pemeriksaan kesetaraan
+def periksa_kesetaraan(fungsi):
+    """
+    Penulisan ulang numerik (kernel indikator, resampling lokal, indeks rentang)
+    harus memberi hasil yang sama dengan acuannya sebelum waktunya dibandingkan.
+    Return: daftar pesan ketidaksamaan (kosong = semua sama)
+    """
+    kesalahan = []
+    periksa_indikator(fungsi, kesalahan)
+    periksa_resampel(fungsi, kesalahan)
+    periksa_rentang(fungsi, kesalahan)
+    return kesalahan
+
+# Mengukur satu tahap
+def ukur(fungsi, siapkan, ulang):
+    """
+    Menjalankan fungsi(siapkan()) beberapa kali untuk waktu, lalu sekali lagi
+    dengan tracemalloc untuk memori (tracemalloc memperlambat kode Python)
+    Return: (waktu tercepat dalam detik, memori puncak dalam byte, hasil terakhir)
+    """
+    waktu_terbaik = float('inf')
+    hasil = None
+    for _ in range(ulang):
+        masukan = siapkan()
+        mulai = time.perf_counter()
+        hasil = fungsi(masukan)
+        waktu_terbaik = min(waktu_terbaik, time.perf_counter() - mulai)
+
+    masukan = siapkan()
+    tracemalloc.start()
+    fungsi(masukan)
+    _, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return waktu_terbaik, puncak, hasil
+
+# Menjalankan semua tahap untuk satu ukuran dan satu varian data
+def jalankan_skenario(fungsi, jumlah_baris, zona_waktu, multiindex, ulang):
+    """
+    Return: daftar hasil per tahap
+    """
+    mentah = buat_data_mentah(jumlah_baris, zona_waktu, multiindex)
+    varian = ('tz-aware' if zona_waktu else 'tz-naive') + ('/multiindex' if multiindex else '/datar')
+    hasil = []
+
+    def catat(tahap, durasi, puncak, **tambahan):
+        baris = {
+            'tahap': tahap,
+            'baris': jumlah_baris,
+            'varian': varian,
+            'detik': durasi,
+            'memori_puncak': puncak
+        }
+        baris.update(tambahan)
+        hasil.append(baris)
+
+    # olah_data tidak mengubah masukan, jadi semua ulangan memakai frame yang sama
+    durasi, puncak, data = ukur(fungsi['olah_data'], lambda: mentah, ulang)
+    catat('olah_data', durasi, puncak)
+
+    durasi, puncak, data = ukur(
+        lambda df: fungsi['tambah_indikator'](df, SEMUA_INDIKATOR), lambda: data.copy(deep=False), ulang
+    )
+    catat('tambah_indikator', durasi, puncak, byte_frame=fungsi['ukuran_frame'](data))
+
+    durasi, puncak, ringkas = ukur(fungsi['ringkas_frame'], lambda: data, ulang)
+    catat('ringkas_frame', durasi, puncak, byte_frame=fungsi['ukuran_frame'](ringkas))
+
+    durasi, puncak, _ = ukur(lambda df: fungsi['hitung_metrik'](df, 15700.0), lambda: data, ulang)
+    catat('hitung_metrik', durasi, puncak)
+
+    for tipe_grafik in ['Candlestick', 'Garis']:
+        durasi, puncak, grafik = ukur(
+            lambda df: fungsi['buat_grafik_harga'](df, tipe_grafik, SEMUA_INDIKATOR), lambda: data, ulang
+        )
+        catat(f'buat_grafik_{tipe_grafik.lower()}', durasi, puncak)
+
+        durasi, puncak, json_grafik = ukur(lambda fig: fig.to_json(), lambda: grafik, ulang)
+        catat(f'serialisasi_{tipe_grafik.lower()}', durasi, puncak, byte_payload=len(json_grafik))
+
+    return hasil
+
+# Mengambil commit git saat ini sebagai penanda hasil
+def commit_saat_ini():
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=LOKASI_REPO, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        kotor = subprocess.run(
+            ['git', 'status', '--porcelain', '--', 'App'],
+            cwd=LOKASI_REPO, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        return commit + ('-dirty' if kotor else '')
+    except (OSError, subprocess.CalledProcessError):
+        return 'tanpa-git'
+
+# Menyimpan hasil ke benchmarks/hasil/<commit>.json
+def simpan_hasil(hasil, commit):
+    os.makedirs(LOKASI_HASIL, exist_ok=True)
+    lokasi = os.path.join(LOKASI_HASIL, f'{commit}.json')
+    with open(lokasi, 'w', encoding='utf-8') as f:
+        json.dump({
+            'commit': commit,
+            'waktu': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'hasil': hasil
+        }, f, indent=1)
+    return lokasi
+
+# Membaca hasil tersimpan terbaru selain commit saat ini
+def baca_hasil_sebelumnya(commit):
+    if not os.path.isdir(LOKASI_HASIL):
+        return None
+    kandidat = [
+        os.path.join(LOKASI_HASIL, nama)
+        for nama in os.listdir(LOKASI_HASIL)
+        if nama.endswith('.json') and nama != f'{commit}.json'
+    ]
+    if not kandidat:
+        return None
+    with open(max(kandidat, key=os.path.getmtime), encoding='utf-8') as f:
+        return json.load(f)
+
+# Menampilkan tabel hasil (dan perbandingan jika ada)
+def tampilkan(hasil, pembanding=None):
+    tabel = pd.DataFrame(hasil)
+    tabel['ms'] = tabel['detik'] * 1000
+    tabel['memori_MB'] = tabel['memori_puncak'] / 2**20
+    kolom = ['tahap', 'varian', 'baris', 'ms', 'memori_MB']
+    for tambahan in ['byte_frame', 'byte_payload', 'modul_berat']:
+        if tambahan in tabel:
+            kolom.append(tambahan)
+
+    if pembanding is not None:
+        lama = pd.DataFrame(pembanding['hasil'])
+        lama['ms_lama'] = lama['detik'] * 1000
+        tabel = tabel.merge(lama[['tahap', 'varian', 'baris', 'ms_lama']], on=['tahap', 'varian', 'baris'], how='left')
+        tabel['rasio'] = tabel['ms'] / tabel['ms_lama']
+        kolom += ['ms_lama', 'rasio']
+        print(f"Dibandingkan dengan commit {pembanding['commit']} ({pembanding['waktu']})")
+
+    with pd.option_context('display.max_rows', None, 'display.width', 160, 'display.float_format', '{:,.2f}'.format):
+        print(tabel[kolom].to_string(index=False))
+
+# Titik masuk: periksa kesetaraan, lalu ukur setiap tahap
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pipeline data dashboard saham')
+    parser.add_argument('--ukuran', type=int, nargs='+', default=UKURAN_AWAL, help='jumlah baris yang diuji')
+    parser.add_argument('--ulang', type=int, default=3, help='jumlah ulangan per tahap (diambil yang tercepat)')
+    parser.add_argument('--tanpa-simpan', action='store_true', help='jangan simpan hasil ke benchmarks/hasil/')
+    parser.add_argument('--tanpa-impor', action='store_true', help='lewati pengukuran waktu impor modul')
+    parser.add_argument('--bandingkan', action='store_true', help='bandingkan dengan hasil tersimpan terakhir')
+    parser.add_argument('--hanya-periksa', action='store_true', help='hanya jalankan pemeriksaan kesetaraan')
+    parser.add_argument('--periksa-aplikasi', action='store_true', help='periksa juga App/app.py lewat AppTest dan pemanasan')
+    args = parser.parse_args()
+
+    # Hasil yang berbeda dari acuan membuat perbandingan waktu tidak berarti
+    fungsi = muat_fungsi_dashboard()
+    kesalahan = periksa_kesetaraan(fungsi)
+    if args.periksa_aplikasi:
+        periksa_aplikasi(kesalahan)
+        periksa_pemanasan(kesalahan)
+    if kesalahan:
+        print('Pemeriksaan kesetaraan gagal:')
+        print('\n'.join(f'  - {pesan}' for pesan in kesalahan))
+        sys.exit(1)
+    print('Pemeriksaan kesetaraan: indikator, resampling dan indeks rentang sama dengan acuan')
+    if args.periksa_aplikasi:
+        print('Pemeriksaan aplikasi: App/app.py memakai database lokal, layanan bersama, unduhan bersamaan dan frame pemanasan')
+    if args.hanya_periksa:
+        return
+
+    hasil = [] if args.tanpa_impor else ukur_impor(args.ulang)
+    for jumlah_baris in args.ukuran:
+        for zona_waktu in [False, True]:
+            for multiindex in [True, False]:
+                hasil.extend(jalankan_skenario(fungsi, jumlah_baris, zona_waktu, multiindex, args.ulang))
+
+    commit = commit_saat_ini()
+    pembanding = baca_hasil_sebelumnya(commit) if args.bandingkan else None
+    tampilkan(hasil, pembanding)
+
+    if not args.tanpa_simpan:
+        print(f'\nHasil disimpan ke {simpan_hasil(hasil, commit)}')
+
+if __name__ == '__main__':
+    main()